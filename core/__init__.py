@@ -1,29 +1,56 @@
-"""
-核心模块初始化文件
-"""
-
-from .analyzer import WebAnalyzer
-from .cache import CacheManager
-from .config_loader import ConfigLoader
-from .constants import *
-from .error_handler import ERROR_MESSAGES, ErrorSeverity, ErrorType
-from .llm_analyzer import LLMAnalyzer
-from .message_handler import MessageHandler
-from .plugin_helpers import MessageHelpers, PluginHelpers
-from .result_formatter import ResultFormatter
-from .utils import WebAnalyzerUtils
-
-__all__ = [
-    "WebAnalyzer",
-    "CacheManager",
-    "ConfigLoader",
-    "ErrorType",
-    "ErrorSeverity",
-    "ERROR_MESSAGES",
-    "LLMAnalyzer",
-    "MessageHandler",
-    "PluginHelpers",
-    "MessageHelpers",
-    "ResultFormatter",
-    "WebAnalyzerUtils",
-]
+"""
+核心模块初始化文件
+
+子模块按需懒加载（PEP 562），避免导入 core 包时连带加载
+httpx、BeautifulSoup、Playwright 等重量级依赖。
+"""
+
+import importlib
+
+# 常量模块无第三方依赖，直接导入（ErrorInfo、ErrorType、ErrorSeverity、ERROR_MESSAGES）
+from .constants import *  # noqa: F403
+
+# 导出名称到所在子模块的映射
+_LAZY_IMPORTS = {
+    "WebAnalyzer": ".analyzer",
+    "CacheManager": ".cache",
+    "ConfigLoader": ".config_loader",
+    "LLMAnalyzer": ".llm_analyzer",
+    "MessageHandler": ".message_handler",
+    "PluginHelpers": ".plugin_helpers",
+    "MessageHelpers": ".plugin_helpers",
+    "ResultFormatter": ".result_formatter",
+    "WebAnalyzerUtils": ".utils",
+}
+
+__all__ = [
+    "WebAnalyzer",
+    "CacheManager",
+    "ConfigLoader",
+    "ErrorInfo",
+    "ErrorType",
+    "ErrorSeverity",
+    "ERROR_MESSAGES",
+    "LLMAnalyzer",
+    "MessageHandler",
+    "PluginHelpers",
+    "MessageHelpers",
+    "ResultFormatter",
+    "WebAnalyzerUtils",
+]
+
+
+def __getattr__(name: str):
+    """首次访问导出名称时再导入对应子模块"""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_path, __name__)
+    value = getattr(module, name)
+    # 缓存到模块全局，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
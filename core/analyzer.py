@@ -27,6 +27,11 @@ from astrbot.api import logger
 
 from .utils import WebAnalyzerUtils
 
+# 长期复用的 HTTP 连接池参数：空闲连接保留更久，便于连续请求复用 TCP/TLS 连接
+_HTTP_MAX_CONNECTIONS = 100
+_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+_HTTP_KEEPALIVE_EXPIRY_S = 30.0
+
 
 # 自定义异常类
 class WebAnalyzerException(Exception):
@@ -138,6 +143,8 @@ class WebAnalyzer:
         self._sandbox_disabled = self._resolve_sandbox_disabled()
         self.client = None
         self.browser = None
+        # 上下文嵌套深度：只在最外层退出时归还浏览器实例
+        self._context_depth = 0
         # 内存监控相关
         self.enable_memory_monitor = enable_memory_monitor
         self.memory_threshold = memory_threshold
@@ -385,34 +392,57 @@ class WebAnalyzer:
             logger.error(f"释放内存资源失败: {e}")
             # 增强容错机制，确保内存释放失败不会影响插件正常运行
 
-    async def __aenter__(self):
-        """异步上下文管理器入口
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """获取长期复用的异步HTTP客户端，不存在或已关闭时创建
 
-        初始化异步HTTP客户端，配置：
+        客户端配置：
         - 请求超时时间
         - 代理设置（如果提供）
-        - 其他HTTP客户端参数
+        - 连接池上限与 keep-alive 过期时间
 
         Returns:
-            返回WebAnalyzer实例自身，用于上下文管理
+            异步HTTP客户端
         """
-        # 配置客户端参数
-        client_params = {
-            "timeout": self.timeout,
-        }
+        if self.client is None or self.client.is_closed:
+            # 配置客户端参数
+            client_params = {
+                "timeout": self.timeout,
+                "limits": httpx.Limits(
+                    max_connections=_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY_S,
+                ),
+            }
+
+            # 添加代理配置（如果有）
+            if self.proxy:
+                client_params["proxy"] = self.proxy
 
-        # 添加代理配置（如果有）
-        if self.proxy:
-            client_params["proxy"] = self.proxy
+            self.client = httpx.AsyncClient(**client_params)
+        return self.client
+
+    async def close(self):
+        """关闭异步HTTP客户端，插件卸载时调用"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
 
-        self.client = httpx.AsyncClient(**client_params)
+    async def __aenter__(self):
+        """异步上下文管理器入口
+
+        确保长期复用的异步HTTP客户端可用，各次请求共享同一个连接池。
+
+        Returns:
+            返回WebAnalyzer实例自身，用于上下文管理
+        """
+        self._ensure_client()
+        self._context_depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """异步上下文管理器出口
 
         清理资源，确保：
-        - 异步HTTP客户端正确关闭
         - 浏览器实例正确处理（放回池中或关闭）
         - 资源泄漏的防止
 
@@ -421,9 +451,12 @@ class WebAnalyzer:
             exc_val: 异常值（如果有）
             exc_tb: 异常回溯（如果有）
         """
-        if self.client:
-            await self.client.aclose()
+        self._context_depth -= 1
+        # 仍有外层上下文在使用时不释放资源
+        if self._context_depth > 0:
+            return
 
+        # HTTP 客户端在插件生命周期内复用，由 close() 统一关闭
         if self.browser:
             try:
                 # 将浏览器实例放回池中，以便复用
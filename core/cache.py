@@ -154,6 +154,17 @@ class CacheManager:
             return os.path.join(self.cache_dir, f"{url_hash}_screenshot.bin")
         return os.path.join(self.cache_dir, f"{url_hash}.json")
 
+    def get_screenshot_file_path(self, url: str) -> str:
+        """获取指定缓存键对应的截图文件路径
+
+        Args:
+            url: 缓存键（规范化后的 URL）
+
+        Returns:
+            截图文件路径（文件不一定存在）
+        """
+        return self._get_cache_file_path(url, "screenshot")
+
     def _load_cache_from_disk(self):
         """从磁盘加载缓存到内存
 
@@ -5,9 +5,17 @@
 这些方法将作为混入类被主插件类继承，保持对 self 的完整访问。
 """
 
+import asyncio
 import json
 import os
 import time
+from collections import ChainMap
+from urllib.parse import urlparse
+
+try:
+    import orjson  # 可选依赖，安装后用于加速 JSON 导出
+except ImportError:
+    orjson = None
 
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent, filter
@@ -17,17 +25,8 @@ from .plugin_helpers import PluginHelpers
 from .utils import WebAnalyzerUtils
 
 
-class CommandMixin:
-    """命令处理器混入类
-
-    包含所有的插件命令处理方法，通过继承的方式混入主插件类。
-    这样可以保持对主类实例属性的完整访问。
-    """
-
-    @filter.command("web_help", alias={"网页分析帮助", "网页分析命令"})
-    async def show_help(self, event: AstrMessageEvent):
-        """显示插件的所有可用命令和帮助信息"""
-        help_text = """【网页分析插件命令帮助】
+# 命令帮助文本（静态内容，模块加载时构建一次）
+_HELP_TEXT = """【网页分析插件命令帮助】
 
 📋 核心分析命令
 🔍 /网页分析 <URL1> <URL2>... - 手动分析指定网页链接
@@ -90,16 +89,214 @@ class CommandMixin:
 - 可以调整分析结果模板和显示方式
 """
 
-        yield event.plain_result(help_text)
+# 群聊黑名单修改后延迟写盘的时间（秒），期间的修改合并为一次保存
+_BLACKLIST_FLUSH_DELAY_S = 1.0
+
+# 默认翻译提示词前缀模板，按目标语言填充一次后与待翻译内容直接拼接
+_TRANSLATION_PROMPT_PREFIX = (
+    "请将以下内容翻译成{target_language}语言，保持原文意思不变，语言流畅自然：\n\n"
+)
+
+# 导出文件名中域名的字符替换表（点号与端口冒号替换为下划线）
+_DOMAIN_TRANS = str.maketrans({".": "_", ":": "_"})
+
+# 分析模式与导出格式：元组保持展示顺序，frozenset 用于 O(1) 校验
+_VALID_MODES_DISPLAY = ("auto", "manual", "hybrid", "LLMTOOL")
+_VALID_MODES = frozenset(_VALID_MODES_DISPLAY)
+_SUPPORTED_FORMATS_DISPLAY = ("md", "markdown", "json", "txt")
+_SUPPORTED_FORMATS = frozenset(_SUPPORTED_FORMATS_DISPLAY)
+
+# 命令处理中复用的提示文本
+_MSG_BLACKLIST_EMPTY = "当前群聊黑名单为空"
+_MSG_BLACKLIST_ALREADY_EMPTY = "黑名单已为空"
+_MSG_NO_CACHED_RESULTS = "当前没有缓存的分析结果"
+_MSG_INVALID_URL = "无效的URL链接"
+_MSG_EXPORT_USAGE = "请提供要导出的URL链接和格式，例如：/web_export https://example.com md 或 /web_export all json"
+
+# 配置信息展示的固定头尾
+_CONFIG_TEXT_HEADER = "**网页分析插件配置信息**\n\n**基本设置**\n"
+_CONFIG_TEXT_FOOTER = "*提示: 如需修改配置，请在AstrBot管理面板中编辑插件配置*"
+
+
+def _write_export_file(
+    file_path: str,
+    format_type: str,
+    export_results: list[tuple[str, dict]],
+    timestamp: int,
+) -> None:
+    """生成导出内容并写入文件
+
+    包含内容拼接和文件写入等阻塞操作，需通过 asyncio.to_thread 调用。
+    导出目录在插件启动时已创建。
+
+    Args:
+        file_path: 导出文件路径
+        format_type: 导出格式（小写：md、markdown、json、txt）
+        export_results: 导出数据列表，元素为 (URL, 分析结果字典)
+        timestamp: 导出时间戳
+    """
+    if format_type in ["md", "markdown"]:
+        # 生成Markdown格式内容
+        # 先收集片段再一次性拼接，避免循环中 += 造成的重复拷贝
+        parts: list[str] = [
+            "# 网页分析结果导出\n\n",
+            f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n\n",
+            f"共 {len(export_results)} 个分析结果\n\n",
+            "---\n\n",
+        ]
+
+        for i, (url, result_data) in enumerate(export_results, 1):
+            parts.append(f"## {i}. {url}\n\n")
+            parts.append(result_data["result"])
+            parts.append("\n\n---\n\n")
+
+        # 写入文件（逐段写出，不再额外拼接一份完整字符串）
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.writelines(parts)
+
+    elif format_type == "json":
+        # 生成JSON格式内容
+        json_data = {
+            "export_time": timestamp,
+            "export_time_str": time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(timestamp)
+            ),
+            "total_results": len(export_results),
+            "results": [],
+        }
+
+        for url, result_data in export_results:
+            json_data["results"].append(
+                {
+                    "url": url,
+                    "analysis_result": result_data["result"],
+                    "has_screenshot": result_data["screenshot"] is not None,
+                }
+            )
+
+        # 写入文件（优先使用 orjson，直接输出 UTF-8 字节）
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(json_data, f, ensure_ascii=False, indent=2)
+
+    elif format_type == "txt":
+        # 生成纯文本格式内容
+        parts = [
+            "网页分析结果导出\n",
+            f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n",
+            f"共 {len(export_results)} 个分析结果\n",
+            "=" * 50 + "\n\n",
+        ]
+
+        for i, (url, result_data) in enumerate(export_results, 1):
+            parts.append(f"{i}. {url}\n")
+            parts.append("-" * 30 + "\n")
+            parts.append(result_data["result"])
+            parts.append("\n\n" + "=" * 50 + "\n\n")
+
+        # 写入文件（逐段写出，不再额外拼接一份完整字符串）
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.writelines(parts)
+
+
+def _fmt_image(img: dict) -> str:
+    img_url = img.get("url", "")
+    alt_text = img.get("alt", "")
+    if alt_text:
+        return f"- {img_url} (alt: {alt_text})\n"
+    return f"- {img_url}\n"
+
+
+def _fmt_link(link: dict) -> str:
+    return f"- [{link['text']}]({link['url']})\n"
+
+
+def _fmt_video(video: dict) -> str:
+    return f"- {video.get('url', '')} (type: {video.get('type', 'video')})\n"
+
+
+def _fmt_audio(audio) -> str:
+    return f"- {audio}\n"
+
+
+def _fmt_quote(quote: dict) -> str:
+    quote_text = quote.get("text", "")
+    author = quote.get("author", "")
+    if author:
+        return f"> {quote_text} — {author}\n\n"
+    return f"> {quote_text}\n\n"
+
+
+def _fmt_heading(heading: dict) -> str:
+    level = heading.get("level", 1)
+    text = heading.get("text", "")
+    heading_id = heading.get("id", "")
+    indent = "  " * (level - 1)
+    if heading_id:
+        return f"{indent}#{level} {text} (id: {heading_id})\n"
+    return f"{indent}#{level} {text}\n"
+
+
+def _fmt_code_block(code_block: dict) -> str:
+    code = code_block.get("code", "")
+    language = code_block.get("language", "")
+    return f"``` {language}\n{code}\n```\n"
+
+
+def _fmt_table(table: dict) -> str:
+    headers = table.get("headers", [])
+    lines = ["\n表格:\n"]
+    if headers:
+        lines.append(f"| {' | '.join(headers)} |\n")
+        lines.append(f"| {' | '.join(['---' for _ in headers])} |\n")
+    lines.extend(f"| {' | '.join(row)} |\n" for row in table.get("rows", []))
+    return "".join(lines)
+
+
+def _fmt_list(list_item: dict) -> str:
+    list_type = list_item.get("type", "ul")
+    marker = "1." if list_type == "ol" else "-"
+    lines = [f"\n列表 ({list_type}):\n"]
+    lines.extend(f"{marker} {item}\n" for item in list_item.get("items", []))
+    return "".join(lines)
+
+
+# 特定内容区块定义：(键, 标题, 单项格式化函数, 最多展示条数，None 表示不限)
+_SPECIFIC_CONTENT_SECTIONS = (
+    ("images", "📷 图片链接", _fmt_image, 20),
+    ("links", "🔗 相关链接", _fmt_link, 5),
+    ("videos", "🎬 视频链接", _fmt_video, None),
+    ("audios", "🎵 音频链接", _fmt_audio, None),
+    ("quotes", "💬 引用块", _fmt_quote, 3),
+    ("headings", "📑 标题列表", _fmt_heading, None),
+    ("code_blocks", "💻 代码块", _fmt_code_block, 2),
+    ("tables", "📊 表格", _fmt_table, 2),
+    ("lists", "📋 列表", _fmt_list, 2),
+)
+
+
+class CommandMixin:
+    """命令处理器混入类
+
+    包含所有的插件命令处理方法，通过继承的方式混入主插件类。
+    这样可以保持对主类实例属性的完整访问。
+    """
+
+    @filter.command("web_help", alias={"网页分析帮助", "网页分析命令"})
+    async def show_help(self, event: AstrMessageEvent):
+        """显示插件的所有可用命令和帮助信息"""
+        yield event.plain_result(_HELP_TEXT)
         logger.info("显示命令帮助信息")
 
     @filter.command("web_config", alias={"网页分析配置", "网页分析设置"})
     async def show_config(self, event: AstrMessageEvent):
         """显示当前插件的详细配置信息"""
-        config_info = f"""**网页分析插件配置信息**
-
-**基本设置**
-- 最大内容长度: {self.max_content_length} 字符
+        # 配置文本只在配置变更时失效，其余时间直接复用
+        if self._config_text_cache is None:
+            self._config_text_cache = f"""{_CONFIG_TEXT_HEADER}- 最大内容长度: {self.max_content_length} 字符
 - 请求超时时间: {self.request_timeout_s} 秒
 - LLM智能分析: {"✅ 已启用" if self.llm_enabled else "❌ 已禁用"}
 - 分析模式: {self.analysis_mode}
@@ -132,9 +329,9 @@ class CommandMixin:
 - 缓存过期时间: {self.cache_expire_time_min} 分钟
 - 最大缓存数量: {self.max_cache_size} 个
 
-*提示: 如需修改配置，请在AstrBot管理面板中编辑插件配置*"""
+{_CONFIG_TEXT_FOOTER}"""
 
-        yield event.plain_result(config_info)
+        yield event.plain_result(self._config_text_cache)
 
     @filter.command("test_merge", alias={"测试合并转发", "测试转发"})
     async def test_merge_forward(self, event: AstrMessageEvent):
@@ -182,16 +379,16 @@ class CommandMixin:
     async def manage_group_blacklist(self, event: AstrMessageEvent):
         """管理群聊黑名单"""
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=3)
 
         # 如果没有参数，显示当前黑名单列表
         if len(message_parts) <= 1:
             if not self.group_blacklist:
-                yield event.plain_result("当前群聊黑名单为空")
+                yield event.plain_result(_MSG_BLACKLIST_EMPTY)
                 return
 
             blacklist_info = "**当前群聊黑名单**\n\n"
-            for i, group_id in enumerate(self.group_blacklist, 1):
+            for i, group_id in enumerate(sorted(self.group_blacklist), 1):
                 blacklist_info += f"{i}. {group_id}\n"
 
             blacklist_info += "\n使用 `/group_blacklist add <群号>` 添加群聊到黑名单"
@@ -202,7 +399,7 @@ class CommandMixin:
             return
 
         # 解析操作类型和参数
-        action = message_parts[1].lower() if len(message_parts) > 1 else ""
+        action = message_parts[1].lower()
         group_id = message_parts[2] if len(message_parts) > 2 else ""
 
         # 添加群聊到黑名单
@@ -211,7 +408,7 @@ class CommandMixin:
                 yield event.plain_result(f"群聊 {group_id} 已在黑名单中")
                 return
 
-            self.group_blacklist.append(group_id)
+            self.group_blacklist.add(group_id)
             self._save_group_blacklist()
             yield event.plain_result(f"✅ 已添加群聊 {group_id} 到黑名单")
 
@@ -221,14 +418,14 @@ class CommandMixin:
                 yield event.plain_result(f"群聊 {group_id} 不在黑名单中")
                 return
 
-            self.group_blacklist.remove(group_id)
+            self.group_blacklist.discard(group_id)
             self._save_group_blacklist()
             yield event.plain_result(f"✅ 已从黑名单移除群聊 {group_id}")
 
         # 清空黑名单
         elif action == "clear":
             if not self.group_blacklist:
-                yield event.plain_result("黑名单已为空")
+                yield event.plain_result(_MSG_BLACKLIST_ALREADY_EMPTY)
                 return
 
             self.group_blacklist.clear()
@@ -242,26 +439,83 @@ class CommandMixin:
             )
 
     def _save_group_blacklist(self):
-        """保存群聊黑名单到配置文件"""
+        """标记群聊黑名单待保存，由后台任务合并写入配置文件
+
+        连续的多次修改只会触发一次写盘，避免在事件循环上同步刷新整个配置。
+        """
+        self._blacklist_dirty = True
+        self._config_text_cache = None
+        if self._blacklist_flush_task is None or self._blacklist_flush_task.done():
+            try:
+                self._blacklist_flush_task = asyncio.create_task(
+                    self._delayed_flush_group_blacklist()
+                )
+            except RuntimeError:
+                # 没有运行的事件循环，直接同步保存
+                self._blacklist_dirty = False
+                try:
+                    self._write_group_blacklist_config()
+                    self.config.save_config()
+                except Exception as e:
+                    logger.error(f"保存群聊黑名单失败: {e}")
+
+    async def _delayed_flush_group_blacklist(self):
+        """等待修改平息后保存群聊黑名单，写盘期间的新修改会触发下一轮保存"""
+        while self._blacklist_dirty:
+            await asyncio.sleep(_BLACKLIST_FLUSH_DELAY_S)
+            self._blacklist_dirty = False
+            try:
+                # 在事件循环中写回配置对象，序列化与写盘放到线程中执行
+                self._write_group_blacklist_config()
+                await asyncio.to_thread(self.config.save_config)
+            except Exception as e:
+                logger.error(f"保存群聊黑名单失败: {e}")
+
+    def _write_group_blacklist_config(self):
+        """将当前群聊黑名单写回配置对象（不落盘）
+
+        插件配置是群聊黑名单的唯一数据源，AstrBot 配置面板中的修改同样生效。
+        """
+        # 将群聊列表转换为文本格式，每行一个群聊ID
+        group_settings = self.config.get("group_settings", {})
+        group_settings["group_blacklist"] = "\n".join(sorted(self.group_blacklist))
+        self.config["group_settings"] = group_settings
+
+    async def _run_coalesced(self, url: str, factory) -> dict | None:
+        """合并同一URL的并发分析请求
+
+        若该URL已有进行中的分析，则等待其结果而不重复抓取和调用LLM；
+        进行中的分析失败（返回 None 或抛出异常）时，等待者会自行重新分析。
+
+        Args:
+            url: 网页URL
+            factory: 无参协程函数，返回分析结果字典或 None
+
+        Returns:
+            分析结果字典，失败时为 None
+        """
+        while (fut := self._inflight_analyses.get(url)) is not None:
+            # shield 避免某个等待者被取消时连带取消共享的 Future
+            result = await asyncio.shield(fut)
+            if result is not None:
+                return result
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight_analyses[url] = fut
+        result = None
         try:
-            # 将群聊列表转换为文本格式，每行一个群聊ID
-            group_text = "\n".join(self.group_blacklist)
-            # 获取当前group_settings配置
-            group_settings = self.config.get("group_settings", {})
-            # 更新group_blacklist
-            group_settings["group_blacklist"] = group_text
-            # 更新配置并保存到文件
-            self.config["group_settings"] = group_settings
-            self.config.save_config()
-        except Exception as e:
-            logger.error(f"保存群聊黑名单失败: {e}")
+            result = await factory()
+            return result
+        finally:
+            fut.set_result(result)
+            self._inflight_analyses.pop(url, None)
 
     @filter.permission_type(filter.PermissionType.ADMIN)
     @filter.command("web_cache", alias={"网页缓存", "清理缓存"})
     async def manage_cache(self, event: AstrMessageEvent):
         """管理插件的网页分析结果缓存"""
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=2)
 
         # 如果没有参数，显示当前缓存状态
         if len(message_parts) <= 1:
@@ -282,7 +536,7 @@ class CommandMixin:
             return
 
         # 解析操作类型
-        action = message_parts[1].lower() if len(message_parts) > 1 else ""
+        action = message_parts[1].lower()
 
         # 清空缓存操作
         if action == "clear":
@@ -302,7 +556,7 @@ class CommandMixin:
     async def manage_analysis_mode(self, event: AstrMessageEvent):
         """管理插件的网页分析模式"""
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=2)
 
         # 如果没有参数，显示当前模式
         if len(message_parts) <= 1:
@@ -323,17 +577,19 @@ class CommandMixin:
             return
 
         # 解析模式参数
-        mode = message_parts[1].lower() if len(message_parts) > 1 else ""
-        valid_modes = ["auto", "manual", "hybrid", "LLMTOOL"]
+        mode = message_parts[1].lower()
 
         # 验证模式是否有效
-        if mode not in valid_modes:
-            yield event.plain_result(f"无效的模式，请使用: {', '.join(valid_modes)}")
+        if mode not in _VALID_MODES:
+            yield event.plain_result(
+                f"无效的模式，请使用: {', '.join(_VALID_MODES_DISPLAY)}"
+            )
             return
 
         # 更新分析模式
         self.analysis_mode = mode
         self.auto_analyze = mode == "auto"
+        self._config_text_cache = None
 
         yield event.plain_result(f"✅ 已切换到 {mode} 模式")
 
@@ -341,13 +597,11 @@ class CommandMixin:
     async def export_analysis_result(self, event: AstrMessageEvent):
         """导出网页分析结果"""
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=3)
 
         # 检查参数是否足够
         if len(message_parts) < 2:
-            yield event.plain_result(
-                "请提供要导出的URL链接和格式，例如：/web_export https://example.com md 或 /web_export all json"
-            )
+            yield event.plain_result(_MSG_EXPORT_USAGE)
             return
 
         # 获取导出范围和格式
@@ -355,106 +609,112 @@ class CommandMixin:
         format_type = message_parts[2] if len(message_parts) > 2 else "md"
 
         # 验证格式类型是否支持
-        supported_formats = ["md", "markdown", "json", "txt"]
-        if format_type.lower() not in supported_formats:
+        if format_type.lower() not in _SUPPORTED_FORMATS:
             yield event.plain_result(
-                f"不支持的格式类型，请使用：{', '.join(supported_formats)}"
+                f"不支持的格式类型，请使用：{', '.join(_SUPPORTED_FORMATS_DISPLAY)}"
             )
             return
 
-        # 准备导出数据
-        export_results = []
+        # 准备导出数据：(URL, 分析结果字典) 列表
+        export_results: list[tuple[str, dict]] = []
 
         if url_or_all.lower() == "all":
             # 导出所有缓存的分析结果
             if not self.cache_manager.memory_cache:
-                yield event.plain_result("当前没有缓存的分析结果")
+                yield event.plain_result(_MSG_NO_CACHED_RESULTS)
                 return
 
-            for url, cache_data in self.cache_manager.memory_cache.items():
-                export_results.append({"url": url, "result": cache_data["result"]})
+            # 在事件循环中一次性取快照（仅保存引用，不构造中间字典），
+            # 写文件线程中不再访问可能被并发修改的缓存字典
+            export_results = [
+                (url, cache_data["result"])
+                for url, cache_data in self.cache_manager.memory_cache.items()
+            ]
         else:
             # 导出指定URL的分析结果
             url = url_or_all
 
             # 检查URL格式是否有效
             if not self.analyzer.is_valid_url(url):
-                yield event.plain_result("无效的URL链接")
+                yield event.plain_result(_MSG_INVALID_URL)
                 return
 
             # 检查缓存中是否已有该URL的分析结果
             cached_result = self.message_handler.check_cache(url)
             if cached_result:
-                export_results.append({"url": url, "result": cached_result})
+                export_results.append((url, cached_result))
             else:
                 # 如果缓存中没有，先进行分析
                 yield event.plain_result("缓存中没有该URL的分析结果，正在进行分析...")
 
-                # 抓取并分析网页
-                async with self.analyzer as analyzer:
-                    html = await analyzer.fetch_webpage(url)
-                    if not html:
-                        yield event.plain_result(f"无法抓取网页内容: {url}")
-                        return
-
-                    content_data = analyzer.extract_content(html, url)
-                    if not content_data:
-                        yield event.plain_result(f"无法解析网页内容: {url}")
-                        return
-
-                    # 调用LLM进行分析
-                    if self.enable_translation:
-                        translated_content = await self._translate_content(
-                            event, content_data["content"]
-                        )
-                        translated_content_data = content_data.copy()
-                        translated_content_data["content"] = translated_content
-                        analysis_result = await self.llm_analyzer.analyze_with_llm(
-                            event, translated_content_data
-                        )
-                    else:
-                        analysis_result = await self.llm_analyzer.analyze_with_llm(
-                            event, content_data
-                        )
-
-                    # 提取特定内容（如果启用）
-                    if self.enable_specific_extraction:
-                        specific_content = analyzer.extract_specific_content(
-                            html, url, self.extract_types
-                        )
-                        if specific_content:
-                            # 在分析结果中添加特定内容
-                            analysis_result = self._add_specific_content_to_result(
-                                analysis_result, specific_content
+                # 抓取并分析网页（同一URL的并发分析会被合并）
+                error_msg = None
+
+                async def _analyze() -> dict | None:
+                    nonlocal error_msg
+                    async with self.analyzer as analyzer:
+                        html = await analyzer.fetch_webpage(url)
+                        if not html:
+                            error_msg = f"无法抓取网页内容: {url}"
+                            return None
+
+                        content_data = analyzer.extract_content(html, url)
+                        if not content_data:
+                            error_msg = f"无法解析网页内容: {url}"
+                            return None
+
+                        # 调用LLM进行分析
+                        if self.enable_translation:
+                            translated_content = await self._translate_content(
+                                event, content_data["content"]
+                            )
+                            # 只读使用，ChainMap 覆盖 content 字段，无需复制整个字典
+                            translated_content_data = ChainMap(
+                                {"content": translated_content}, content_data
+                            )
+                            analysis_result = await self.llm_analyzer.analyze_with_llm(
+                                event, translated_content_data
+                            )
+                        else:
+                            analysis_result = await self.llm_analyzer.analyze_with_llm(
+                                event, content_data
                             )
 
-                    # 准备导出数据
-                    export_results.append(
-                        {
+                        # 提取特定内容（如果启用）
+                        if self.enable_specific_extraction:
+                            specific_content = analyzer.extract_specific_content(
+                                html, url, self.extract_types
+                            )
+                            if specific_content:
+                                # 在分析结果中添加特定内容
+                                analysis_result = self._add_specific_content_to_result(
+                                    analysis_result, specific_content
+                                )
+
+                        return {
                             "url": url,
-                            "result": {
-                                "url": url,
-                                "result": analysis_result,
-                                "screenshot": None,
-                            },
+                            "result": analysis_result,
+                            "screenshot": None,
+                            "has_screenshot": False,
                         }
-                    )
+
+                result_data = await self._run_coalesced(url, _analyze)
+                if result_data is None:
+                    yield event.plain_result(error_msg)
+                    return
+
+                # 准备导出数据
+                export_results.append((url, result_data))
 
         # 执行导出操作
         try:
-            # 创建data目录（如果不存在）
-            data_dir = os.path.join(os.path.dirname(__file__), "data")
-            os.makedirs(data_dir, exist_ok=True)
-
             # 生成文件名
             timestamp = int(time.time())
             if len(export_results) == 1:
                 # 单个URL导出，使用域名作为文件名的一部分
-                url_obj = export_results[0]["url"]
-                from urllib.parse import urlparse
-
+                url_obj = export_results[0][0]
                 parsed = urlparse(url_obj)
-                domain = parsed.netloc.replace(".", "_")
+                domain = parsed.netloc.translate(_DOMAIN_TRANS)
                 filename = f"web_analysis_{domain}_{timestamp}"
             else:
                 # 多个URL导出
@@ -465,75 +725,16 @@ class CommandMixin:
             if file_extension == "markdown":
                 file_extension = "md"
 
-            file_path = os.path.join(data_dir, f"{filename}.{file_extension}")
-
-            if format_type.lower() in ["md", "markdown"]:
-                # 生成Markdown格式内容
-                md_content = "# 网页分析结果导出\n\n"
-                md_content += f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n\n"
-                md_content += f"共 {len(export_results)} 个分析结果\n\n"
-                md_content += "---\n\n"
-
-                for i, export_item in enumerate(export_results, 1):
-                    url = export_item["url"]
-                    result_data = export_item["result"]
-
-                    md_content += f"## {i}. {url}\n\n"
-                    md_content += result_data["result"]
-                    md_content += "\n\n"
-                    md_content += "---\n\n"
-
-                # 写入文件
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(md_content)
-
-            elif format_type.lower() == "json":
-                # 生成JSON格式内容
-                json_data = {
-                    "export_time": timestamp,
-                    "export_time_str": time.strftime(
-                        "%Y-%m-%d %H:%M:%S", time.localtime(timestamp)
-                    ),
-                    "total_results": len(export_results),
-                    "results": [],
-                }
-
-                for export_item in export_results:
-                    url = export_item["url"]
-                    result_data = export_item["result"]
-
-                    json_data["results"].append(
-                        {
-                            "url": url,
-                            "analysis_result": result_data["result"],
-                            "has_screenshot": result_data["screenshot"] is not None,
-                        }
-                    )
-
-                # 写入文件
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(json_data, f, ensure_ascii=False, indent=2)
-
-            elif format_type.lower() == "txt":
-                # 生成纯文本格式内容
-                txt_content = "网页分析结果导出\n"
-                txt_content += f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n"
-                txt_content += f"共 {len(export_results)} 个分析结果\n"
-                txt_content += "=" * 50 + "\n\n"
+            file_path = str(self._data_dir / f"{filename}.{file_extension}")
 
-                for i, export_item in enumerate(export_results, 1):
-                    url = export_item["url"]
-                    result_data = export_item["result"]
-
-                    txt_content += f"{i}. {url}\n"
-                    txt_content += "-" * 30 + "\n"
-                    txt_content += result_data["result"]
-                    txt_content += "\n\n"
-                    txt_content += "=" * 50 + "\n\n"
-
-                # 写入文件
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(txt_content)
+            # 生成内容与写入文件均为阻塞操作，放到线程中执行，避免阻塞事件循环
+            await asyncio.to_thread(
+                _write_export_file,
+                file_path,
+                format_type.lower(),
+                export_results,
+                timestamp,
+            )
 
             # 发送导出成功消息，并附带导出文件
             # 构建消息链
@@ -577,8 +778,7 @@ class CommandMixin:
             # 优先使用配置的LLM提供商，如果没有配置则使用当前会话的模型
             provider_id = self.llm_provider
             if not provider_id:
-                umo = event.unified_msg_origin
-                provider_id = await self.context.get_current_chat_provider_id(umo=umo)
+                provider_id = await self._get_chat_provider_id(event.unified_msg_origin)
 
             if not provider_id:
                 logger.error("无法获取LLM提供商ID，无法进行翻译")
@@ -593,11 +793,8 @@ class CommandMixin:
                     content=safe_content, target_language=self.target_language
                 )
             else:
-                # 默认翻译提示词
-                prompt = (
-                    f"请将以下内容翻译成{self.target_language}语言，"
-                    f"保持原文意思不变，语言流畅自然：\n\n{content}"
-                )
+                # 默认翻译提示词（前缀在目标语言变更时预先生成）
+                prompt = self._translation_prompt_prefix + content
 
             # 调用LLM进行翻译
             llm_resp = await self.context.llm_generate(
@@ -613,6 +810,17 @@ class CommandMixin:
             logger.error(f"翻译内容失败: {e}")
             return content
 
+    async def _get_chat_provider_id(self, umo: str) -> str | None:
+        """获取会话当前使用的LLM提供商ID（stale-while-revalidate 缓存）
+
+        Args:
+            umo: 会话的 unified_msg_origin
+
+        Returns:
+            LLM提供商ID，获取失败时为 None
+        """
+        return await self._provider_cache.get(umo)
+
     def _add_specific_content_to_result(
         self, analysis_result: str, specific_content: dict
     ) -> str:
@@ -627,129 +835,25 @@ class CommandMixin:
         """
         try:
             # 在分析结果中添加特定内容
-            specific_content_str = "\n\n**特定内容提取**\n"
+            parts = ["\n\n**特定内容提取**\n"]
 
-            # 添加图片链接（如果有）
-            if "images" in specific_content and specific_content["images"]:
-                specific_content_str += (
-                    f"\n📷 图片链接 ({len(specific_content['images'])}):\n"
-                )
-                for img in specific_content["images"]:
-                    img_url = img.get("url", "")
-                    alt_text = img.get("alt", "")
-                    if alt_text:
-                        specific_content_str += f"- {img_url} (alt: {alt_text})\n"
-                    else:
-                        specific_content_str += f"- {img_url}\n"
-
-            # 添加相关链接（如果有）
-            if "links" in specific_content and specific_content["links"]:
-                specific_content_str += (
-                    f"\n🔗 相关链接 ({len(specific_content['links'])}):\n"
-                )
-                for link in specific_content["links"][:5]:
-                    specific_content_str += f"- [{link['text']}]({link['url']})\n"
-
-            # 添加视频链接（如果有）
-            if "videos" in specific_content and specific_content["videos"]:
-                specific_content_str += (
-                    f"\n🎬 视频链接 ({len(specific_content['videos'])}):\n"
-                )
-                for video in specific_content["videos"]:
-                    video_url = video.get("url", "")
-                    video_type = video.get("type", "video")
-                    specific_content_str += f"- {video_url} (type: {video_type})\n"
-
-            # 添加音频链接（如果有）
-            if "audios" in specific_content and specific_content["audios"]:
-                specific_content_str += (
-                    f"\n🎵 音频链接 ({len(specific_content['audios'])}):\n"
-                )
-                for audio in specific_content["audios"]:
-                    specific_content_str += f"- {audio}\n"
-
-            # 添加引用块（如果有）
-            if "quotes" in specific_content and specific_content["quotes"]:
-                specific_content_str += (
-                    f"\n💬 引用块 ({len(specific_content['quotes'])}):\n"
-                )
-                for quote in specific_content["quotes"][:3]:
-                    quote_text = quote.get("text", "")
-                    author = quote.get("author", "")
-                    if author:
-                        specific_content_str += f"> {quote_text} — {author}\n\n"
-                    else:
-                        specific_content_str += f"> {quote_text}\n\n"
-
-            # 添加标题列表（如果有）
-            if "headings" in specific_content and specific_content["headings"]:
-                specific_content_str += (
-                    f"\n📑 标题列表 ({len(specific_content['headings'])}):\n"
-                )
-                for heading in specific_content["headings"]:
-                    level = heading.get("level", 1)
-                    text = heading.get("text", "")
-                    heading_id = heading.get("id", "")
-                    indent = "  " * (level - 1)
-                    if heading_id:
-                        specific_content_str += (
-                            f"{indent}#{level} {text} (id: {heading_id})\n"
-                        )
-                    else:
-                        specific_content_str += f"{indent}#{level} {text}\n"
-
-            # 添加代码块（如果有）
-            if "code_blocks" in specific_content and specific_content["code_blocks"]:
-                specific_content_str += (
-                    f"\n💻 代码块 ({len(specific_content['code_blocks'])}):\n"
-                )
-                for code_block in specific_content["code_blocks"][:2]:
-                    code = code_block.get("code", "")
-                    language = code_block.get("language", "")
-                    specific_content_str += f"``` {language}\n{code}\n```\n"
-
-            # 添加表格（如果有）
-            if "tables" in specific_content and specific_content["tables"]:
-                specific_content_str += (
-                    f"\n📊 表格 ({len(specific_content['tables'])}):\n"
-                )
-                for table in specific_content["tables"][:2]:
-                    headers = table.get("headers", [])
-                    rows = table.get("rows", [])
-                    specific_content_str += "\n表格:\n"
-                    if headers:
-                        specific_content_str += (
-                            f"| {' | '.join(headers)} |\n"
-                            f"| {' | '.join(['---' for _ in headers])} |\n"
-                        )
-                    for row in rows:
-                        specific_content_str += f"| {' | '.join(row)} |\n"
-
-            # 添加列表（如果有）
-            if "lists" in specific_content and specific_content["lists"]:
-                specific_content_str += (
-                    f"\n📋 列表 ({len(specific_content['lists'])}):\n"
-                )
-                for list_item in specific_content["lists"][:2]:
-                    list_type = list_item.get("type", "ul")
-                    items = list_item.get("items", [])
-                    specific_content_str += f"\n列表 ({list_type}):\n"
-                    for item in items:
-                        if list_type == "ol":
-                            specific_content_str += f"1. {item}\n"
-                        else:
-                            specific_content_str += f"- {item}\n"
+            for key, title, fmt, limit in _SPECIFIC_CONTENT_SECTIONS:
+                items = specific_content.get(key)
+                if not items:
+                    continue
+                parts.append(f"\n{title} ({len(items)}):\n")
+                parts.extend(map(fmt, items[:limit] if limit else items))
 
             # 添加元信息（如果有）
-            if "meta" in specific_content and specific_content["meta"]:
-                meta_info = specific_content["meta"]
-                specific_content_str += "\n📋 元信息:\n"
-                for key, value in meta_info.items():
-                    if value:
-                        specific_content_str += f"- {key}: {value}\n"
+            meta_info = specific_content.get("meta")
+            if meta_info:
+                parts.append("\n📋 元信息:\n")
+                parts.extend(
+                    f"- {key}: {value}\n" for key, value in meta_info.items() if value
+                )
 
             # 将特定内容添加到分析结果中
-            return analysis_result + specific_content_str
+            return analysis_result + "".join(parts)
         except Exception as e:
             logger.warning(f"添加特定内容失败: {e}")
             return analysis_result
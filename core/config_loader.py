@@ -5,137 +5,265 @@
 支持新旧配置格式的兼容性映射。
 """
 
-import sys
-from pathlib import Path
+import copy
+import hashlib
+import json
+import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import urlparse
 
-# 确保父目录在 Python 路径中
-parent_dir = Path(__file__).parent.parent
-if str(parent_dir) not in sys.path:
-    sys.path.insert(0, str(parent_dir))
+from astrbot.api import logger
+from astrbot.api.star import Context
+
+from .utils import WebAnalyzerUtils
+
+
+# 配置分区路径
+_NETWORK = ("基础设置", "网络设置")
+_DOMAIN = ("基础设置", "域名管理")
+_CACHE = ("基础设置", "缓存设置")
+_RESOURCE = ("基础设置", "资源管理")
+_BROWSER = ("基础设置", "浏览器设置")
+_ANALYSIS = ("分析设置",)
+_EXTRACTION = ("分析设置", "内容提取")
+_DISPLAY = ("展示设置",)
+_COLLAPSE = ("展示设置", "结果折叠")
+_TEMPLATE = ("展示设置", "自定义模板")
+_URL_RECOGNITION = ("展示设置", "URL识别")
+_SCREENSHOT = ("展示设置", "网页截图")
+_SCREENSHOT_SIZE = ("展示设置", "网页截图", "截图尺寸")
+_LLM = ("智能分析",)
+_TRANSLATION = ("智能分析", "翻译功能")
+_MERGE_FORWARD = ("消息管理", "合并转发")
+_GROUP = ("消息管理", "群聊设置")
+_RECALL = ("消息管理", "消息撤回")
+_PROPAGATION = ("消息管理", "事件传播")
+
+_DEFAULT_TEMPLATE_CONTENT = "# 网页分析结果\n\n## 基本信息\n- 标题: {title}\n- 链接: {url}\n- 内容类型: {content_type}\n- 分析时间: {date} {time}\n\n## 内容摘要\n{summary}\n\n## 详细分析\n{analysis_result}\n\n## 内容统计\n{stats}"
+
+# 配置项定义表：(输出键, 分区路径, 配置键, 默认值)
+_BASIC_SETTINGS = (
+    # 网络设置
+    ("max_content_length", _NETWORK, "max_content_length", 10000),
+    ("request_timeout_s", _NETWORK, "request_timeout_s", 30),
+    ("retry_count", _NETWORK, "retry_count", 3),
+    ("retry_delay_s", _NETWORK, "retry_delay_s", 2),
+    ("user_agent", _NETWORK, "user_agent", "Mozilla/5.0"),
+    ("proxy", _NETWORK, "proxy", ""),
+    ("hide_ip", _NETWORK, "hide_ip", False),
+    ("max_concurrency", _NETWORK, "max_concurrency", 5),
+    ("fetch_mode", _NETWORK, "fetch_mode", "httpx"),
+    # 域名管理
+    ("allowed_domains", _DOMAIN, "allowed_domains", ""),
+    ("blocked_domains", _DOMAIN, "blocked_domains", ""),
+    ("enable_unified_domain", _DOMAIN, "enable_unified_domain", True),
+    # 缓存设置
+    ("enable_cache", _CACHE, "enable_cache", True),
+    ("cache_expire_time_min", _CACHE, "cache_expire_time_min", 1440),
+    ("max_cache_size", _CACHE, "max_cache_size", 100),
+    ("cache_preload_enabled", _CACHE, "cache_preload_enabled", False),
+    ("cache_preload_count", _CACHE, "cache_preload_count", 20),
+    # 资源管理
+    ("enable_memory_monitor", _RESOURCE, "enable_memory_monitor", True),
+    ("memory_threshold_percent", _RESOURCE, "memory_threshold_percent", 80.0),
+    # 浏览器设置
+    ("sandbox_mode", _BROWSER, "sandbox_mode", "auto"),
+)
+
+_ANALYSIS_SETTINGS = (
+    ("analysis_mode", _ANALYSIS, "analysis_mode", "auto"),
+    ("llmtool_url_strategy", _ANALYSIS, "llmtool_url_strategy", "auto_analyze"),
+    ("max_summary_length", _ANALYSIS, "max_summary_length", 2000),
+    ("enable_emoji", _ANALYSIS, "enable_emoji", True),
+    ("enable_statistics", _ANALYSIS, "enable_statistics", True),
+    # 内容提取
+    ("enable_specific_extraction", _EXTRACTION, "enable_specific_extraction", False),
+    ("extract_types", _EXTRACTION, "extract_types", "title\ncontent"),
+)
+
+_DISPLAY_SETTINGS = (
+    # 基本展示设置
+    ("send_content_type", _DISPLAY, "send_content_type", "both"),
+    ("result_template", _DISPLAY, "result_template", "default"),
+    # 结果折叠
+    ("enable_collapsible", _COLLAPSE, "enable_collapsible", False),
+    ("collapse_threshold", _COLLAPSE, "collapse_threshold", 1500),
+    # 自定义模板
+    ("enable_custom_template", _TEMPLATE, "enable_custom_template", False),
+    ("template_content", _TEMPLATE, "template_content", _DEFAULT_TEMPLATE_CONTENT),
+    ("template_format", _TEMPLATE, "template_format", "markdown"),
+    # URL识别
+    ("enable_no_protocol_url", _URL_RECOGNITION, "enable_no_protocol_url", False),
+    ("default_protocol", _URL_RECOGNITION, "default_protocol", "https"),
+    # 网页截图
+    ("enable_screenshot", _SCREENSHOT, "enable_screenshot", True),
+    ("screenshot_quality", _SCREENSHOT, "screenshot_quality", 80),
+    ("screenshot_width", _SCREENSHOT_SIZE, "screenshot_width", 1280),
+    ("screenshot_height", _SCREENSHOT_SIZE, "screenshot_height", 720),
+    ("screenshot_full_page", _SCREENSHOT, "screenshot_full_page", False),
+    ("screenshot_wait_ms", _SCREENSHOT, "screenshot_wait_ms", 2000),
+    ("screenshot_wait_strategy", _SCREENSHOT, "screenshot_wait_strategy", "fixed"),
+    ("screenshot_format", _SCREENSHOT, "screenshot_format", "jpeg"),
+    ("enable_crop", _SCREENSHOT, "enable_crop", False),
+    ("crop_area", _SCREENSHOT, "crop_area", "[0, 0, 1280, 720]"),
+)
+
+_LLM_SETTINGS = (
+    ("llm_enabled", _LLM, "llm_enabled", True),
+    ("llm_provider", _LLM, "llm_provider", ""),
+    ("enable_llm_decision", _LLM, "enable_llm_decision", False),
+    ("custom_prompt", _LLM, "custom_prompt", ""),
+    # 翻译功能
+    ("enable_translation", _TRANSLATION, "enable_translation", False),
+    ("target_language", _TRANSLATION, "target_language", "zh"),
+    ("translation_provider", _TRANSLATION, "translation_provider", "llm"),
+    ("custom_translation_prompt", _TRANSLATION, "custom_translation_prompt", ""),
+)
+
+_MESSAGE_SETTINGS = (
+    # 合并转发
+    ("merge_forward_group", _MERGE_FORWARD, "group", False),
+    ("merge_forward_private", _MERGE_FORWARD, "private", False),
+    ("merge_forward_include_screenshot", _MERGE_FORWARD, "include_screenshot", False),
+    # 群聊设置
+    ("group_blacklist", _GROUP, "group_blacklist", ""),
+    # 消息撤回
+    ("enable_recall", _RECALL, "enable_recall", True),
+    ("recall_type", _RECALL, "recall_type", "smart"),
+    ("recall_time_s", _RECALL, "recall_time_s", 10),
+    ("smart_recall_enabled", _RECALL, "smart_recall_enabled", True),
+    # 事件传播
+    ("allow_llm_propagation", _PROPAGATION, "allow_llm_propagation", True),
+)
+
+_ALL_SETTINGS = (
+    _BASIC_SETTINGS
+    + _ANALYSIS_SETTINGS
+    + _DISPLAY_SETTINGS
+    + _LLM_SETTINGS
+    + _MESSAGE_SETTINGS
+)
+
+# 所有配置项涉及的分区路径，加载时每个分区只解析一次
+_SECTION_PATHS = tuple(dict.fromkeys(path for _, path, _, _ in _ALL_SETTINGS))
+
+# 输出键到默认值的映射，旧格式兼容映射与配置加载共用同一份默认值
+_DEFAULTS = {out_key: default for out_key, _, _, default in _ALL_SETTINGS}
+
+# 新格式配置的顶级分类
+_NEW_FORMAT_KEYS = frozenset(
+    {"基础设置", "分析设置", "展示设置", "智能分析", "消息管理"}
+)
+
+# 旧格式配置中兼容映射会读取的顶级键
+_LEGACY_KEYS = (
+    "network_settings",
+    "domain_settings",
+    "cache_settings",
+    "resource_settings",
+    "analysis_settings",
+    "content_extraction_settings",
+    "template_settings",
+    "screenshot_settings",
+    "llm_settings",
+    "translation_settings",
+    "merge_forward_settings",
+    "group_settings",
+    "recall_settings",
+)
+
+# 非字典配置对象转换时需要读取的全部顶级键
+_TOP_LEVEL_KEYS = _NEW_FORMAT_KEYS.union(_LEGACY_KEYS)
+
+# getattr 缺省值哨兵
+_MISSING = object()
+
+# 缺失分区的共享只读空映射，避免每次取值都新建空字典
+_EMPTY = MappingProxyType({})
+
+# 浏览器沙箱模式的合法取值
+_VALID_SANDBOX_MODES = frozenset({"auto", "always_disabled", "always_enabled"})
+
+# 代理地址格式：协议://主机[:端口]，与 urlparse 要求 scheme 和 netloc 均非空等价
+_PROXY_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://[^/?#\s]+")
+
+
+# 以下解析函数的输入均为很少变化的配置文本，按输入缓存解析结果。
+# 缓存值使用元组，避免调用方修改返回值污染缓存
+@lru_cache(maxsize=8)
+def _parse_domain_list(domain_text: str) -> tuple[str, ...]:
+    """解析域名列表（带缓存）"""
+    return tuple(WebAnalyzerUtils.parse_domain_list(domain_text))
+
+
+@lru_cache(maxsize=8)
+def _parse_group_list(group_text: str) -> tuple[str, ...]:
+    """解析群聊ID列表（带缓存）"""
+    return tuple(WebAnalyzerUtils.parse_group_list(group_text))
+
+
+@lru_cache(maxsize=8)
+def _finalize_extract_types(extract_types_text: str) -> tuple[str, ...]:
+    """解析、验证并补全提取类型（带缓存）"""
+    return tuple(WebAnalyzerUtils.normalize_extract_types(extract_types_text))
+
+
+@lru_cache(maxsize=8)
+def _parse_crop_area(crop_area_str: str) -> Any:
+    """解析裁剪区域字符串（带缓存），列表结果以元组存入缓存"""
+    # 常见写法 [x, y, w, h]：直接按逗号拆分转为整数，失败时再走通用解析
+    stripped = crop_area_str.strip()
+    if stripped[:1] == "[" and stripped[-1:] == "]":
+        try:
+            return tuple(int(part) for part in stripped[1:-1].split(","))
+        except ValueError:
+            pass
+
+    try:
+        crop_area = json.loads(crop_area_str)
+    except ValueError:
+        # 兼容 Python 字面量写法，如 (0, 0, 1280, 720)；该分支很少触发，按需导入
+        import ast
+
+        crop_area = ast.literal_eval(crop_area_str)
+    return tuple(crop_area) if isinstance(crop_area, list) else crop_area
 
-from astrbot.api import logger  # noqa: E402
-from astrbot.api.star import Context  # noqa: E402
 
-from .utils import WebAnalyzerUtils  # noqa: E402
+def _build_nested_config_paths() -> MappingProxyType:
+    """由配置项定义表生成 分区名 -> {配置键: 输出键} 的只读映射"""
+    paths = {}
+    for out_key, path, key, _ in _ALL_SETTINGS:
+        paths.setdefault(path[-1], {})[key] = out_key
+    return MappingProxyType(
+        {section: MappingProxyType(keys) for section, keys in paths.items()}
+    )
 
 
 class ConfigLoader:
     """配置加载器类"""
 
+    # 最近一次加载结果：(配置内容哈希, 配置项字典)
+    _load_cache: tuple[str, dict] | None = None
+
     # 旧配置键名到新配置键名的映射表
-    OLD_TO_NEW_MAPPING = {
-        # 网络设置
-        "request_timeout": "request_timeout_s",
-        "retry_delay": "retry_delay_s",
-        "cache_expire_time": "cache_expire_time_min",
-        "memory_threshold": "memory_threshold_percent",
-        "screenshot_wait_time": "screenshot_wait_ms",
-        "recall_time": "recall_time_s",
-        # 合并转发旧格式（v1.4.5之前）
-        "merge_forward_enabled": "_merge_forward_legacy",
-    }
-
-    # 需要特殊处理的嵌套配置路径
-    NESTED_CONFIG_PATHS = {
-        "网络设置": {
-            "max_content_length": "max_content_length",
-            "request_timeout_s": "request_timeout_s",
-            "retry_count": "retry_count",
-            "retry_delay_s": "retry_delay_s",
-            "user_agent": "user_agent",
-            "proxy": "proxy",
-            "hide_ip": "hide_ip",
-            "max_concurrency": "max_concurrency",
-            "fetch_mode": "fetch_mode",
-        },
-        "域名管理": {
-            "enable_unified_domain": "enable_unified_domain",
-            "allowed_domains": "allowed_domains",
-            "blocked_domains": "blocked_domains",
-        },
-        "缓存设置": {
-            "enable_cache": "enable_cache",
-            "cache_expire_time_min": "cache_expire_time_min",
-            "max_cache_size": "max_cache_size",
-            "cache_preload_enabled": "cache_preload_enabled",
-            "cache_preload_count": "cache_preload_count",
-        },
-        "资源管理": {
-            "enable_memory_monitor": "enable_memory_monitor",
-            "memory_threshold_percent": "memory_threshold_percent",
-        },
-        "浏览器设置": {
-            "sandbox_mode": "sandbox_mode",
-        },
-        "分析设置": {
-            "analysis_mode": "analysis_mode",
-            "llmtool_url_strategy": "llmtool_url_strategy",
-            "max_summary_length": "max_summary_length",
-            "enable_emoji": "enable_emoji",
-            "enable_statistics": "enable_statistics",
-        },
-        "内容提取": {
-            "enable_specific_extraction": "enable_specific_extraction",
-            "extract_types": "extract_types",
-        },
-        "展示设置": {
-            "send_content_type": "send_content_type",
-            "result_template": "result_template",
-        },
-        "结果折叠": {
-            "enable_collapsible": "enable_collapsible",
-            "collapse_threshold": "collapse_threshold",
-        },
-        "自定义模板": {
-            "enable_custom_template": "enable_custom_template",
-            "template_content": "template_content",
-            "template_format": "template_format",
-        },
-        "URL识别": {
-            "enable_no_protocol_url": "enable_no_protocol_url",
-            "default_protocol": "default_protocol",
-        },
-        "网页截图": {
-            "enable_screenshot": "enable_screenshot",
-            "screenshot_quality": "screenshot_quality",
-            "screenshot_full_page": "screenshot_full_page",
-            "screenshot_wait_ms": "screenshot_wait_ms",
-            "screenshot_format": "screenshot_format",
-            "enable_crop": "enable_crop",
-            "crop_area": "crop_area",
-        },
-        "智能分析": {
-            "llm_enabled": "llm_enabled",
-            "llm_provider": "llm_provider",
-            "enable_llm_decision": "enable_llm_decision",
-            "custom_prompt": "custom_prompt",
-        },
-        "翻译功能": {
-            "enable_translation": "enable_translation",
-            "target_language": "target_language",
-            "translation_provider": "translation_provider",
-            "custom_translation_prompt": "custom_translation_prompt",
-        },
-        "合并转发": {
-            "group": "merge_forward_group",
-            "private": "merge_forward_private",
-            "include_screenshot": "merge_forward_include_screenshot",
-        },
-        "群聊设置": {
-            "group_blacklist": "group_blacklist",
-        },
-        "消息撤回": {
-            "enable_recall": "enable_recall",
-            "recall_type": "recall_type",
-            "recall_time_s": "recall_time_s",
-            "smart_recall_enabled": "smart_recall_enabled",
-        },
-        "事件传播": {
-            "allow_llm_propagation": "allow_llm_propagation",
-        },
-    }
+    OLD_TO_NEW_MAPPING = MappingProxyType(
+        {
+            # 网络设置
+            "request_timeout": "request_timeout_s",
+            "retry_delay": "retry_delay_s",
+            "cache_expire_time": "cache_expire_time_min",
+            "memory_threshold": "memory_threshold_percent",
+            "screenshot_wait_time": "screenshot_wait_ms",
+            "recall_time": "recall_time_s",
+            # 合并转发旧格式（v1.4.5之前）
+            "merge_forward_enabled": "_merge_forward_legacy",
+        }
+    )
+
+    # 嵌套配置路径：分区名 -> {配置键: 输出键}，由配置项定义表生成
+    NESTED_CONFIG_PATHS = _build_nested_config_paths()
 
     @staticmethod
     def load_all_config(config: Any, context: Context) -> dict:
@@ -151,17 +279,42 @@ class ConfigLoader:
         # 先进行兼容性转换
         config = ConfigLoader._apply_compatibility_mapping(config)
 
-        config_dict = {}
-
-        # 加载各类配置
-        config_dict.update(ConfigLoader._load_basic_settings(config))
-        config_dict.update(ConfigLoader._load_analysis_settings(config))
-        config_dict.update(ConfigLoader._load_display_settings(config))
-        config_dict.update(ConfigLoader._load_llm_settings(config))
-        config_dict.update(ConfigLoader._load_message_settings(config))
+        # 配置内容未变化时直接复用上次的加载结果（深拷贝，调用方可能原地修改列表/集合）
+        cache_key = hashlib.blake2b(
+            repr(sorted(config.items())).encode(), digest_size=16
+        ).hexdigest()
+        if ConfigLoader._load_cache is not None:
+            cached_key, cached_dict = ConfigLoader._load_cache
+            if cached_key == cache_key:
+                return copy.deepcopy(cached_dict)
+
+        # 各配置分区只解析一次
+        sections = ConfigLoader._resolve_sections(config)
+
+        # 加载各类配置并一次性合并
+        config_dict = {
+            **ConfigLoader._load_basic_settings(sections),
+            **ConfigLoader._load_analysis_settings(sections),
+            **ConfigLoader._load_display_settings(sections),
+            **ConfigLoader._load_llm_settings(sections),
+            **ConfigLoader._load_message_settings(sections),
+        }
 
+        ConfigLoader._load_cache = (cache_key, copy.deepcopy(config_dict))
         return config_dict
 
+    @staticmethod
+    def is_new_format(config: Any) -> bool:
+        """判断配置是否为按分类嵌套的新格式
+
+        Args:
+            config: 原始配置对象
+
+        Returns:
+            包含任一新格式顶级分类时为 True
+        """
+        return any(key in config for key in _NEW_FORMAT_KEYS)
+
     @staticmethod
     def _apply_compatibility_mapping(config: Any) -> dict:
         """应用兼容性映射，将旧配置转换为新格式
@@ -175,27 +328,21 @@ class ConfigLoader:
         # 将config对象转换为字典（如果不是字典的话）
         if not isinstance(config, dict):
             config_dict = {}
-            # 尝试获取所有配置键
+            # 只读取加载器实际用到的顶级键，无需遍历 dir(config)
             try:
-                for key in dir(config):
-                    if not key.startswith("_"):
-                        try:
-                            config_dict[key] = getattr(config, key)
-                        except Exception:
-                            pass
+                for key in _TOP_LEVEL_KEYS:
+                    value = getattr(config, key, _MISSING)
+                    if value is not _MISSING:
+                        config_dict[key] = value
             except Exception as e:
                 logger.warning(f"配置对象转换失败: {e}")
                 return {}
         else:
-            config_dict = config.copy()
+            # 后续只读取配置，无需复制
+            config_dict = config
 
         # 检测是否为新格式配置（包含"基础设置"等顶级键）
-        is_new_format = any(
-            key in config_dict
-            for key in ["基础设置", "分析设置", "展示设置", "智能分析", "消息管理"]
-        )
-
-        if is_new_format:
+        if not _NEW_FORMAT_KEYS.isdisjoint(config_dict):
             # 新格式配置，直接返回
             return config_dict
 
@@ -205,49 +352,71 @@ class ConfigLoader:
 
         # 映射网络设置
         network_settings = {}
-        old_network = config_dict.get("network_settings", {})
+        old_network = config_dict.get("network_settings", _EMPTY)
         network_settings["max_content_length"] = old_network.get(
-            "max_content_length", 10000
+            "max_content_length", _DEFAULTS["max_content_length"]
+        )
+        network_settings["request_timeout_s"] = old_network.get(
+            "request_timeout", _DEFAULTS["request_timeout_s"]
+        )
+        network_settings["retry_count"] = old_network.get(
+            "retry_count", _DEFAULTS["retry_count"]
+        )
+        network_settings["retry_delay_s"] = old_network.get(
+            "retry_delay", _DEFAULTS["retry_delay_s"]
+        )
+        network_settings["user_agent"] = old_network.get(
+            "user_agent", _DEFAULTS["user_agent"]
+        )
+        network_settings["proxy"] = old_network.get("proxy", _DEFAULTS["proxy"])
+        network_settings["hide_ip"] = old_network.get("hide_ip", _DEFAULTS["hide_ip"])
+        network_settings["max_concurrency"] = old_network.get(
+            "max_concurrency", _DEFAULTS["max_concurrency"]
+        )
+        network_settings["fetch_mode"] = old_network.get(
+            "fetch_mode", _DEFAULTS["fetch_mode"]
         )
-        network_settings["request_timeout_s"] = old_network.get("request_timeout", 30)
-        network_settings["retry_count"] = old_network.get("retry_count", 3)
-        network_settings["retry_delay_s"] = old_network.get("retry_delay", 2)
-        network_settings["user_agent"] = old_network.get("user_agent", "Mozilla/5.0")
-        network_settings["proxy"] = old_network.get("proxy", "")
-        network_settings["hide_ip"] = old_network.get("hide_ip", False)
-        network_settings["max_concurrency"] = old_network.get("max_concurrency", 5)
-        network_settings["fetch_mode"] = old_network.get("fetch_mode", "httpx")
 
         # 映射域名设置
         domain_settings = {}
-        old_domain = config_dict.get("domain_settings", {})
+        old_domain = config_dict.get("domain_settings", _EMPTY)
         domain_settings["enable_unified_domain"] = old_domain.get(
-            "enable_unified_domain", True
+            "enable_unified_domain", _DEFAULTS["enable_unified_domain"]
+        )
+        domain_settings["allowed_domains"] = old_domain.get(
+            "allowed_domains", _DEFAULTS["allowed_domains"]
+        )
+        domain_settings["blocked_domains"] = old_domain.get(
+            "blocked_domains", _DEFAULTS["blocked_domains"]
         )
-        domain_settings["allowed_domains"] = old_domain.get("allowed_domains", "")
-        domain_settings["blocked_domains"] = old_domain.get("blocked_domains", "")
 
         # 映射缓存设置
         cache_settings = {}
-        old_cache = config_dict.get("cache_settings", {})
-        cache_settings["enable_cache"] = old_cache.get("enable_cache", True)
+        old_cache = config_dict.get("cache_settings", _EMPTY)
+        cache_settings["enable_cache"] = old_cache.get(
+            "enable_cache", _DEFAULTS["enable_cache"]
+        )
         cache_settings["cache_expire_time_min"] = old_cache.get(
-            "cache_expire_time", 1440
+            "cache_expire_time", _DEFAULTS["cache_expire_time_min"]
+        )
+        cache_settings["max_cache_size"] = old_cache.get(
+            "max_cache_size", _DEFAULTS["max_cache_size"]
         )
-        cache_settings["max_cache_size"] = old_cache.get("max_cache_size", 100)
         cache_settings["cache_preload_enabled"] = old_cache.get(
-            "cache_preload_enabled", False
+            "cache_preload_enabled", _DEFAULTS["cache_preload_enabled"]
+        )
+        cache_settings["cache_preload_count"] = old_cache.get(
+            "cache_preload_count", _DEFAULTS["cache_preload_count"]
         )
-        cache_settings["cache_preload_count"] = old_cache.get("cache_preload_count", 20)
 
         # 映射资源设置
         resource_settings = {}
-        old_resource = config_dict.get("resource_settings", {})
+        old_resource = config_dict.get("resource_settings", _EMPTY)
         resource_settings["enable_memory_monitor"] = old_resource.get(
-            "enable_memory_monitor", True
+            "enable_memory_monitor", _DEFAULTS["enable_memory_monitor"]
         )
         resource_settings["memory_threshold_percent"] = old_resource.get(
-            "memory_threshold", 80.0
+            "memory_threshold", _DEFAULTS["memory_threshold_percent"]
         )
 
         # 构建基础设置
@@ -260,24 +429,28 @@ class ConfigLoader:
 
         # 映射分析设置
         analysis_settings = {}
-        old_analysis = config_dict.get("analysis_settings", {})
-        analysis_settings["analysis_mode"] = old_analysis.get("analysis_mode", "auto")
+        old_analysis = config_dict.get("analysis_settings", _EMPTY)
+        analysis_settings["analysis_mode"] = old_analysis.get(
+            "analysis_mode", _DEFAULTS["analysis_mode"]
+        )
         analysis_settings["max_summary_length"] = old_analysis.get(
-            "max_summary_length", 2000
+            "max_summary_length", _DEFAULTS["max_summary_length"]
+        )
+        analysis_settings["enable_emoji"] = old_analysis.get(
+            "enable_emoji", _DEFAULTS["enable_emoji"]
         )
-        analysis_settings["enable_emoji"] = old_analysis.get("enable_emoji", True)
         analysis_settings["enable_statistics"] = old_analysis.get(
-            "enable_statistics", True
+            "enable_statistics", _DEFAULTS["enable_statistics"]
         )
 
         # 内容提取设置
         content_extraction = {}
-        old_extraction = config_dict.get("content_extraction_settings", {})
+        old_extraction = config_dict.get("content_extraction_settings", _EMPTY)
         content_extraction["enable_specific_extraction"] = old_extraction.get(
-            "enable_specific_extraction", False
+            "enable_specific_extraction", _DEFAULTS["enable_specific_extraction"]
         )
         content_extraction["extract_types"] = old_extraction.get(
-            "extract_types", "title\ncontent"
+            "extract_types", _DEFAULTS["extract_types"]
         )
 
         new_config["分析设置"] = {
@@ -287,61 +460,75 @@ class ConfigLoader:
 
         # 映射展示设置
         display_settings = {}
-        old_analysis = config_dict.get("analysis_settings", {})
+        old_analysis = config_dict.get("analysis_settings", _EMPTY)
         display_settings["send_content_type"] = old_analysis.get(
-            "send_content_type", "both"
+            "send_content_type", _DEFAULTS["send_content_type"]
         )
         display_settings["result_template"] = old_analysis.get(
-            "result_template", "default"
+            "result_template", _DEFAULTS["result_template"]
         )
 
         # 结果折叠
         collapsible = {}
         collapsible["enable_collapsible"] = old_analysis.get(
-            "enable_collapsible", False
+            "enable_collapsible", _DEFAULTS["enable_collapsible"]
+        )
+        collapsible["collapse_threshold"] = old_analysis.get(
+            "collapse_threshold", _DEFAULTS["collapse_threshold"]
         )
-        collapsible["collapse_threshold"] = old_analysis.get("collapse_threshold", 1500)
 
         # 自定义模板
-        old_template = config_dict.get("template_settings", {})
+        old_template = config_dict.get("template_settings", _EMPTY)
         custom_template = {}
         custom_template["enable_custom_template"] = old_template.get(
-            "enable_custom_template", False
+            "enable_custom_template", _DEFAULTS["enable_custom_template"]
         )
         custom_template["template_content"] = old_template.get("template_content", "")
         custom_template["template_format"] = old_template.get(
-            "template_format", "markdown"
+            "template_format", _DEFAULTS["template_format"]
         )
 
         # URL识别
         url_recognition = {}
         url_recognition["enable_no_protocol_url"] = old_analysis.get(
-            "enable_no_protocol_url", False
+            "enable_no_protocol_url", _DEFAULTS["enable_no_protocol_url"]
         )
         url_recognition["default_protocol"] = old_analysis.get(
-            "default_protocol", "https"
+            "default_protocol", _DEFAULTS["default_protocol"]
         )
 
         # 网页截图
-        old_screenshot = config_dict.get("screenshot_settings", {})
+        old_screenshot = config_dict.get("screenshot_settings", _EMPTY)
         screenshot = {}
-        screenshot["enable_screenshot"] = old_screenshot.get("enable_screenshot", True)
-        screenshot["screenshot_quality"] = old_screenshot.get("screenshot_quality", 80)
+        screenshot["enable_screenshot"] = old_screenshot.get(
+            "enable_screenshot", _DEFAULTS["enable_screenshot"]
+        )
+        screenshot["screenshot_quality"] = old_screenshot.get(
+            "screenshot_quality", _DEFAULTS["screenshot_quality"]
+        )
         screenshot["截图尺寸"] = {
-            "screenshot_width": old_screenshot.get("screenshot_width", 1280),
-            "screenshot_height": old_screenshot.get("screenshot_height", 720),
+            "screenshot_width": old_screenshot.get(
+                "screenshot_width", _DEFAULTS["screenshot_width"]
+            ),
+            "screenshot_height": old_screenshot.get(
+                "screenshot_height", _DEFAULTS["screenshot_height"]
+            ),
         }
         screenshot["screenshot_full_page"] = old_screenshot.get(
-            "screenshot_full_page", False
+            "screenshot_full_page", _DEFAULTS["screenshot_full_page"]
         )
         screenshot["screenshot_wait_ms"] = old_screenshot.get(
-            "screenshot_wait_time", 2000
+            "screenshot_wait_time", _DEFAULTS["screenshot_wait_ms"]
         )
         screenshot["screenshot_format"] = old_screenshot.get(
-            "screenshot_format", "jpeg"
+            "screenshot_format", _DEFAULTS["screenshot_format"]
+        )
+        screenshot["enable_crop"] = old_screenshot.get(
+            "enable_crop", _DEFAULTS["enable_crop"]
+        )
+        screenshot["crop_area"] = old_screenshot.get(
+            "crop_area", _DEFAULTS["crop_area"]
         )
-        screenshot["enable_crop"] = old_screenshot.get("enable_crop", False)
-        screenshot["crop_area"] = old_screenshot.get("crop_area", "[0, 0, 1280, 720]")
 
         new_config["展示设置"] = {
             **display_settings,
@@ -352,27 +539,35 @@ class ConfigLoader:
         }
 
         # 映射智能分析
-        old_llm = config_dict.get("llm_settings", {})
+        old_llm = config_dict.get("llm_settings", _EMPTY)
         llm_settings = {}
-        llm_settings["llm_enabled"] = old_llm.get("llm_enabled", True)
-        llm_settings["llm_provider"] = old_llm.get("llm_provider", "")
+        llm_settings["llm_enabled"] = old_llm.get(
+            "llm_enabled", _DEFAULTS["llm_enabled"]
+        )
+        llm_settings["llm_provider"] = old_llm.get(
+            "llm_provider", _DEFAULTS["llm_provider"]
+        )
         llm_settings["enable_llm_decision"] = old_analysis.get(
-            "enable_llm_decision", False
+            "enable_llm_decision", _DEFAULTS["enable_llm_decision"]
+        )
+        llm_settings["custom_prompt"] = old_llm.get(
+            "custom_prompt", _DEFAULTS["custom_prompt"]
         )
-        llm_settings["custom_prompt"] = old_llm.get("custom_prompt", "")
 
         # 翻译功能
-        old_translation = config_dict.get("translation_settings", {})
+        old_translation = config_dict.get("translation_settings", _EMPTY)
         translation = {}
         translation["enable_translation"] = old_translation.get(
-            "enable_translation", False
+            "enable_translation", _DEFAULTS["enable_translation"]
+        )
+        translation["target_language"] = old_translation.get(
+            "target_language", _DEFAULTS["target_language"]
         )
-        translation["target_language"] = old_translation.get("target_language", "zh")
         translation["translation_provider"] = old_translation.get(
-            "translation_provider", "llm"
+            "translation_provider", _DEFAULTS["translation_provider"]
         )
         translation["custom_translation_prompt"] = old_translation.get(
-            "custom_translation_prompt", ""
+            "custom_translation_prompt", _DEFAULTS["custom_translation_prompt"]
         )
 
         new_config["智能分析"] = {
@@ -382,7 +577,7 @@ class ConfigLoader:
 
         # 映射消息管理
         # 合并转发
-        old_merge = config_dict.get("merge_forward_settings", {})
+        old_merge = config_dict.get("merge_forward_settings", _EMPTY)
         merge_forward = {}
         # 处理新旧格式
         if "group" in old_merge:
@@ -399,17 +594,25 @@ class ConfigLoader:
             merge_forward["include_screenshot"] = False
 
         # 群聊设置
-        old_group = config_dict.get("group_settings", {})
+        old_group = config_dict.get("group_settings", _EMPTY)
         group_settings = {}
-        group_settings["group_blacklist"] = old_group.get("group_blacklist", "")
+        group_settings["group_blacklist"] = old_group.get(
+            "group_blacklist", _DEFAULTS["group_blacklist"]
+        )
 
         # 消息撤回
-        old_recall = config_dict.get("recall_settings", {})
+        old_recall = config_dict.get("recall_settings", _EMPTY)
         recall = {}
-        recall["enable_recall"] = old_recall.get("enable_recall", True)
-        recall["recall_type"] = old_recall.get("recall_type", "smart")
-        recall["recall_time_s"] = old_recall.get("recall_time", 10)
-        recall["smart_recall_enabled"] = old_recall.get("smart_recall_enabled", True)
+        recall["enable_recall"] = old_recall.get(
+            "enable_recall", _DEFAULTS["enable_recall"]
+        )
+        recall["recall_type"] = old_recall.get("recall_type", _DEFAULTS["recall_type"])
+        recall["recall_time_s"] = old_recall.get(
+            "recall_time", _DEFAULTS["recall_time_s"]
+        )
+        recall["smart_recall_enabled"] = old_recall.get(
+            "smart_recall_enabled", _DEFAULTS["smart_recall_enabled"]
+        )
 
         new_config["消息管理"] = {
             "合并转发": merge_forward,
@@ -421,127 +624,59 @@ class ConfigLoader:
         return new_config
 
     @staticmethod
-    def _get_nested_value(
-        config: dict, category: str, subcategory: str, key: str, default=None
-    ):
-        """从嵌套配置中获取值
+    def _resolve_sections(config: dict) -> dict:
+        """一次性解析所有配置分区
+
+        每个分区路径只遍历一次，后续读取配置项时直接在分区字典上取值。
 
         Args:
             config: 配置字典
-            category: 一级分类（如"基础设置"）
-            subcategory: 二级分类（如"网络设置"）
-            key: 配置键名
-            default: 默认值
 
         Returns:
-            配置值或默认值
+            分区路径到分区字典的映射，缺失或类型不符的分区为共享的只读空映射
         """
-        try:
-            return config.get(category, {}).get(subcategory, {}).get(key, default)
-        except (AttributeError, KeyError):
-            return default
+        sections = {}
+        for path in _SECTION_PATHS:
+            section = config
+            for part in path:
+                section = section.get(part) if isinstance(section, dict) else None
+            sections[path] = section if isinstance(section, dict) else _EMPTY
+        return sections
 
     @staticmethod
-    def _get_direct_value(config: dict, category: str, key: str, default=None):
-        """从一级分类中直接获取值（非嵌套）
+    def _read_settings(sections: dict, schema: tuple) -> dict:
+        """按配置项定义表从已解析的分区中读取配置值
 
         Args:
-            config: 配置字典
-            category: 一级分类
-            key: 配置键名
-            default: 默认值
+            sections: _resolve_sections 返回的分区映射
+            schema: 配置项定义表
 
         Returns:
-            配置值或默认值
+            输出键到配置值的字典
         """
-        try:
-            return config.get(category, {}).get(key, default)
-        except (AttributeError, KeyError):
-            return default
+        return {
+            out_key: sections[path].get(key, default)
+            for out_key, path, key, default in schema
+        }
 
     @staticmethod
-    def _load_basic_settings(config: dict) -> dict:
+    def _load_basic_settings(sections: dict) -> dict:
         """加载基础设置（网络、域名、缓存、资源）"""
-        config_dict = {}
+        config_dict = ConfigLoader._read_settings(sections, _BASIC_SETTINGS)
 
         # 网络设置
-        config_dict["max_content_length"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "max_content_length", 10000
-        )
-        config_dict["request_timeout_s"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "request_timeout_s", 30
-        )
-        config_dict["retry_count"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "retry_count", 3
-        )
-        config_dict["retry_delay_s"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "retry_delay_s", 2
-        )
-        config_dict["user_agent"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "user_agent", "Mozilla/5.0"
-        )
-        proxy = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "proxy", ""
-        )
-        config_dict["proxy"] = ConfigLoader._validate_proxy(proxy)
-        config_dict["hide_ip"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "hide_ip", False
-        )
-        config_dict["max_concurrency"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "max_concurrency", 5
-        )
-        config_dict["fetch_mode"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "网络设置", "fetch_mode", "httpx"
-        )
+        config_dict["proxy"] = ConfigLoader._validate_proxy(config_dict["proxy"])
 
         # 域名管理
-        allowed_text = ConfigLoader._get_nested_value(
-            config, "基础设置", "域名管理", "allowed_domains", ""
-        )
-        config_dict["allowed_domains"] = WebAnalyzerUtils.parse_domain_list(
-            allowed_text
-        )
-        blocked_text = ConfigLoader._get_nested_value(
-            config, "基础设置", "域名管理", "blocked_domains", ""
-        )
-        config_dict["blocked_domains"] = WebAnalyzerUtils.parse_domain_list(
-            blocked_text
-        )
-        config_dict["enable_unified_domain"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "域名管理", "enable_unified_domain", True
-        )
-
-        # 缓存设置
-        config_dict["enable_cache"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "缓存设置", "enable_cache", True
-        )
-        config_dict["cache_expire_time_min"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "缓存设置", "cache_expire_time_min", 1440
-        )
-        config_dict["max_cache_size"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "缓存设置", "max_cache_size", 100
-        )
-        config_dict["cache_preload_enabled"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "缓存设置", "cache_preload_enabled", False
-        )
-        config_dict["cache_preload_count"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "缓存设置", "cache_preload_count", 20
-        )
-
-        # 资源管理
-        config_dict["enable_memory_monitor"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "资源管理", "enable_memory_monitor", True
+        config_dict["allowed_domains"] = list(
+            _parse_domain_list(config_dict["allowed_domains"])
         )
-        config_dict["memory_threshold_percent"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "资源管理", "memory_threshold_percent", 80.0
+        config_dict["blocked_domains"] = list(
+            _parse_domain_list(config_dict["blocked_domains"])
         )
 
         # 浏览器设置
-        config_dict["sandbox_mode"] = ConfigLoader._get_nested_value(
-            config, "基础设置", "浏览器设置", "sandbox_mode", "auto"
-        )
-        valid_sandbox_modes = ("auto", "always_disabled", "always_enabled")
-        if config_dict["sandbox_mode"] not in valid_sandbox_modes:
+        if config_dict["sandbox_mode"] not in _VALID_SANDBOX_MODES:
             logger.warning(
                 f"无效的沙箱模式: {config_dict['sandbox_mode']}，将使用默认值 'auto'"
             )
@@ -550,121 +685,25 @@ class ConfigLoader:
         return config_dict
 
     @staticmethod
-    def _load_analysis_settings(config: dict) -> dict:
+    def _load_analysis_settings(sections: dict) -> dict:
         """加载分析设置"""
-        config_dict = {}
-
-        config_dict["analysis_mode"] = ConfigLoader._get_direct_value(
-            config, "分析设置", "analysis_mode", "auto"
-        )
+        config_dict = ConfigLoader._read_settings(sections, _ANALYSIS_SETTINGS)
         config_dict["auto_analyze"] = config_dict["analysis_mode"] == "auto"
-        config_dict["llmtool_url_strategy"] = ConfigLoader._get_direct_value(
-            config, "分析设置", "llmtool_url_strategy", "auto_analyze"
-        )
-        config_dict["max_summary_length"] = ConfigLoader._get_direct_value(
-            config, "分析设置", "max_summary_length", 2000
-        )
-        config_dict["enable_emoji"] = ConfigLoader._get_direct_value(
-            config, "分析设置", "enable_emoji", True
-        )
-        config_dict["enable_statistics"] = ConfigLoader._get_direct_value(
-            config, "分析设置", "enable_statistics", True
-        )
 
         # 内容提取
-        config_dict["enable_specific_extraction"] = ConfigLoader._get_nested_value(
-            config, "分析设置", "内容提取", "enable_specific_extraction", False
-        )
-        extract_types_text = ConfigLoader._get_nested_value(
-            config, "分析设置", "内容提取", "extract_types", "title\ncontent"
-        )
-        config_dict["extract_types"] = WebAnalyzerUtils.parse_extract_types(
-            extract_types_text
-        )
-        config_dict["extract_types"] = WebAnalyzerUtils.validate_extract_types(
-            config_dict["extract_types"]
-        )
-        config_dict["extract_types"] = WebAnalyzerUtils.ensure_minimal_extract_types(
-            config_dict["extract_types"]
-        )
-        config_dict["extract_types"] = WebAnalyzerUtils.add_required_extract_types(
-            config_dict["extract_types"]
+        config_dict["extract_types"] = list(
+            _finalize_extract_types(config_dict["extract_types"])
         )
 
         return config_dict
 
     @staticmethod
-    def _load_display_settings(config: dict) -> dict:
+    def _load_display_settings(sections: dict) -> dict:
         """加载展示设置"""
-        config_dict = {}
+        config_dict = ConfigLoader._read_settings(sections, _DISPLAY_SETTINGS)
 
-        # 基本展示设置
-        config_dict["send_content_type"] = ConfigLoader._get_direct_value(
-            config, "展示设置", "send_content_type", "both"
-        )
-        config_dict["result_template"] = ConfigLoader._get_direct_value(
-            config, "展示设置", "result_template", "default"
-        )
-
-        # 结果折叠
-        config_dict["enable_collapsible"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "结果折叠", "enable_collapsible", False
-        )
-        config_dict["collapse_threshold"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "结果折叠", "collapse_threshold", 1500
-        )
-
-        # 自定义模板
-        config_dict["enable_custom_template"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "自定义模板", "enable_custom_template", False
-        )
-        config_dict["template_content"] = ConfigLoader._get_nested_value(
-            config,
-            "展示设置",
-            "自定义模板",
-            "template_content",
-            "# 网页分析结果\n\n## 基本信息\n- 标题: {title}\n- 链接: {url}\n- 内容类型: {content_type}\n- 分析时间: {date} {time}\n\n## 内容摘要\n{summary}\n\n## 详细分析\n{analysis_result}\n\n## 内容统计\n{stats}",
-        )
-        config_dict["template_format"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "自定义模板", "template_format", "markdown"
-        )
-
-        # URL识别
-        config_dict["enable_no_protocol_url"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "URL识别", "enable_no_protocol_url", False
-        )
-        config_dict["default_protocol"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "URL识别", "default_protocol", "https"
-        )
-
-        # 网页截图
-        config_dict["enable_screenshot"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "enable_screenshot", True
-        )
-        config_dict["screenshot_quality"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "screenshot_quality", 80
-        )
-        size_sub = config.get("展示设置", {}).get("网页截图", {}).get("截图尺寸", {})
-        config_dict["screenshot_width"] = size_sub.get("screenshot_width", 1280)
-        config_dict["screenshot_height"] = size_sub.get("screenshot_height", 720)
-        config_dict["screenshot_full_page"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "screenshot_full_page", False
-        )
-        config_dict["screenshot_wait_ms"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "screenshot_wait_ms", 2000
-        )
-        config_dict["screenshot_wait_strategy"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "screenshot_wait_strategy", "fixed"
-        )
-        config_dict["screenshot_format"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "screenshot_format", "jpeg"
-        )
-        config_dict["enable_crop"] = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "enable_crop", False
-        )
-        crop_area = ConfigLoader._get_nested_value(
-            config, "展示设置", "网页截图", "crop_area", "[0, 0, 1280, 720]"
-        )
+        # 网页截图裁剪区域
+        crop_area = config_dict["crop_area"]
         default_crop_area = [0, 0, 1280, 720]
         if isinstance(crop_area, str):
             config_dict["crop_area"] = ConfigLoader._validate_crop_area(
@@ -678,82 +717,18 @@ class ConfigLoader:
         return config_dict
 
     @staticmethod
-    def _load_llm_settings(config: dict) -> dict:
+    def _load_llm_settings(sections: dict) -> dict:
         """加载LLM智能分析设置"""
-        config_dict = {}
-
-        config_dict["llm_enabled"] = ConfigLoader._get_direct_value(
-            config, "智能分析", "llm_enabled", True
-        )
-        config_dict["llm_provider"] = ConfigLoader._get_direct_value(
-            config, "智能分析", "llm_provider", ""
-        )
-        config_dict["enable_llm_decision"] = ConfigLoader._get_direct_value(
-            config, "智能分析", "enable_llm_decision", False
-        )
-        config_dict["custom_prompt"] = ConfigLoader._get_direct_value(
-            config, "智能分析", "custom_prompt", ""
-        )
-
-        # 翻译功能
-        config_dict["enable_translation"] = ConfigLoader._get_nested_value(
-            config, "智能分析", "翻译功能", "enable_translation", False
-        )
-        config_dict["target_language"] = ConfigLoader._get_nested_value(
-            config, "智能分析", "翻译功能", "target_language", "zh"
-        )
-        config_dict["translation_provider"] = ConfigLoader._get_nested_value(
-            config, "智能分析", "翻译功能", "translation_provider", "llm"
-        )
-        config_dict["custom_translation_prompt"] = ConfigLoader._get_nested_value(
-            config, "智能分析", "翻译功能", "custom_translation_prompt", ""
-        )
-
-        return config_dict
+        return ConfigLoader._read_settings(sections, _LLM_SETTINGS)
 
     @staticmethod
-    def _load_message_settings(config: dict) -> dict:
+    def _load_message_settings(sections: dict) -> dict:
         """加载消息管理设置"""
-        config_dict = {}
+        config_dict = ConfigLoader._read_settings(sections, _MESSAGE_SETTINGS)
 
-        # 合并转发
-        config_dict["merge_forward_group"] = ConfigLoader._get_nested_value(
-            config, "消息管理", "合并转发", "group", False
-        )
-        config_dict["merge_forward_private"] = ConfigLoader._get_nested_value(
-            config, "消息管理", "合并转发", "private", False
-        )
-        config_dict["merge_forward_include_screenshot"] = (
-            ConfigLoader._get_nested_value(
-                config, "消息管理", "合并转发", "include_screenshot", False
-            )
-        )
-
-        # 群聊设置
-        group_blacklist_text = ConfigLoader._get_nested_value(
-            config, "消息管理", "群聊设置", "group_blacklist", ""
-        )
-        config_dict["group_blacklist"] = WebAnalyzerUtils.parse_group_list(
-            group_blacklist_text
-        )
-
-        # 消息撤回
-        config_dict["enable_recall"] = ConfigLoader._get_nested_value(
-            config, "消息管理", "消息撤回", "enable_recall", True
-        )
-        config_dict["recall_type"] = ConfigLoader._get_nested_value(
-            config, "消息管理", "消息撤回", "recall_type", "smart"
-        )
-        config_dict["recall_time_s"] = ConfigLoader._get_nested_value(
-            config, "消息管理", "消息撤回", "recall_time_s", 10
-        )
-        config_dict["smart_recall_enabled"] = ConfigLoader._get_nested_value(
-            config, "消息管理", "消息撤回", "smart_recall_enabled", True
-        )
-
-        # 事件传播
-        config_dict["allow_llm_propagation"] = ConfigLoader._get_nested_value(
-            config, "消息管理", "事件传播", "allow_llm_propagation", True
+        # 群聊设置：使用集合存储，消息热路径上的黑名单判断为 O(1)
+        config_dict["group_blacklist"] = set(
+            _parse_group_list(config_dict["group_blacklist"])
         )
 
         return config_dict
@@ -778,16 +753,9 @@ class ConfigLoader:
         if not proxy:
             return ""
 
-        try:
-            parsed = urlparse(proxy)
-            if not all([parsed.scheme, parsed.netloc]):
-                logger.warning(
-                    f"无效的代理格式: {ConfigLoader._mask_proxy(proxy)}，将忽略代理设置"
-                )
-                return ""
-        except Exception as e:
+        if not isinstance(proxy, str) or not _PROXY_RE.match(proxy):
             logger.warning(
-                f"解析代理失败: {ConfigLoader._mask_proxy(proxy)}，将忽略代理设置，错误: {e}"
+                f"无效的代理格式: {ConfigLoader._mask_proxy(proxy)}，将忽略代理设置"
             )
             return ""
 
@@ -797,9 +765,9 @@ class ConfigLoader:
     def _validate_crop_area(crop_area_str: str, default_area: list) -> list:
         """验证和处理裁剪区域配置"""
         try:
-            crop_area = eval(crop_area_str)
-            if isinstance(crop_area, list) and len(crop_area) == 4:
-                return crop_area
+            crop_area = _parse_crop_area(crop_area_str)
+            if isinstance(crop_area, (list, tuple)) and len(crop_area) == 4:
+                return list(crop_area)
             else:
                 logger.warning(f"裁剪区域格式无效: {crop_area_str}，将使用默认值")
                 return default_area
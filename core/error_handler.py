@@ -4,10 +4,102 @@
 提供统一的错误处理、日志记录和用户友好的错误信息生成。
 """
 
+import logging
+import os
+import re
+import time
+from functools import lru_cache
+
+import httpx
 from astrbot.api import logger
 
 from .constants import ERROR_MESSAGES, ErrorSeverity, ErrorType
 
+# 严重程度到日志级别的映射
+_LOG_LEVELS = {
+    ErrorSeverity.INFO: logging.INFO,
+    ErrorSeverity.WARNING: logging.WARNING,
+    ErrorSeverity.ERROR: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+}
+
+# 需要向用户展示错误类型与严重程度的级别
+_DETAILED_SEVERITIES = frozenset({ErrorSeverity.ERROR, ErrorSeverity.CRITICAL})
+
+# 同类错误日志合并（默认关闭）：设置环境变量 WEB_ANALYZER_AGGREGATE_ERROR_LOGS=1
+# 后，窗口内重复出现的同类错误只计数，不再重复输出
+_LOG_AGGREGATE_ENABLED = os.environ.get(
+    "WEB_ANALYZER_AGGREGATE_ERROR_LOGS", ""
+).strip().lower() in ("1", "true", "yes", "on")
+
+# 同类错误日志合并窗口（秒）
+_LOG_AGGREGATE_WINDOW_S = 5.0
+
+# (错误类型, 异常类名, 上下文) -> [窗口起始时间, 窗口内被合并的次数]
+_log_aggregate_state: dict[tuple[str, str, str], list] = {}
+
+# 用户错误提示缓存条数：重复出现的相同错误直接复用已拼接好的提示文本
+_USER_MESSAGE_CACHE_SIZE = 64
+
+# httpx 异常类到错误类型的映射
+_HTTPX_ERROR_TYPES = {
+    httpx.TimeoutException: ErrorType.NETWORK_TIMEOUT,
+    httpx.ConnectError: ErrorType.NETWORK_CONNECTION,
+    httpx.HTTPError: ErrorType.NETWORK_ERROR,
+}
+
+
+def _keywords(*words: str) -> re.Pattern | None:
+    """将关键词编译为一条正则分支，无关键词时返回 None"""
+    return re.compile("|".join(map(re.escape, words))) if words else None
+
+
+# 异常分类规则：(错误类型, 异常类名关键词, 异常信息关键词)，按顺序匹配，先命中者优先
+_ERROR_RULES = (
+    # 网络相关
+    (ErrorType.NETWORK_TIMEOUT, _keywords("timeout"), _keywords("timeout")),
+    (ErrorType.NETWORK_CONNECTION, _keywords("connect"), _keywords("connection")),
+    (ErrorType.NETWORK_ERROR, _keywords("network", "http"), None),
+    # 解析相关
+    (ErrorType.HTML_PARSING, _keywords("parse", "soup", "lxml"), None),
+    (ErrorType.CONTENT_EMPTY, None, _keywords("empty", "none", "null")),
+    (ErrorType.PARSING_ERROR, None, _keywords("parse")),
+    # LLM相关
+    (ErrorType.LLM_ERROR, _keywords("llm", "generate"), _keywords("llm", "generate")),
+    (ErrorType.LLM_INVALID_RESPONSE, None, _keywords("invalid", "format")),
+    (ErrorType.LLM_PERMISSION, None, _keywords("permission", "auth", "key")),
+    # 截图相关
+    (ErrorType.SCREENSHOT_ERROR, _keywords("screenshot"), _keywords("screenshot")),
+    (ErrorType.BROWSER_ERROR, _keywords("browser", "playwright"), None),
+    # 缓存相关
+    (ErrorType.CACHE_ERROR, _keywords("cache"), _keywords("cache")),
+    (ErrorType.CACHE_WRITE, None, _keywords("write", "save")),
+    (ErrorType.CACHE_READ, None, _keywords("read", "load")),
+    # 配置相关
+    (ErrorType.CONFIG_ERROR, _keywords("config", "setting"), None),
+    (ErrorType.CONFIG_INVALID, None, _keywords("invalid")),
+    # 权限相关
+    (ErrorType.PERMISSION_ERROR, _keywords("permission", "auth"), None),
+    (ErrorType.DOMAIN_BLOCKED, None, _keywords("blocked", "deny")),
+    # 其他错误
+    (ErrorType.INTERNAL_ERROR, _keywords("internal"), _keywords("internal")),
+)
+
+
+@lru_cache(maxsize=128)
+def _classify_by_keywords(exception_type_lower: str, exception_msg: str) -> str:
+    """按关键词规则对异常分类
+
+    结果只取决于异常类名和异常信息，按二者缓存，
+    重试或批量分析时反复出现的同类错误无需重复匹配。
+    """
+    for error_type, type_pattern, msg_pattern in _ERROR_RULES:
+        if (type_pattern and type_pattern.search(exception_type_lower)) or (
+            msg_pattern and msg_pattern.search(exception_msg)
+        ):
+            return error_type
+    return ErrorType.UNKNOWN_ERROR
+
 
 class ErrorHandler:
     """错误处理器类"""
@@ -30,25 +122,30 @@ class ErrorHandler:
         Returns:
             用户友好的错误信息字符串
         """
-        error_config = ERROR_MESSAGES.get(error_type, ERROR_MESSAGES["unknown_error"])
-        error_message = error_config["message"]
-        solution = error_config["solution"]
-        severity = error_config["severity"]
+        error_message, solution, severity = ERROR_MESSAGES.get(
+            error_type, ERROR_MESSAGES["unknown_error"]
+        )
 
+        # 异常文本只转换一次，日志与用户提示共用
+        error_str = str(original_error)
         context_str = ErrorHandler._build_context_str(url, context)
-        ErrorHandler._log_error(error_message, original_error, context_str, severity)
+        ErrorHandler._log_error(
+            error_message, original_error, context_str, severity, error_type, error_str
+        )
         return ErrorHandler._build_user_message(
-            error_message, url, original_error, solution, error_type, severity
+            error_message, url, error_str, solution, error_type, severity
         )
 
     @staticmethod
     def _build_context_str(url: str | None, context: dict | None) -> str:
         """构建上下文信息字符串"""
-        context_info = []
+        # 常见情况只有 URL，无需构建列表
+        if not context:
+            return f"URL: {url}" if url else ""
+
+        context_info = [f"{key}: {value}" for key, value in context.items()]
         if url:
-            context_info.append(f"URL: {url}")
-        if context:
-            context_info.extend([f"{key}: {value}" for key, value in context.items()])
+            context_info.insert(0, f"URL: {url}")
         return " | ".join(context_info)
 
     @staticmethod
@@ -57,47 +154,70 @@ class ErrorHandler:
         original_error: Exception,
         context_str: str,
         severity: str,
+        error_type: str = "",
+        error_str: str | None = None,
     ) -> None:
-        """记录错误日志"""
-        log_message = f"{error_message}: {str(original_error)}"
+        """记录错误日志
+
+        启用日志合并时，同类错误（错误类型、异常类与 URL 等上下文均相同）
+        在合并窗口内只记录第一次，其余只计数，并在窗口结束后的下一次记录中
+        附带合并次数；严重错误始终立即记录。
+        """
+        # 日志级别被过滤时直接返回，不做任何格式化
+        level = _LOG_LEVELS[severity]
+        if not logger.isEnabledFor(level):
+            return
+
+        suppressed = 0
+        if _LOG_AGGREGATE_ENABLED and severity != ErrorSeverity.CRITICAL:
+            key = (error_type, type(original_error).__name__, context_str)
+            now = time.monotonic()
+            state = _log_aggregate_state.get(key)
+            if state is not None and now - state[0] < _LOG_AGGREGATE_WINDOW_S:
+                state[1] += 1
+                return
+            if state is not None:
+                suppressed = state[1]
+            _log_aggregate_state[key] = [now, 0]
+
+        # 使用 % 占位符，由 logging 在真正输出时再格式化
+        log_format = "%s: %s"
+        log_args = [error_message, original_error if error_str is None else error_str]
         if context_str:
-            log_message += f" ({context_str})"
+            log_format += " (%s)"
+            log_args.append(context_str)
+        if suppressed:
+            log_format += " [上一合并窗口内另有 %d 次同类错误未单独记录]"
+            log_args.append(suppressed)
 
-        log_levels = {
-            ErrorSeverity.INFO: logger.info,
-            ErrorSeverity.WARNING: logger.warning,
-            ErrorSeverity.ERROR: logger.error,
-            ErrorSeverity.CRITICAL: logger.critical,
-        }
-        log_levels[severity](log_message, exc_info=True)
+        logger.log(level, log_format, *log_args, exc_info=True)
 
     @staticmethod
+    @lru_cache(maxsize=_USER_MESSAGE_CACHE_SIZE)
     def _build_user_message(
         error_message: str,
         url: str | None,
-        original_error: Exception,
+        error_str: str,
         solution: str,
         error_type: str,
         severity: str,
     ) -> str:
-        """构建用户友好的错误信息"""
-        error_detail = str(original_error)
-        if len(error_detail) > 100:
-            error_detail = error_detail[:100] + "..."
+        """构建用户友好的错误信息
 
-        user_message = [
-            f"❌ {error_message}",
-            f"🔗 相关链接: {url}" if url else None,
-            f"📋 错误详情: {error_detail}",
-            f"💡 建议解决方案: {solution}",
-        ]
+        重试或重复提交同一链接时会反复产生相同的错误，结果按全部参数缓存。
+        """
+        error_detail = error_str if len(error_str) <= 100 else error_str[:100] + "..."
 
-        if severity in [ErrorSeverity.ERROR, ErrorSeverity.CRITICAL]:
-            user_message.extend(
-                [f"⚠️  错误类型: {error_type}", f"🔴 严重程度: {severity.upper()}"]
-            )
+        parts = [f"❌ {error_message}"]
+        if url:
+            parts.append(f"🔗 相关链接: {url}")
+        parts.append(f"📋 错误详情: {error_detail}")
+        parts.append(f"💡 建议解决方案: {solution}")
+        if severity in _DETAILED_SEVERITIES:
+            parts.append(f"⚠️  错误类型: {error_type}")
+            parts.append(f"🔴 严重程度: {severity.upper()}")
 
-        return "\n".join([msg for msg in user_message if msg is not None])
+        return "\n".join(parts)
 
     @staticmethod
     def get_error_type(exception: Exception) -> str:
@@ -109,143 +229,12 @@ class ErrorHandler:
         Returns:
             错误类型字符串
         """
-        exception_type = type(exception).__name__
-        exception_msg = str(exception).lower()
-        exception_type_lower = exception_type.lower()
-
-        # 按优先级检查各类错误
-        error_type = (
-            ErrorHandler._check_network_errors(
-                exception, exception_type_lower, exception_msg
-            )
-            or ErrorHandler._check_parsing_errors(exception_type_lower, exception_msg)
-            or ErrorHandler._check_llm_errors(exception_type_lower, exception_msg)
-            or ErrorHandler._check_screenshot_errors(
-                exception_type_lower, exception_msg
-            )
-            or ErrorHandler._check_cache_errors(exception_type_lower, exception_msg)
-            or ErrorHandler._check_config_errors(exception_type_lower, exception_msg)
-            or ErrorHandler._check_permission_errors(
-                exception_type_lower, exception_msg
-            )
-            or ErrorHandler._check_other_errors(exception_type_lower, exception_msg)
-            or ErrorType.UNKNOWN_ERROR
+        # httpx 异常按继承链直接查表，命中最具体的类型
+        for exception_class in type(exception).__mro__:
+            error_type = _HTTPX_ERROR_TYPES.get(exception_class)
+            if error_type is not None:
+                return error_type
+
+        return _classify_by_keywords(
+            type(exception).__name__.lower(), str(exception).lower()
         )
-        return error_type
-
-    @staticmethod
-    def _check_network_errors(
-        exception: Exception, exception_type_lower: str, exception_msg: str
-    ) -> str | None:
-        """检查网络相关错误"""
-        from httpx import ConnectError, HTTPError, TimeoutException
-
-        if isinstance(exception, HTTPError):
-            if isinstance(exception, TimeoutException):
-                return ErrorType.NETWORK_TIMEOUT
-            if isinstance(exception, ConnectError):
-                return ErrorType.NETWORK_CONNECTION
-            return ErrorType.NETWORK_ERROR
-
-        if "timeout" in exception_type_lower or "timeout" in exception_msg:
-            return ErrorType.NETWORK_TIMEOUT
-        if "connect" in exception_type_lower or "connection" in exception_msg:
-            return ErrorType.NETWORK_CONNECTION
-        if "network" in exception_type_lower or "http" in exception_type_lower:
-            return ErrorType.NETWORK_ERROR
-        return None
-
-    @staticmethod
-    def _check_parsing_errors(
-        exception_type_lower: str, exception_msg: str
-    ) -> str | None:
-        """检查解析相关错误"""
-        if (
-            "parse" in exception_type_lower
-            or "soup" in exception_type_lower
-            or "lxml" in exception_type_lower
-        ):
-            return ErrorType.HTML_PARSING
-        if (
-            "empty" in exception_msg
-            or "none" in exception_msg
-            or "null" in exception_msg
-        ):
-            return ErrorType.CONTENT_EMPTY
-        if "parse" in exception_msg:
-            return ErrorType.PARSING_ERROR
-        return None
-
-    @staticmethod
-    def _check_llm_errors(exception_type_lower: str, exception_msg: str) -> str | None:
-        """检查LLM相关错误"""
-        if "llm" in exception_type_lower or "llm" in exception_msg:
-            return ErrorType.LLM_ERROR
-        if "generate" in exception_type_lower or "generate" in exception_msg:
-            return ErrorType.LLM_ERROR
-        if "timeout" in exception_msg and "llm" in exception_msg:
-            return ErrorType.LLM_TIMEOUT
-        if "invalid" in exception_msg or "format" in exception_msg:
-            return ErrorType.LLM_INVALID_RESPONSE
-        if (
-            "permission" in exception_msg
-            or "auth" in exception_msg
-            or "key" in exception_msg
-        ):
-            return ErrorType.LLM_PERMISSION
-        return None
-
-    @staticmethod
-    def _check_screenshot_errors(
-        exception_type_lower: str, exception_msg: str
-    ) -> str | None:
-        """检查截图相关错误"""
-        if "screenshot" in exception_type_lower or "screenshot" in exception_msg:
-            return ErrorType.SCREENSHOT_ERROR
-        if "browser" in exception_type_lower or "playwright" in exception_type_lower:
-            return ErrorType.BROWSER_ERROR
-        return None
-
-    @staticmethod
-    def _check_cache_errors(
-        exception_type_lower: str, exception_msg: str
-    ) -> str | None:
-        """检查缓存相关错误"""
-        if "cache" in exception_type_lower or "cache" in exception_msg:
-            return ErrorType.CACHE_ERROR
-        if "write" in exception_msg or "save" in exception_msg:
-            return ErrorType.CACHE_WRITE
-        if "read" in exception_msg or "load" in exception_msg:
-            return ErrorType.CACHE_READ
-        return None
-
-    @staticmethod
-    def _check_config_errors(
-        exception_type_lower: str, exception_msg: str
-    ) -> str | None:
-        """检查配置相关错误"""
-        if "config" in exception_type_lower or "setting" in exception_type_lower:
-            return ErrorType.CONFIG_ERROR
-        if "invalid" in exception_msg:
-            return ErrorType.CONFIG_INVALID
-        return None
-
-    @staticmethod
-    def _check_permission_errors(
-        exception_type_lower: str, exception_msg: str
-    ) -> str | None:
-        """检查权限相关错误"""
-        if "permission" in exception_type_lower or "auth" in exception_type_lower:
-            return ErrorType.PERMISSION_ERROR
-        if "blocked" in exception_msg or "deny" in exception_msg:
-            return ErrorType.DOMAIN_BLOCKED
-        return None
-
-    @staticmethod
-    def _check_other_errors(
-        exception_type_lower: str, exception_msg: str
-    ) -> str | None:
-        """检查其他错误"""
-        if "internal" in exception_type_lower or "internal" in exception_msg:
-            return ErrorType.INTERNAL_ERROR
-        return None
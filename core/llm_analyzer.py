@@ -4,12 +4,180 @@ LLM 分析模块
 负责调用大语言模型进行智能内容分析和总结。
 """
 
+from functools import lru_cache
+from string import Formatter
 from typing import Any
 
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent
 
-from .utils import WebAnalyzerUtils
+from .provider_cache import ProviderIdCache
+from .utils import (
+    WebAnalyzerUtils,
+    compile_content_type_patterns,
+    match_content_type,
+)
+
+
+# 截断 LLM 结果时向前查找句末标点的范围（字符数）
+_TRUNCATE_LOOKBACK_CHARS = 100
+_SENTENCE_END_MARKS = ("。", "！", "？", ". ")
+
+
+# 内容类型检测规则：按顺序匹配，排在前面的类型优先
+_CONTENT_TYPE_RULES: dict[str, tuple[str, ...]] = {
+    "新闻资讯": (
+        "新闻",
+        "报道",
+        "消息",
+        "时事",
+        "快讯",
+        "头条",
+        "要闻",
+        "热点",
+        "事件",
+    ),
+    "教程指南": (
+        "教程",
+        "指南",
+        "教学",
+        "步骤",
+        "方法",
+        "如何",
+        "怎样",
+        "攻略",
+        "技巧",
+    ),
+    "个人博客": (
+        "博客",
+        "随笔",
+        "日记",
+        "个人",
+        "观点",
+        "感想",
+        "感悟",
+        "思考",
+        "分享",
+    ),
+    "产品介绍": (
+        "产品",
+        "服务",
+        "购买",
+        "价格",
+        "优惠",
+        "功能",
+        "特性",
+        "参数",
+        "规格",
+        "评测",
+    ),
+    "技术文档": ("技术", "开发", "编程", "代码", "API", "SDK", "文档", "说明"),
+    "学术论文": ("论文", "研究", "实验", "结论", "摘要", "关键词", "引用", "参考文献"),
+    "商业分析": ("分析", "报告", "数据", "统计", "趋势", "预测", "市场", "行业"),
+}
+
+
+# 每种类型的关键词预编译为一条正则分支，检测时每种类型只需扫描一次内容
+_CONTENT_TYPE_PATTERNS = compile_content_type_patterns(_CONTENT_TYPE_RULES)
+
+
+# 按内容类型区分的分析模板，{emoji_prefix} 与 {max_length} 在渲染时填入，
+# {{title}} 等占位符保留给 build_llm_prompt 再次 format
+_ANALYSIS_TEMPLATES = {
+    "新闻资讯": """请对以下新闻资讯进行专业分析和智能总结：
+
+**网页信息**
+- 标题：{{title}}
+- 链接：{{url}}
+
+**新闻内容**：
+{{content}}
+
+**分析要求**：
+1. **核心事件**：用50-100字概括新闻的核心事件和背景
+2. **关键信息**：提取3-5个最重要的事实要点
+3. **事件影响**：分析事件可能产生的影响和意义
+4. **相关背景**：补充必要的相关背景信息
+5. **适用人群**：说明这条新闻对哪些人群最有价值
+
+**输出格式要求**：
+- 使用清晰的分段结构
+- {emoji_prefix}
+- 语言简洁专业，避免冗余
+- 保持客观中立的态度
+- 总字数不超过{max_length}字
+
+请确保分析准确、全面且易于理解。""",
+    "教程指南": """请对以下教程指南进行专业分析和智能总结：
+
+**网页信息**
+- 标题：{{title}}
+- 链接：{{url}}
+
+**教程内容**：
+{{content}}
+
+**分析要求**：
+1. **核心目标**：用50-100字概括教程的核心目标和适用场景
+2. **学习价值**：分析该教程对学习者的价值和意义
+3. **关键步骤**：提取教程的主要步骤和关键点
+4. **技术要点**：总结教程中涉及的核心技术或知识点
+5. **注意事项**：整理教程中的重要提示和注意事项
+6. **适用人群**：说明适合学习该教程的人群
+
+**输出格式要求**：
+- 使用清晰的分段结构
+- {emoji_prefix}
+- 语言简洁专业，避免冗余
+- 保持客观中立的态度
+- 总字数不超过{max_length}字
+
+请确保分析准确、全面且易于理解。""",
+    "默认": """请对以下网页内容进行专业分析和智能总结：
+
+**网页信息**
+- 标题：{{title}}
+- 链接：{{url}}
+
+**网页内容**：
+{{content}}
+
+**分析要求**：
+1. **核心摘要**：用50-100字概括网页的核心内容和主旨
+2. **关键要点**：提取2-3个最重要的信息点或观点
+3. **内容类型**：判断网页属于什么类型（新闻、教程、博客、产品介绍等）
+4. **价值评估**：简要评价内容的价值和实用性
+5. **适用人群**：说明适合哪些人群阅读
+
+**输出格式要求**：
+- 使用清晰的分段结构
+- {emoji_prefix}
+- 语言简洁专业，避免冗余
+- 保持客观中立的态度
+- 总字数不超过{max_length}字
+
+请确保分析准确、全面且易于理解。""",
+}
+
+
+@lru_cache(maxsize=16)
+def _render_analysis_template(
+    content_type: str, emoji_prefix: str, max_length: int
+) -> str:
+    """填入 emoji 与长度设置后的分析模板（按参数缓存）"""
+    template = _ANALYSIS_TEMPLATES.get(content_type, _ANALYSIS_TEMPLATES["默认"])
+    return template.format(emoji_prefix=emoji_prefix, max_length=max_length)
+
+
+@lru_cache(maxsize=16)
+def _analysis_template_segments(
+    content_type: str, emoji_prefix: str, max_length: int
+) -> tuple[tuple[str, str | None], ...]:
+    """预解析分析模板，得到 (字面文本, 占位字段名) 片段序列（按参数缓存）"""
+    template = _render_analysis_template(content_type, emoji_prefix, max_length)
+    return tuple(
+        (literal, field) for literal, field, _, _ in Formatter().parse(template)
+    )
 
 
 class LLMAnalyzer:
@@ -23,6 +191,7 @@ class LLMAnalyzer:
         max_summary_length: int = 2000,
         enable_emoji: bool = True,
         llm_enabled: bool = True,
+        provider_cache: ProviderIdCache | None = None,
     ):
         """初始化 LLM 分析器
 
@@ -33,6 +202,7 @@ class LLMAnalyzer:
             max_summary_length: 最大摘要长度
             enable_emoji: 是否启用 emoji
             llm_enabled: LLM 是否启用
+            provider_cache: 会话模型 ID 缓存，未传入时自行创建
         """
         self.context = context
         self.llm_provider = llm_provider
@@ -40,6 +210,16 @@ class LLMAnalyzer:
         self.max_summary_length = max_summary_length
         self.enable_emoji = enable_emoji
         self.llm_enabled = llm_enabled
+        # 上下文对象的能力在插件生命周期内不变，初始化时探测一次
+        self._has_llm_generate = hasattr(context, "llm_generate")
+        # 报告头部各行的标签只取决于 enable_emoji，初始化时拼好
+        self._report_labels = (
+            f"{'🔗' if enable_emoji else ''} **分析链接**: ",
+            f"{'📝' if enable_emoji else ''} **网页标题**: ",
+            f"{'📋' if enable_emoji else ''} **内容类型**: ",
+        )
+        # 会话模型 ID 缓存，减少重复查询当前会话模型
+        self._provider_cache = provider_cache or ProviderIdCache(context)
 
     def check_llm_availability(self) -> bool:
         """检查 LLM 是否可用和启用
@@ -47,7 +227,7 @@ class LLMAnalyzer:
         Returns:
             LLM 是否可用
         """
-        return hasattr(self.context, "llm_generate") and self.llm_enabled
+        return self._has_llm_generate and self.llm_enabled
 
     async def get_llm_provider(self, event: AstrMessageEvent) -> str:
         """获取合适的 LLM 提供商
@@ -64,8 +244,8 @@ class LLMAnalyzer:
 
         # 如果没有配置，则使用当前会话的模型
         try:
-            umo = event.unified_msg_origin
-            return await self.context.get_current_chat_provider_id(umo=umo)
+            provider_id = await self._provider_cache.get(event.unified_msg_origin)
+            return provider_id or ""
         except Exception as e:
             logger.error(f"获取当前会话的聊天模型 ID 失败: {e}")
             return ""
@@ -101,11 +281,17 @@ class LLMAnalyzer:
                 content_type=content_type,
             )
         else:
-            # 根据内容类型获取相应的分析模板
-            template = self._get_analysis_template(
+            # 根据内容类型获取预解析的分析模板，按片段拼接，无需每次重新解析模板
+            segments = _analysis_template_segments(
                 content_type, emoji_prefix, self.max_summary_length
             )
-            return template.format(title=safe_title, url=safe_url, content=safe_content)
+            values = {"title": safe_title, "url": safe_url, "content": safe_content}
+            parts = []
+            for literal, field in segments:
+                parts.append(literal)
+                if field:
+                    parts.append(values[field])
+            return "".join(parts)
 
     def _get_analysis_template(
         self, content_type: str, emoji_prefix: str, max_length: int
@@ -120,85 +306,7 @@ class LLMAnalyzer:
         Returns:
             分析模板
         """
-        # 定义多种分析模板
-        templates = {
-            "新闻资讯": f"""请对以下新闻资讯进行专业分析和智能总结：
-
-**网页信息**
-- 标题：{{title}}
-- 链接：{{url}}
-
-**新闻内容**：
-{{content}}
-
-**分析要求**：
-1. **核心事件**：用50-100字概括新闻的核心事件和背景
-2. **关键信息**：提取3-5个最重要的事实要点
-3. **事件影响**：分析事件可能产生的影响和意义
-4. **相关背景**：补充必要的相关背景信息
-5. **适用人群**：说明这条新闻对哪些人群最有价值
-
-**输出格式要求**：
-- 使用清晰的分段结构
-- {emoji_prefix}
-- 语言简洁专业，避免冗余
-- 保持客观中立的态度
-- 总字数不超过{max_length}字
-
-请确保分析准确、全面且易于理解。""",
-            "教程指南": f"""请对以下教程指南进行专业分析和智能总结：
-
-**网页信息**
-- 标题：{{title}}
-- 链接：{{url}}
-
-**教程内容**：
-{{content}}
-
-**分析要求**：
-1. **核心目标**：用50-100字概括教程的核心目标和适用场景
-2. **学习价值**：分析该教程对学习者的价值和意义
-3. **关键步骤**：提取教程的主要步骤和关键点
-4. **技术要点**：总结教程中涉及的核心技术或知识点
-5. **注意事项**：整理教程中的重要提示和注意事项
-6. **适用人群**：说明适合学习该教程的人群
-
-**输出格式要求**：
-- 使用清晰的分段结构
-- {emoji_prefix}
-- 语言简洁专业，避免冗余
-- 保持客观中立的态度
-- 总字数不超过{max_length}字
-
-请确保分析准确、全面且易于理解。""",
-            "默认": f"""请对以下网页内容进行专业分析和智能总结：
-
-**网页信息**
-- 标题：{{title}}
-- 链接：{{url}}
-
-**网页内容**：
-{{content}}
-
-**分析要求**：
-1. **核心摘要**：用50-100字概括网页的核心内容和主旨
-2. **关键要点**：提取2-3个最重要的信息点或观点
-3. **内容类型**：判断网页属于什么类型（新闻、教程、博客、产品介绍等）
-4. **价值评估**：简要评价内容的价值和实用性
-5. **适用人群**：说明适合哪些人群阅读
-
-**输出格式要求**：
-- 使用清晰的分段结构
-- {emoji_prefix}
-- 语言简洁专业，避免冗余
-- 保持客观中立的态度
-- 总字数不超过{max_length}字
-
-请确保分析准确、全面且易于理解。""",
-        }
-
-        # 返回对应的模板，如果没有则使用默认模板
-        return templates.get(content_type, templates["默认"])
+        return _render_analysis_template(content_type, emoji_prefix, max_length)
 
     def format_llm_result(
         self, content_data: dict, analysis_text: str, content_type: str
@@ -216,25 +324,33 @@ class LLMAnalyzer:
         title = content_data["title"]
         url = content_data["url"]
 
-        # 限制摘要长度，避免结果过长
-        if len(analysis_text) > self.max_summary_length:
-            analysis_text = analysis_text[: self.max_summary_length] + "..."
-
-        # 添加标题和格式美化
-        link_emoji = "🔗" if self.enable_emoji else ""
-        title_emoji = "📝" if self.enable_emoji else ""
-        type_emoji = "📋" if self.enable_emoji else ""
-
-        formatted_result = "**AI智能网页分析报告**\n\n"
-        formatted_result += f"{link_emoji} **分析链接**: {url}\n"
-        formatted_result += f"{title_emoji} **网页标题**: {title}\n"
-        formatted_result += f"{type_emoji} **内容类型**: {content_type}\n\n"
-        formatted_result += "---\n\n"
-        formatted_result += analysis_text
-        formatted_result += "\n\n---\n"
-        formatted_result += "*分析完成，希望对您有帮助！*"
-
-        return formatted_result
+        # 限制摘要长度，避免结果过长；未超长时不做切片
+        limit = self.max_summary_length
+        if len(analysis_text) > limit:
+            truncated = analysis_text[:limit]
+            # 优先在末尾一段内的句末截断，避免把句子截在中间
+            lookback_start = max(0, limit - _TRUNCATE_LOOKBACK_CHARS)
+            boundary = max(
+                truncated.rfind(mark, lookback_start) for mark in _SENTENCE_END_MARKS
+            )
+            if boundary > 0:
+                # 截在句末时保留标点本身，不再追加省略号（避免出现 "...."）
+                analysis_text = truncated[: boundary + 1]
+            else:
+                analysis_text = f"{truncated}..."
+
+        # 一次性拼接整段结果，避免逐段 += 产生中间字符串
+        link_label, title_label, type_label = self._report_labels
+        return (
+            "**AI智能网页分析报告**\n\n"
+            f"{link_label}{url}\n"
+            f"{title_label}{title}\n"
+            f"{type_label}{content_type}\n\n"
+            "---\n\n"
+            f"{analysis_text}"
+            "\n\n---\n"
+            "*分析完成，希望对您有帮助！*"
+        )
 
     async def analyze_with_llm(
         self, event: AstrMessageEvent, content_data: dict
@@ -296,81 +412,8 @@ class LLMAnalyzer:
         Returns:
             内容类型字符串
         """
-        content_lower = content.lower()
-        rules = self._get_content_type_rules()
-
-        for type_name, keywords in rules.items():
-            if any(keyword in content_lower for keyword in keywords):
-                return type_name
-        return "文章"
+        return match_content_type(content, _CONTENT_TYPE_PATTERNS, "文章")
 
-    def _get_content_type_rules(self) -> dict[str, list[str]]:
+    def _get_content_type_rules(self) -> dict[str, tuple[str, ...]]:
         """获取内容类型检测规则"""
-        return {
-            "新闻资讯": [
-                "新闻",
-                "报道",
-                "消息",
-                "时事",
-                "快讯",
-                "头条",
-                "要闻",
-                "热点",
-                "事件",
-            ],
-            "教程指南": [
-                "教程",
-                "指南",
-                "教学",
-                "步骤",
-                "方法",
-                "如何",
-                "怎样",
-                "攻略",
-                "技巧",
-            ],
-            "个人博客": [
-                "博客",
-                "随笔",
-                "日记",
-                "个人",
-                "观点",
-                "感想",
-                "感悟",
-                "思考",
-                "分享",
-            ],
-            "产品介绍": [
-                "产品",
-                "服务",
-                "购买",
-                "价格",
-                "优惠",
-                "功能",
-                "特性",
-                "参数",
-                "规格",
-                "评测",
-            ],
-            "技术文档": ["技术", "开发", "编程", "代码", "API", "SDK", "文档", "说明"],
-            "学术论文": [
-                "论文",
-                "研究",
-                "实验",
-                "结论",
-                "摘要",
-                "关键词",
-                "引用",
-                "参考文献",
-            ],
-            "商业分析": [
-                "分析",
-                "报告",
-                "数据",
-                "统计",
-                "趋势",
-                "预测",
-                "市场",
-                "行业",
-            ],
-        }
+        return _CONTENT_TYPE_RULES
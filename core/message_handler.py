@@ -4,24 +4,52 @@
 负责处理单个和批量 URL 分析、发送分析结果等。
 """
 
+import asyncio
+import hashlib
 import os
-import sys
-from pathlib import Path
+from functools import lru_cache
 
-# 确保父目录在 Python 路径中
-parent_dir = Path(__file__).parent.parent
-if str(parent_dir) not in sys.path:
-    sys.path.insert(0, str(parent_dir))
+from astrbot.api import logger
+from astrbot.api.event import AstrMessageEvent
+from astrbot.api.message_components import Image, Node, Nodes, Plain
 
-from astrbot.api import logger  # noqa: E402
-from astrbot.api.event import AstrMessageEvent  # noqa: E402
-from astrbot.api.message_components import Image, Node, Nodes, Plain  # noqa: E402
+from .analyzer import WebAnalyzer
+from .cache import CacheManager
+from .constants import ErrorType
+from .error_handler import ErrorHandler
+from .screenshot_temp_manager import ScreenshotTempManager
 
-from .analyzer import WebAnalyzer  # noqa: E402
-from .cache import CacheManager  # noqa: E402
-from .constants import ErrorType  # noqa: E402
-from .error_handler import ErrorHandler  # noqa: E402
-from .screenshot_temp_manager import ScreenshotTempManager  # noqa: E402
+# 较新版本的 AstrBot 支持直接由字节数据构造图片组件，无需落盘
+_IMAGE_FROM_BYTES = hasattr(Image, "fromBytes")
+
+# 特定内容提取中最多展示的图片与链接条数（标题中仍显示总数）
+_MAX_LISTED_IMAGES = 20
+_MAX_LISTED_LINKS = 5
+
+
+@lru_cache(maxsize=256)
+def _temp_screenshot_stem(url: str) -> str:
+    """计算截图临时文件名
+
+    临时文件名只需唯一且稳定，使用比 MD5 更快的 BLAKE2b；
+    磁盘缓存文件名由 CacheManager 自行计算，二者互不影响。
+    """
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _write_blob(path: str, data: bytes) -> None:
+    """将二进制数据写入文件（在线程池中执行，避免阻塞事件循环）"""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _read_blob(path: str) -> bytes | None:
+    """读取二进制文件，文件不存在时返回 None（可在线程池中执行）"""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 
 class MessageHandler:
@@ -87,17 +115,22 @@ class MessageHandler:
         self.screenshot_temp_manager = ScreenshotTempManager(
             ttl=screenshot_temp_ttl, max_memory_cache=screenshot_cache_size
         )
+        # 临时目录确认存在后不再重复调用 makedirs
+        self._temp_dir_ready = False
+        # 临时截图路径的目录前缀与扩展名固定不变，初始化时拼好
+        self._temp_path_prefix = os.path.join(self.screenshot_temp_manager.temp_dir, "")
+        self._temp_path_suffix = f".{screenshot_format}"
 
-        # 并发控制信号量
+        # 并发控制信号量，首次使用时在运行中的事件循环里创建
         self.max_concurrency = max(1, min(20, max_concurrency))
-        self.concurrency_semaphore = None
-        self._init_semaphore()
+        self.concurrency_semaphore: asyncio.Semaphore | None = None
 
-    def check_cache(self, url: str) -> dict | None:
+    def check_cache(self, url: str, normalized_url: str | None = None) -> dict | None:
         """检查指定 URL 的缓存是否存在且有效
 
         Args:
             url: 网页 URL
+            normalized_url: 已规范化的 URL（可选，已计算过时传入以免重复规范化）
 
         Returns:
             缓存结果，如果不存在或无效则返回 None
@@ -105,7 +138,8 @@ class MessageHandler:
         if not self.enable_cache:
             return None
 
-        normalized_url = self.analyzer.normalize_url(url)
+        if normalized_url is None:
+            normalized_url = self.analyzer.normalize_url(url)
         cached_result = self.cache_manager.get(normalized_url)
 
         # 缓存管理器返回的是内层的 result 字典，格式为：
@@ -132,18 +166,22 @@ class MessageHandler:
                     screenshot = self._load_screenshot_from_cache(normalized_url)
                     if screenshot:
                         logger.info(
-                            f"从磁盘加载缓存截图成功: {normalized_url}, 大小: {len(screenshot)} 字节"
+                            "从磁盘加载缓存截图成功: %s, 大小: %s 字节",
+                            normalized_url,
+                            len(screenshot),
                         )
                     else:
                         logger.warning(
-                            f"缓存标记有截图，但磁盘文件不存在: {normalized_url}"
+                            "缓存标记有截图，但磁盘文件不存在: %s", normalized_url
                         )
                 else:
                     logger.info(
-                        f"使用内存中的缓存截图: {normalized_url}, 大小: {len(screenshot)} 字节"
+                        "使用内存中的缓存截图: %s, 大小: %s 字节",
+                        normalized_url,
+                        len(screenshot),
                     )
             else:
-                logger.info(f"缓存中无截图标记: {normalized_url}")
+                logger.info("缓存中无截图标记: %s", normalized_url)
 
             # 返回标准格式
             return {
@@ -155,45 +193,44 @@ class MessageHandler:
 
         return cached_result
 
-    def _init_semaphore(self):
-        """初始化并发控制信号量"""
-        import asyncio
-
-        self.concurrency_semaphore = asyncio.Semaphore(self.max_concurrency)
-        logger.info(f"初始化并发控制信号量，最大并发数: {self.max_concurrency}")
+    def _get_concurrency_semaphore(self) -> asyncio.Semaphore:
+        """获取并发控制信号量，不存在时创建"""
+        if self.concurrency_semaphore is None:
+            self.concurrency_semaphore = asyncio.Semaphore(self.max_concurrency)
+            logger.info("初始化并发控制信号量，最大并发数: %s", self.max_concurrency)
+        return self.concurrency_semaphore
 
-    async def _acquire_concurrency_slot(self):
-        """获取并发槽位"""
-        if self.concurrency_semaphore:
-            await self.concurrency_semaphore.acquire()
-            logger.debug(
-                f"获取并发槽位成功，当前可用: {self.concurrency_semaphore._value}"
-            )
-
-    def _release_concurrency_slot(self):
-        """释放并发槽位"""
-        if self.concurrency_semaphore:
-            self.concurrency_semaphore.release()
-            logger.debug(f"释放并发槽位，当前可用: {self.concurrency_semaphore._value}")
-
-    def update_cache(self, url: str, result: dict, content: str = None):
+    def update_cache(
+        self,
+        url: str,
+        result: dict,
+        content: str = None,
+        normalized_url: str | None = None,
+    ):
         """更新指定 URL 的缓存
 
         Args:
             url: 网页 URL
             result: 分析结果
             content: 网页内容（可选，用于内容哈希缓存）
+            normalized_url: 已规范化的 URL（可选，已计算过时传入以免重复规范化）
         """
         if not self.enable_cache:
             return
 
-        normalized_url = self.analyzer.normalize_url(url)
+        if normalized_url is None:
+            normalized_url = self.analyzer.normalize_url(url)
 
         if content:
             self.cache_manager.set_with_content_hash(normalized_url, result, content)
         else:
             self.cache_manager.set(normalized_url, result)
 
+        # 同步刷新截图内存缓存，避免之后读到旧截图
+        screenshot = result.get("screenshot")
+        if isinstance(screenshot, bytes) and screenshot:
+            self.screenshot_temp_manager.put_to_memory(normalized_url, screenshot)
+
     async def process_single_url(
         self,
         event: AstrMessageEvent,
@@ -220,89 +257,90 @@ class MessageHandler:
         Returns:
             分析结果字典
         """
-        # 获取并发槽位
-        await self._acquire_concurrency_slot()
+        # 获取并发槽位，离开时自动释放
+        async with self._get_concurrency_semaphore():
+            try:
+                # screenshot_only 模式：跳过网页抓取和分析，直接截图
+                if self.send_content_type == "screenshot_only":
+                    return await self._process_screenshot_only(url, analyzer)
 
-        try:
-            # screenshot_only 模式：跳过网页抓取和分析，直接截图
-            if self.send_content_type == "screenshot_only":
-                return await self._process_screenshot_only(url, analyzer)
+                # 1. 检查缓存（规范化 URL 只计算一次，供缓存读写共用）
+                normalized_url = (
+                    self.analyzer.normalize_url(url) if self.enable_cache else None
+                )
+                cached_result = self.check_cache(url, normalized_url)
+                if cached_result:
+                    logger.info("使用 URL 缓存结果: %s", url)
+                    return cached_result
+
+                # 使用异步上下文管理器确保所有操作都在同一个 HTTP 客户端中完成
+                async with analyzer:
+                    # 2. 抓取网页内容
+                    html = await analyzer.fetch_webpage(url)
+                    if not html:
+                        error_msg = ErrorHandler.handle_error(
+                            ErrorType.NETWORK_ERROR, Exception("无法获取网页内容"), url
+                        )
+                        return {
+                            "url": url,
+                            "result": error_msg,
+                            "screenshot": None,
+                            "has_screenshot": False,
+                        }
 
-            # 1. 检查缓存
-            cached_result = self.check_cache(url)
-            if cached_result:
-                logger.info(f"使用 URL 缓存结果: {url}")
-                return cached_result
+                    # 3. 提取结构化内容
+                    content_data = analyzer.extract_content(html, url)
+                    if not content_data:
+                        error_msg = ErrorHandler.handle_error(
+                            ErrorType.PARSING_ERROR, Exception("无法解析网页内容"), url
+                        )
+                        return {
+                            "url": url,
+                            "result": error_msg,
+                            "screenshot": None,
+                            "has_screenshot": False,
+                        }
 
-            # 使用异步上下文管理器确保所有操作都在同一个 HTTP 客户端中完成
-            async with analyzer:
-                # 2. 抓取网页内容
-                html = await analyzer.fetch_webpage(url)
-                if not html:
-                    error_msg = ErrorHandler.handle_error(
-                        ErrorType.NETWORK_ERROR, Exception("无法获取网页内容"), url
+                    # 4. 调用 LLM 进行分析
+                    analysis_result = await self._analyze_content(
+                        event, content_data, llm_analyzer, enable_translation
                     )
-                    return {
-                        "url": url,
-                        "result": error_msg,
-                        "screenshot": None,
-                        "has_screenshot": False,
-                    }
 
-                # 3. 提取结构化内容
-                content_data = analyzer.extract_content(html, url)
-                if not content_data:
-                    error_msg = ErrorHandler.handle_error(
-                        ErrorType.PARSING_ERROR, Exception("无法解析网页内容"), url
+                    # 5. 提取特定内容
+                    if enable_specific_extraction and extract_types:
+                        analysis_result = await self._extract_and_add_specific_content(
+                            analysis_result, html, url, extract_types
+                        )
+
+                    # 6. 生成截图
+                    screenshot = await self._generate_screenshot(
+                        analyzer, url, analysis_result
                     )
-                    return {
+
+                    # 7. 准备结果数据
+                    result_data = {
                         "url": url,
-                        "result": error_msg,
-                        "screenshot": None,
-                        "has_screenshot": False,
+                        "result": analysis_result,
+                        "screenshot": screenshot,
+                        "has_screenshot": screenshot is not None,
                     }
 
-                # 4. 调用 LLM 进行分析
-                analysis_result = await self._analyze_content(
-                    event, content_data, llm_analyzer, enable_translation
-                )
-
-                # 5. 提取特定内容
-                if enable_specific_extraction and extract_types:
-                    analysis_result = await self._extract_and_add_specific_content(
-                        analysis_result, html, url, extract_types
+                    # 8. 更新缓存
+                    self.update_cache(
+                        url, result_data, content_data["content"], normalized_url
                     )
 
-                # 6. 生成截图
-                screenshot = await self._generate_screenshot(
-                    analyzer, url, analysis_result
-                )
-
-                # 7. 准备结果数据
-                result_data = {
+                    return result_data
+            except Exception as e:
+                error_type = ErrorHandler.get_error_type(e)
+                error_msg = ErrorHandler.handle_error(error_type, e, url)
+                return {
                     "url": url,
-                    "result": analysis_result,
-                    "screenshot": screenshot,
-                    "has_screenshot": screenshot is not None,
+                    "result": error_msg,
+                    "screenshot": None,
+                    "has_screenshot": False,
                 }
 
-                # 8. 更新缓存
-                self.update_cache(url, result_data, content_data["content"])
-
-                return result_data
-        except Exception as e:
-            error_type = ErrorHandler.get_error_type(e)
-            error_msg = ErrorHandler.handle_error(error_type, e, url)
-            return {
-                "url": url,
-                "result": error_msg,
-                "screenshot": None,
-                "has_screenshot": False,
-            }
-        finally:
-            # 释放并发槽位
-            self._release_concurrency_slot()
-
     async def _process_screenshot_only(self, url: str, analyzer: WebAnalyzer) -> dict:
         """处理 screenshot_only 模式的 URL，只生成截图，不抓取和分析网页内容
 
@@ -314,16 +352,20 @@ class MessageHandler:
             包含截图的结果字典
         """
         try:
-            # 检查是否有 screenshot_only 模式的缓存
+            # screenshot_only 模式使用单独的缓存键，只规范化一次
+            cache_key = None
             if self.enable_cache:
                 normalized_url = self.analyzer.normalize_url(url)
                 cache_key = f"{normalized_url}_screenshot_only"
+
+            # 检查是否有 screenshot_only 模式的缓存
+            if cache_key:
                 cached_result = self.cache_manager.get(cache_key)
 
                 if cached_result and isinstance(cached_result, dict):
                     screenshot = cached_result.get("screenshot")
                     if isinstance(screenshot, bytes):
-                        logger.info(f"使用 screenshot_only 模式缓存: {url}")
+                        logger.info("使用 screenshot_only 模式缓存: %s", url)
                         return {
                             "url": url,
                             "result": "截图模式",
@@ -331,9 +373,9 @@ class MessageHandler:
                             "has_screenshot": True,
                         }
                     # 尝试从磁盘加载
-                    screenshot = self._load_screenshot_from_cache(cache_key)
+                    screenshot = await self._load_screenshot_from_cache_async(cache_key)
                     if screenshot:
-                        logger.info(f"从磁盘加载 screenshot_only 缓存: {url}")
+                        logger.info("从磁盘加载 screenshot_only 缓存: %s", url)
                         return {
                             "url": url,
                             "result": "截图模式",
@@ -343,7 +385,7 @@ class MessageHandler:
 
             # 没有缓存，直接生成截图
             logger.info(
-                f"screenshot_only 模式：直接生成截图，跳过网页抓取和分析: {url}"
+                "screenshot_only 模式：直接生成截图，跳过网页抓取和分析: %s", url
             )
 
             screenshot = await self._generate_screenshot_for_only_mode(analyzer, url)
@@ -357,10 +399,8 @@ class MessageHandler:
                 }
 
                 # 更新缓存（使用单独的缓存键）
-                if self.enable_cache:
-                    normalized_url = self.analyzer.normalize_url(url)
-                    cache_key = f"{normalized_url}_screenshot_only"
-                    self.update_cache(cache_key, result_data)
+                if cache_key:
+                    self.update_cache(cache_key, result_data, normalized_url=cache_key)
 
                 return result_data
             else:
@@ -422,11 +462,15 @@ class MessageHandler:
                         screenshot, tuple(self.crop_area)
                     )
                     logger.info(
-                        f"screenshot_only 模式截图裁剪成功: {url}, 裁剪区域: {self.crop_area}"
+                        "screenshot_only 模式截图裁剪成功: %s, 裁剪区域: %s",
+                        url,
+                        self.crop_area,
                     )
                 except Exception as crop_error:
                     logger.warning(
-                        f"screenshot_only 模式截图裁剪失败: {url}, 错误: {crop_error}, 使用原始截图"
+                        "screenshot_only 模式截图裁剪失败: %s, 错误: %s, 使用原始截图",
+                        url,
+                        crop_error,
                     )
 
             return screenshot
@@ -526,33 +570,33 @@ class MessageHandler:
             if not specific_content:
                 return analysis_result
 
-            # 在分析结果中添加特定内容
-            specific_content_str = "\n\n**特定内容提取**\n"
+            # 在分析结果中添加特定内容，各段收集后一次性拼接
+            parts = ["\n\n**特定内容提取**\n"]
 
             # 添加图片链接
-            if "images" in specific_content and specific_content["images"]:
-                specific_content_str += (
-                    f"\n📷 图片链接 ({len(specific_content['images'])}):\n"
-                )
-                for img in specific_content["images"]:
+            images = specific_content.get("images")
+            if images:
+                parts.append(f"\n📷 图片链接 ({len(images)}):\n")
+                for img in images[:_MAX_LISTED_IMAGES]:
                     img_url = img.get("url", "")
                     alt_text = img.get("alt", "")
                     if alt_text:
-                        specific_content_str += f"- {img_url} (alt: {alt_text})\n"
+                        parts.append(f"- {img_url} (alt: {alt_text})\n")
                     else:
-                        specific_content_str += f"- {img_url}\n"
+                        parts.append(f"- {img_url}\n")
 
             # 添加相关链接
-            if "links" in specific_content and specific_content["links"]:
-                specific_content_str += (
-                    f"\n🔗 相关链接 ({len(specific_content['links'])}):\n"
+            links = specific_content.get("links")
+            if links:
+                parts.append(f"\n🔗 相关链接 ({len(links)}):\n")
+                parts.extend(
+                    f"- [{link['text']}]({link['url']})\n"
+                    for link in links[:_MAX_LISTED_LINKS]
                 )
-                for link in specific_content["links"][:5]:
-                    specific_content_str += f"- [{link['text']}]({link['url']})\n"
 
-            return analysis_result + specific_content_str
+            return analysis_result + "".join(parts)
         except Exception as e:
-            logger.warning(f"特定内容提取失败: {url}, 错误: {e}")
+            logger.warning("特定内容提取失败: %s, 错误: %s", url, e)
             return analysis_result
 
     async def _generate_screenshot(
@@ -590,10 +634,10 @@ class MessageHandler:
                     screenshot = analyzer.crop_screenshot(
                         screenshot, tuple(self.crop_area)
                     )
-                    logger.info(f"截图裁剪成功: {url}, 裁剪区域: {self.crop_area}")
+                    logger.info("截图裁剪成功: %s, 裁剪区域: %s", url, self.crop_area)
                 except Exception as crop_error:
                     logger.warning(
-                        f"截图裁剪失败: {url}, 错误: {crop_error}, 使用原始截图"
+                        "截图裁剪失败: %s, 错误: %s, 使用原始截图", url, crop_error
                     )
 
             return screenshot
@@ -617,35 +661,8 @@ class MessageHandler:
             logger.info("没有分析结果，不发送消息")
             return
 
-        # 检查是否所有结果都是错误结果
-        # ErrorHandler 输出的错误消息总是以 '❌' 开头，通过前缀匹配避免误判
-        all_errors = True
-        for result in analysis_results:
-            # 在 screenshot_only 模式下，只要 has_screenshot=True 就认为成功
-            if self.send_content_type == "screenshot_only":
-                if result.get("has_screenshot", False):
-                    all_errors = False
-                    break
-                # 没有截图标记，继续检查下一个
-                continue
-
-            # analysis_only 模式：只要有非空文本且不是错误消息就认为成功
-            if self.send_content_type == "analysis_only":
-                result_text = result.get("result", "")
-                if result_text and not result_text.startswith("❌"):
-                    all_errors = False
-                    break
-                continue
-
-            # 其他模式：检查是否有截图
-            if result.get("screenshot"):
-                all_errors = False
-                break
-            # 检查分析结果文本是否为错误消息（ErrorHandler 输出以 '❌' 开头）
-            result_text = result.get("result", "")
-            if not result_text.startswith("❌"):
-                all_errors = False
-                break
+        # 检查是否所有结果都是错误结果，遇到第一个成功结果即停止
+        all_errors = not self._has_successful_result(analysis_results)
 
         if all_errors:
             logger.info("所有 URL 分析失败，不发送消息")
@@ -682,6 +699,36 @@ class MessageHandler:
             logger.error(f"发送分析结果失败: {e}")
             yield event.plain_result(f"❌ 发送分析结果失败: {str(e)}")
 
+    def _has_successful_result(self, analysis_results: list) -> bool:
+        """判断分析结果中是否至少有一个成功结果
+
+        ErrorHandler 输出的错误消息总是以 '❌' 开头，通过前缀匹配避免误判。
+        发送模式在循环外判断一次，各模式下先检查开销最小的条件。
+
+        Args:
+            analysis_results: 分析结果列表
+
+        Returns:
+            是否存在成功结果
+        """
+        # screenshot_only 模式：只要 has_screenshot=True 就认为成功
+        if self.send_content_type == "screenshot_only":
+            return any(r.get("has_screenshot", False) for r in analysis_results)
+
+        # analysis_only 模式：只要有非空文本且不是错误消息就认为成功
+        if self.send_content_type == "analysis_only":
+            for result in analysis_results:
+                result_text = result.get("result", "")
+                if result_text and not result_text.startswith("❌"):
+                    return True
+            return False
+
+        # 其他模式：有截图即成功，否则检查分析结果文本是否为错误消息
+        return any(
+            r.get("screenshot") or not r.get("result", "").startswith("❌")
+            for r in analysis_results
+        )
+
     def _is_group_message(self, event: AstrMessageEvent) -> bool:
         """判断消息是否为群聊消息
 
@@ -713,97 +760,106 @@ class MessageHandler:
 
     async def _prepare_screenshots_for_send(
         self, analysis_results: list
-    ) -> list[str | None]:
-        """准备用于发送的截图文件路径
+    ) -> list[Image | None]:
+        """准备用于发送的截图图片组件
 
-        将截图数据（从内存、缓存文件或新生成的）保存为临时图片文件。
+        截图数据（从内存、缓存文件或新生成的）直接构造为图片组件，
+        仅在当前 AstrBot 不支持字节图片时才写入临时文件。
 
         Args:
             analysis_results: 分析结果列表
 
         Returns:
-            临时图片文件路径列表
+            图片组件列表，无截图的结果对应 None
         """
-        temp_paths = []
+        # 各结果的缓存读取与图片构造互不依赖，并发执行；gather 按输入顺序返回
+        return list(
+            await asyncio.gather(
+                *(self._prepare_one_screenshot(r) for r in analysis_results)
+            )
+        )
 
-        for result_data in analysis_results:
-            url = result_data.get("url", "")
-            screenshot = result_data.get("screenshot")
-            has_screenshot = result_data.get("has_screenshot", False)
+    async def _prepare_one_screenshot(self, result_data: dict) -> Image | None:
+        """准备单个分析结果的截图图片组件
 
-            # 如果没有截图，跳过
-            if not has_screenshot:
-                temp_paths.append(None)
-                continue
+        Args:
+            result_data: 分析结果字典
 
-            # 如果有截图数据（bytes），创建临时文件
-            if isinstance(screenshot, bytes) and len(screenshot) > 0:
-                temp_path = await self._create_temp_screenshot_file(url, screenshot)
-                temp_paths.append(temp_path)
-            else:
-                # 尝试从缓存文件加载
-                temp_path = await self._load_screenshot_from_cache_to_temp(url)
-                temp_paths.append(temp_path)
+        Returns:
+            图片组件，无截图或失败返回None
+        """
+        url = result_data.get("url", "")
+        screenshot = result_data.get("screenshot")
 
-        return temp_paths
+        # 如果没有截图，跳过
+        if not result_data.get("has_screenshot", False):
+            return None
 
-    async def _create_temp_screenshot_file(
+        # 内存中没有截图数据（bytes）时，尝试从缓存文件加载
+        if not (isinstance(screenshot, bytes) and len(screenshot) > 0):
+            screenshot = await self._load_screenshot_from_cache_async(url)
+            if not screenshot:
+                return None
+
+        return await self._build_screenshot_image(url, screenshot)
+
+    async def _build_screenshot_image(
         self, url: str, screenshot: bytes
-    ) -> str | None:
-        """从截图数据创建临时图片文件
+    ) -> Image | None:
+        """由截图数据构造图片组件
 
         Args:
             url: 网页URL
             screenshot: 截图二进制数据
 
         Returns:
-            临时文件路径，失败返回None
+            图片组件，失败返回None
         """
-        import hashlib
-
         try:
-            # 生成临时文件名
-            url_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
-            ext = f".{self.screenshot_format}"
-            temp_path = os.path.join(
-                self.screenshot_temp_manager.temp_dir, f"{url_hash}{ext}"
-            )
-
-            # 确保目录存在
-            os.makedirs(self.screenshot_temp_manager.temp_dir, exist_ok=True)
-
-            # 写入临时文件
-            with open(temp_path, "wb") as f:
-                f.write(screenshot)
-
-            logger.debug(f"创建临时截图文件: {temp_path}, 大小: {len(screenshot)} 字节")
-            return temp_path
+            if _IMAGE_FROM_BYTES:
+                return Image.fromBytes(screenshot)
 
+            # 旧版本只能通过文件路径发送图片
+            temp_path = await self._create_temp_screenshot_file(url, screenshot)
+            return Image.fromFileSystem(temp_path) if temp_path else None
         except Exception as e:
-            logger.error(f"创建临时截图文件失败: {url}, 错误: {e}")
+            logger.error(f"构造截图图片组件失败: {url}, 错误: {e}")
             return None
 
-    async def _load_screenshot_from_cache_to_temp(self, url: str) -> str | None:
-        """从缓存加载截图并创建临时文件
+    async def _create_temp_screenshot_file(
+        self, url: str, screenshot: bytes
+    ) -> str | None:
+        """从截图数据创建临时图片文件
 
         Args:
             url: 网页URL
+            screenshot: 截图二进制数据
 
         Returns:
             临时文件路径，失败返回None
         """
-
         try:
-            # 从缓存加载截图
-            screenshot = self._load_screenshot_from_cache(url)
-            if not screenshot:
-                return None
+            # 生成临时文件路径
+            temp_path = (
+                f"{self._temp_path_prefix}{_temp_screenshot_stem(url)}"
+                f"{self._temp_path_suffix}"
+            )
+
+            # 确保目录存在
+            if not self._temp_dir_ready:
+                os.makedirs(self.screenshot_temp_manager.temp_dir, exist_ok=True)
+                self._temp_dir_ready = True
+
+            # 写入临时文件
+            await asyncio.to_thread(_write_blob, temp_path, screenshot)
 
-            # 创建临时文件
-            return await self._create_temp_screenshot_file(url, screenshot)
+            logger.debug(
+                "创建临时截图文件: %s, 大小: %s 字节", temp_path, len(screenshot)
+            )
+            return temp_path
 
         except Exception as e:
-            logger.error(f"从缓存加载截图到临时文件失败: {url}, 错误: {e}")
+            logger.error(f"创建临时截图文件失败: {url}, 错误: {e}")
             return None
 
     async def _send_with_merge_forward(
@@ -819,19 +875,19 @@ class MessageHandler:
         Yields:
             消息结果
         """
-        # 准备所有截图的临时文件路径
-        temp_paths = await self._prepare_screenshots_for_send(analysis_results)
+        # 准备所有截图的图片组件
+        images = await self._prepare_screenshots_for_send(analysis_results)
 
         nodes = []
         sender_id = self._get_sender_id(event)
 
-        for i, (result_data, temp_path) in enumerate(
-            zip(analysis_results, temp_paths), 1
+        for i, (result_data, image_component) in enumerate(
+            zip(analysis_results, images), 1
         ):
             analysis_result = result_data.get("result")
 
-            # 检查是否有实际的截图数据（优先使用 temp_path 判断）
-            has_screenshot = temp_path is not None
+            # 检查是否有实际的截图数据（优先使用图片组件判断）
+            has_screenshot = image_component is not None
 
             # 构建消息内容列表
             content_list = []
@@ -860,12 +916,8 @@ class MessageHandler:
             )
 
             if should_include_screenshot_in_node:
-                try:
-                    image_component = Image.fromFileSystem(temp_path)
-                    content_list.append(image_component)
-                    logger.info(f"将截图合并到节点中: {temp_path}")
-                except Exception as e:
-                    logger.error(f"添加截图到节点失败: {e}")
+                content_list.append(image_component)
+                logger.info("将截图合并到节点中: %s", result_data.get("url", ""))
 
             # 创建节点
             if content_list:
@@ -881,7 +933,7 @@ class MessageHandler:
             try:
                 merge_forward_message = Nodes(nodes)
                 yield event.chain_result([merge_forward_message])
-                logger.info(f"使用合并转发发送了 {len(nodes)} 个节点")
+                logger.info("使用合并转发发送了 %s 个节点", len(nodes))
 
                 # 如果未启用 merge_forward_include_screenshot，独立发送截图
                 # 逻辑：
@@ -889,28 +941,26 @@ class MessageHandler:
                 # - both：截图未合并到节点中，独立发送
                 # - analysis_only：不需要截图
                 logger.info(
-                    f"merge_forward_include_screenshot 配置: {self.merge_forward_include_screenshot}"
+                    "merge_forward_include_screenshot 配置: %s",
+                    self.merge_forward_include_screenshot,
                 )
                 if not self.merge_forward_include_screenshot:
-                    for i, (temp_path, result_data) in enumerate(
-                        zip(temp_paths, analysis_results), 1
+                    for i, (image_component, result_data) in enumerate(
+                        zip(images, analysis_results), 1
                     ):
                         # 判断是否需要独立发送截图
                         has_screenshot = result_data.get("has_screenshot", False)
                         should_send_screenshot = (
                             has_screenshot
-                            and temp_path is not None
+                            and image_component is not None
                             and self.send_content_type
                             == "both"  # only both mode sends screenshot independently
                         )
 
                         if should_send_screenshot:
                             try:
-                                image_component = Image.fromFileSystem(temp_path)
                                 yield event.chain_result([image_component])
-                                logger.info(
-                                    f"独立发送截图 {i}/{len(temp_paths)}: {temp_path}"
-                                )
+                                logger.info("独立发送截图 %s/%s", i, len(images))
                             except Exception as e:
                                 logger.error(f"独立发送截图 {i} 失败: {e}")
 
@@ -954,27 +1004,55 @@ class MessageHandler:
     def _load_screenshot_from_cache(self, url: str) -> bytes | None:
         """从缓存加载截图数据
 
+        两级查找：先查截图内存 LRU 缓存，未命中再读取 CacheManager 写入的
+        磁盘截图文件，并放入内存缓存，热门 URL 不再重复读盘。
+
+        须在事件循环线程中调用：ScreenshotTempManager 的内存缓存没有加锁。
+
         Args:
-            url: 网页URL
+            url: 缓存键（规范化后的 URL）
 
         Returns:
             截图二进制数据，如果不存在则返回None
         """
         try:
-            # 获取缓存目录
-            cache_dir = self.cache_manager.cache_dir
-            import hashlib
+            # 1. 内存缓存
+            screenshot = self.screenshot_temp_manager.get_from_memory(url)
+            if screenshot is not None:
+                return screenshot
 
-            # 计算截图文件路径
-            url_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
-            screenshot_path = os.path.join(cache_dir, f"{url_hash}_screenshot.bin")
+            # 2. 磁盘缓存（文件名与 CacheManager 保存截图时一致）
+            screenshot = _read_blob(self.cache_manager.get_screenshot_file_path(url))
+            if screenshot:
+                self.screenshot_temp_manager.put_to_memory(url, screenshot)
+            return screenshot
+        except Exception as e:
+            logger.error(f"从缓存加载截图失败: {url}, 错误: {e}")
+            return None
 
-            # 检查文件是否存在
-            if os.path.exists(screenshot_path):
-                with open(screenshot_path, "rb") as f:
-                    return f.read()
+    async def _load_screenshot_from_cache_async(self, url: str) -> bytes | None:
+        """从缓存加载截图数据（异步版本）
 
-            return None
+        内存缓存的查找与写入留在事件循环中执行，只把磁盘读取放到线程池，
+        多个结果并发加载时不会在工作线程中同时修改 ScreenshotTempManager。
+
+        Args:
+            url: 缓存键（规范化后的 URL）
+
+        Returns:
+            截图二进制数据，如果不存在则返回None
+        """
+        try:
+            screenshot = self.screenshot_temp_manager.get_from_memory(url)
+            if screenshot is not None:
+                return screenshot
+
+            screenshot = await asyncio.to_thread(
+                _read_blob, self.cache_manager.get_screenshot_file_path(url)
+            )
+            if screenshot:
+                self.screenshot_temp_manager.put_to_memory(url, screenshot)
+            return screenshot
         except Exception as e:
             logger.error(f"从缓存加载截图失败: {url}, 错误: {e}")
             return None
@@ -991,20 +1069,19 @@ class MessageHandler:
         Yields:
             消息结果
         """
-        # 准备所有截图的临时文件路径
-        temp_paths = await self._prepare_screenshots_for_send(analysis_results)
+        # 准备所有截图的图片组件
+        images = await self._prepare_screenshots_for_send(analysis_results)
 
-        for i, (result_data, temp_path) in enumerate(
-            zip(analysis_results, temp_paths), 1
+        for i, (result_data, image_component) in enumerate(
+            zip(analysis_results, images), 1
         ):
             has_screenshot = result_data.get("has_screenshot", False)
 
-            if has_screenshot and temp_path:
+            if has_screenshot and image_component:
                 try:
-                    image_component = Image.fromFileSystem(temp_path)
                     yield event.chain_result([image_component])
                     logger.info(
-                        f"screenshot_only 模式发送截图 {i}/{len(analysis_results)}: {temp_path}"
+                        "screenshot_only 模式发送截图 %s/%s", i, len(analysis_results)
                     )
                 except Exception as e:
                     logger.error(f"screenshot_only 模式发送截图 {i} 失败: {e}")
@@ -1019,11 +1096,11 @@ class MessageHandler:
         Yields:
             消息结果
         """
-        # 准备所有截图的临时文件路径
-        temp_paths = await self._prepare_screenshots_for_send(analysis_results)
+        # 准备所有截图的图片组件
+        images = await self._prepare_screenshots_for_send(analysis_results)
 
-        for i, (result_data, temp_path) in enumerate(
-            zip(analysis_results, temp_paths), 1
+        for i, (result_data, image_component) in enumerate(
+            zip(analysis_results, images), 1
         ):
             screenshot = result_data.get("screenshot")
             analysis_result = result_data.get("result")
@@ -1046,10 +1123,9 @@ class MessageHandler:
                     # 有截图标记但数据可能未加载
                     has_screenshot = True
 
-            if has_screenshot and temp_path:
+            if has_screenshot and image_component:
                 try:
-                    image_component = Image.fromFileSystem(temp_path)
                     yield event.chain_result([image_component])
-                    logger.info(f"发送分析结果和截图: {temp_path}")
+                    logger.info("发送分析结果和截图: %s", result_data.get("url", ""))
                 except Exception as e:
                     logger.error(f"发送截图失败: {e}")
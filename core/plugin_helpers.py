@@ -22,12 +22,12 @@ class PluginHelpers:
     """插件辅助方法类，提供静态辅助方法"""
 
     @staticmethod
-    def is_group_blacklisted(group_id: str, group_blacklist: list) -> bool:
+    def is_group_blacklisted(group_id: str, group_blacklist: set[str]) -> bool:
         """检查指定群聊是否在黑名单中
 
         Args:
             group_id: 群聊ID
-            group_blacklist: 群聊黑名单列表
+            group_blacklist: 群聊黑名单集合
 
         Returns:
             是否在黑名单中
@@ -60,14 +60,14 @@ class PluginHelpers:
 
     @staticmethod
     def is_domain_allowed(
-        url: str, allowed_domains: list, blocked_domains: list
+        url: str, allowed_domains: frozenset, blocked_domains: frozenset
     ) -> bool:
         """检查指定URL的域名是否允许访问
 
         Args:
             url: 网页URL
-            allowed_domains: 允许的域名列表
-            blocked_domains: 禁止的域名列表
+            allowed_domains: 规范化后的允许域名集合
+            blocked_domains: 规范化后的禁止域名集合
 
         Returns:
             是否允许访问
@@ -0,0 +1,81 @@
+"""
+会话 LLM 提供商 ID 缓存模块
+
+插件与 LLM 分析器共用同一份缓存，减少对 get_current_chat_provider_id 的重复查询。
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from astrbot.api import logger
+
+# 缓存有效期（秒），过期后先返回旧值再后台刷新
+_PROVIDER_CACHE_TTL_S = 60.0
+
+# 最多缓存的会话数，超出时淘汰最早写入的会话
+_PROVIDER_CACHE_MAX_SIZE = 256
+
+
+class ProviderIdCache:
+    """会话 unified_msg_origin -> LLM 提供商 ID 的有界缓存
+
+    采用 stale-while-revalidate 策略：缓存未过期时直接返回；
+    已过期时先返回旧值并在后台刷新，只有会话首次查询时才需要等待。
+    """
+
+    def __init__(self, context: Any):
+        """初始化缓存
+
+        Args:
+            context: AstrBot 上下文对象
+        """
+        self.context = context
+        # umo -> (provider_id, 过期时间)，按写入顺序排列便于淘汰
+        self._entries: dict[str, tuple[str, float]] = {}
+        # 进行中的后台刷新任务，同一会话只保留一个
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+
+    async def get(self, umo: str) -> str | None:
+        """获取会话当前使用的 LLM 提供商 ID
+
+        Args:
+            umo: 会话的 unified_msg_origin
+
+        Returns:
+            LLM 提供商 ID，获取失败时为 None
+        """
+        entry = self._entries.get(umo)
+        if entry is None:
+            return await self._refresh(umo)
+
+        provider_id, expiry = entry
+        if expiry <= time.monotonic() and umo not in self._refresh_tasks:
+            self._refresh_tasks[umo] = asyncio.create_task(self._refresh(umo))
+        return provider_id
+
+    async def _refresh(self, umo: str) -> str | None:
+        """查询会话当前的 LLM 提供商 ID 并写入缓存"""
+        try:
+            provider_id = await self.context.get_current_chat_provider_id(umo=umo)
+            if provider_id:
+                self._store(umo, provider_id)
+            return provider_id
+        except Exception as e:
+            logger.error(f"获取LLM提供商ID失败: {e}")
+            return None
+        finally:
+            self._refresh_tasks.pop(umo, None)
+
+    def _store(self, umo: str, provider_id: str) -> None:
+        """写入缓存，超出容量时淘汰最早写入的会话"""
+        self._entries.pop(umo, None)
+        if len(self._entries) >= _PROVIDER_CACHE_MAX_SIZE:
+            del self._entries[next(iter(self._entries))]
+        self._entries[umo] = (provider_id, time.monotonic() + _PROVIDER_CACHE_TTL_S)
+
+    def cancel_refreshes(self) -> None:
+        """取消所有进行中的后台刷新任务，插件卸载时调用"""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        self._refresh_tasks.clear()
@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import hashlib
 import os
 import time
 from collections import OrderedDict
@@ -159,8 +160,6 @@ class ScreenshotTempManager:
         Returns:
             URL 的 MD5 哈希值
         """
-        import hashlib
-
         return hashlib.md5(url.encode("utf-8")).hexdigest()
 
     def _update_lru_cache(self, url_hash: str):
@@ -206,6 +205,12 @@ class ScreenshotTempManager:
         """
         url_hash = self._get_url_hash(url)
 
+        # 已存在时只更新数据并标记为最近使用
+        if url_hash in self._memory_cache:
+            self._memory_cache[url_hash] = screenshot
+            self._update_lru_cache(url_hash)
+            return
+
         # 确保缓存不超过最大容量
         self._ensure_cache_size()
 
@@ -5,10 +5,141 @@
 """
 
 import os
+import re
 import sys
+from collections.abc import Iterable
 from datetime import datetime
 from urllib.parse import urlparse
 
+# 支持的内容提取类型
+_VALID_EXTRACT_TYPES = frozenset(
+    {
+        "title",
+        "content",
+        "images",
+        "links",
+        "meta",
+        "code",
+        "code_blocks",
+        "tables",
+        "lists",
+        "videos",
+        "audios",
+        "quotes",
+        "headings",
+        "paragraphs",
+        "buttons",
+        "forms",
+    }
+)
+
+# 始终需要提取的基础类型
+_MINIMAL_EXTRACT_TYPES = ("title", "content")
+
+
+# 内容类型检测规则：按顺序匹配，排在前面的类型优先
+_CONTENT_TYPE_RULES: dict[str, tuple[str, ...]] = {
+    "新闻资讯": ("新闻", "资讯", "报道", "快讯", "时事", "热点", "头条"),
+    "教程指南": ("教程", "指南", "学习", "如何", "步骤", "方法", "技巧", "实战"),
+    "个人博客": ("博客", "日志", "随笔", "感悟", "分享", "思考", "心得"),
+    "产品介绍": ("产品", "服务", "功能", "特性", "优势", "价格", "购买", "下载"),
+    "技术文档": ("文档", "API", "SDK", "开发", "技术", "编程", "代码", "框架", "库"),
+    "学术论文": (
+        "论文",
+        "研究",
+        "实验",
+        "结果",
+        "结论",
+        "摘要",
+        "引言",
+        "方法",
+        "分析",
+    ),
+    "娱乐资讯": ("娱乐", "明星", "影视", "音乐", "综艺", "游戏", "动漫", "追星"),
+    "体育新闻": ("体育", "足球", "篮球", "赛事", "比赛", "运动员", "健身", "运动"),
+    "教育资讯": ("教育", "培训", "学校", "课程", "招生", "升学", "考试", "留学"),
+    "商业分析": ("商业", "分析", "市场", "行业", "趋势", "报告", "数据", "调研"),
+}
+
+# 类型检测只取内容开头与结尾的片段，避免对超长正文逐类整体扫描；
+# 关键词通常出现在标题、导语或页脚，片段外的命中会被忽略，回退为默认类型
+_DETECT_HEAD_CHARS = 4096
+_DETECT_TAIL_CHARS = 2048
+
+
+def _compile_keywords(keywords: tuple[str, ...]) -> re.Pattern:
+    """将一组关键词编译为一条正则分支
+
+    纯中文关键词没有大小写之分，直接匹配原文；含英文字母的分支
+    （如 "API"、"SDK"）才启用 IGNORECASE，从而无需先对内容整体 lower()。
+    """
+    flags = re.IGNORECASE if any(k.lower() != k.upper() for k in keywords) else 0
+    return re.compile("|".join(map(re.escape, keywords)), flags)
+
+
+def _content_type_sample(content: str) -> str:
+    """截取用于类型检测的内容片段"""
+    if len(content) <= _DETECT_HEAD_CHARS + _DETECT_TAIL_CHARS:
+        return content
+    # 用换行分隔首尾片段，避免拼接处凑出原文中不存在的关键词
+    return content[:_DETECT_HEAD_CHARS] + "\n" + content[-_DETECT_TAIL_CHARS:]
+
+
+def compile_content_type_patterns(
+    rules: dict[str, tuple[str, ...]],
+) -> tuple[tuple[str, re.Pattern], ...]:
+    """将内容类型规则表预编译为 (类型, 正则) 元组，保持规则顺序
+
+    Args:
+        rules: 类型名 -> 关键词元组，排在前面的类型优先
+
+    Returns:
+        预编译后的检测规则
+    """
+    return tuple(
+        (type_name, _compile_keywords(keywords))
+        for type_name, keywords in rules.items()
+    )
+
+
+def match_content_type(
+    content: str, patterns: tuple[tuple[str, re.Pattern], ...], default: str
+) -> str:
+    """按预编译规则检测内容类型
+
+    Args:
+        content: 网页内容
+        patterns: compile_content_type_patterns 生成的检测规则
+        default: 未命中任何规则时返回的类型
+
+    Returns:
+        检测到的内容类型
+    """
+    sample = _content_type_sample(content)
+    for type_name, pattern in patterns:
+        if pattern.search(sample):
+            return type_name
+    return default
+
+
+# 每种类型的关键词预编译为一条正则分支，检测时每种类型只需扫描一次内容
+_CONTENT_TYPE_PATTERNS = compile_content_type_patterns(_CONTENT_TYPE_RULES)
+
+
+def _match_domain_suffix(domain: str, domain_set: frozenset[str]) -> bool:
+    """判断域名本身或其任一上级域名是否在集合中
+
+    与逐项检查 domain == d or domain.endswith("." + d) 等价，
+    但只需按域名层级做若干次集合查找，与列表长度无关。
+    """
+    domain = domain.lower().rstrip(".")
+    while True:
+        if domain in domain_set:
+            return True
+        _, sep, domain = domain.partition(".")
+        if not sep:
+            return False
+
 
 class WebAnalyzerUtils:
     """网页分析插件工具类
@@ -135,14 +266,8 @@ class WebAnalyzerUtils:
         if not domain_text:
             return []
 
-        # 分割文本并过滤空行，同时去除每个域名的首尾空白
-        domains = [
-            domain.strip()
-            for domain in domain_text.split("\n")
-            if domain.strip()  # 过滤空字符串
-        ]
-
-        return domains
+        # 分割文本并去除每个域名的首尾空白，每行只 strip 一次，再过滤空行
+        return [domain for domain in map(str.strip, domain_text.split("\n")) if domain]
 
     @staticmethod
     def parse_group_list(group_text: str) -> list[str]:
@@ -161,8 +286,7 @@ class WebAnalyzerUtils:
         """
         if not group_text:
             return []
-        groups = [group.strip() for group in group_text.split("\n") if group.strip()]
-        return groups
+        return [group for group in map(str.strip, group_text.split("\n")) if group]
 
     @staticmethod
     def parse_extract_types(extract_types_text: str) -> list[str]:
@@ -177,9 +301,9 @@ class WebAnalyzerUtils:
         if not extract_types_text:
             return []
         return [
-            extract_type.strip()
-            for extract_type in extract_types_text.split("\n")
-            if extract_type.strip()
+            extract_type
+            for extract_type in map(str.strip, extract_types_text.split("\n"))
+            if extract_type
         ]
 
     @staticmethod
@@ -192,28 +316,10 @@ class WebAnalyzerUtils:
         Returns:
             验证后的提取类型列表
         """
-        valid_types = [
-            "title",
-            "content",
-            "images",
-            "links",
-            "meta",
-            "code",
-            "code_blocks",
-            "tables",
-            "lists",
-            "videos",
-            "audios",
-            "quotes",
-            "headings",
-            "paragraphs",
-            "buttons",
-            "forms",
-        ]
         return [
             extract_type
             for extract_type in extract_types
-            if extract_type in valid_types
+            if extract_type in _VALID_EXTRACT_TYPES
         ]
 
     @staticmethod
@@ -226,8 +332,7 @@ class WebAnalyzerUtils:
         Returns:
             确保包含必要提取类型的列表
         """
-        minimal_types = ["title", "content"]
-        for minimal_type in minimal_types:
+        for minimal_type in _MINIMAL_EXTRACT_TYPES:
             if minimal_type not in extract_types:
                 extract_types.append(minimal_type)
         return extract_types
@@ -244,9 +349,47 @@ class WebAnalyzerUtils:
         """
         return extract_types
 
+    @staticmethod
+    def normalize_extract_types(extract_types_text: str) -> list[str]:
+        """解析提取类型配置，并在同一次遍历中完成验证和补全
+
+        结果与依次调用 parse_extract_types、validate_extract_types、
+        ensure_minimal_extract_types、add_required_extract_types 相同。
+
+        Args:
+            extract_types_text: 包含提取类型的多行文本字符串
+
+        Returns:
+            有效且包含必要类型的提取类型列表
+        """
+        # 空行 strip 后为空字符串，不在有效类型中，无需单独过滤
+        extract_types = [
+            extract_type
+            for extract_type in map(str.strip, (extract_types_text or "").split("\n"))
+            if extract_type in _VALID_EXTRACT_TYPES
+        ]
+        for minimal_type in _MINIMAL_EXTRACT_TYPES:
+            if minimal_type not in extract_types:
+                extract_types.append(minimal_type)
+        return extract_types
+
+    @staticmethod
+    def normalize_domain_set(domains: Iterable[str]) -> frozenset[str]:
+        """将域名列表规范化为集合（小写、去掉末尾的点）
+
+        应在配置加载或域名列表变更时调用一次，结果传给 is_domain_allowed。
+
+        Args:
+            domains: 配置中的域名列表
+
+        Returns:
+            规范化后的域名集合
+        """
+        return frozenset(domain.lower().rstrip(".") for domain in domains)
+
     @staticmethod
     def is_domain_allowed(
-        url: str, allowed_domains: list[str], blocked_domains: list[str]
+        url: str, allowed_domains: frozenset[str], blocked_domains: frozenset[str]
     ) -> bool:
         """检查指定URL的域名是否允许访问
 
@@ -260,16 +403,16 @@ class WebAnalyzerUtils:
 
         Args:
             url: 要检查的完整URL
-            allowed_domains: 允许访问的域名列表
-            blocked_domains: 禁止访问的域名列表
+            allowed_domains: 允许访问的域名集合（由 normalize_domain_set 生成）
+            blocked_domains: 禁止访问的域名集合（由 normalize_domain_set 生成）
 
         Returns:
             True表示允许访问，False表示禁止访问
 
         Example:
             >>> url = "https://example.com/page"
-            >>> allowed = ["example.com", "test.com"]
-            >>> blocked = ["spam.com"]
+            >>> allowed = WebAnalyzerUtils.normalize_domain_set(["example.com", "test.com"])
+            >>> blocked = WebAnalyzerUtils.normalize_domain_set(["spam.com"])
             >>> WebAnalyzerUtils.is_domain_allowed(url, allowed, blocked)
             True
         """
@@ -296,14 +439,14 @@ class WebAnalyzerUtils:
             return False
 
     @staticmethod
-    def _is_domain_blocked(domain: str, blocked_domains: list[str]) -> bool:
+    def _is_domain_blocked(domain: str, blocked_domains: frozenset[str]) -> bool:
         """检查域名是否被阻止
 
         使用后缀匹配，避免子字符串绕过（如 'evil.com' 不会误匹配 'notevil.com'）
 
         Args:
             domain: 要检查的域名（小写）
-            blocked_domains: 禁止的域名列表
+            blocked_domains: 规范化后的禁止域名集合
 
         Returns:
             True表示被阻止，False表示未被阻止
@@ -311,32 +454,24 @@ class WebAnalyzerUtils:
         if not blocked_domains:
             return False
 
-        domain = domain.lower().rstrip(".")
-        for blocked_domain in blocked_domains:
-            blocked = blocked_domain.lower().rstrip(".")
-            if domain == blocked or domain.endswith("." + blocked):
-                return True
-        return False
+        return _match_domain_suffix(domain, blocked_domains)
 
     @staticmethod
-    def _is_domain_allowed_in_list(domain: str, allowed_domains: list[str]) -> bool:
+    def _is_domain_allowed_in_list(
+        domain: str, allowed_domains: frozenset[str]
+    ) -> bool:
         """检查域名是否在允许列表中
 
         使用后缀匹配，确保子域名也能匹配（如 'sub.example.com' 匹配 'example.com'）
 
         Args:
             domain: 要检查的域名（小写）
-            allowed_domains: 允许的域名列表
+            allowed_domains: 规范化后的允许域名集合
 
         Returns:
             True表示在允许列表中，False表示不在
         """
-        domain = domain.lower().rstrip(".")
-        for allowed_domain in allowed_domains:
-            allowed = allowed_domain.lower().rstrip(".")
-            if domain == allowed or domain.endswith("." + allowed):
-                return True
-        return False
+        return _match_domain_suffix(domain, allowed_domains)
 
     @staticmethod
     def get_url_priority(url: str) -> int:
@@ -449,107 +584,9 @@ class WebAnalyzerUtils:
         Returns:
             检测到的内容类型
         """
-        content_lower = content.lower()
-
-        content_type_rules = WebAnalyzerUtils._get_content_type_rules()
-        return WebAnalyzerUtils._match_content_type(content_lower, content_type_rules)
+        return match_content_type(content, _CONTENT_TYPE_PATTERNS, "新闻资讯")
 
     @staticmethod
-    def _get_content_type_rules() -> dict[str, list[str]]:
+    def _get_content_type_rules() -> dict[str, tuple[str, ...]]:
         """获取内容类型检测规则"""
-        return {
-            "新闻资讯": ["新闻", "资讯", "报道", "快讯", "时事", "热点", "头条"],
-            "教程指南": [
-                "教程",
-                "指南",
-                "学习",
-                "如何",
-                "步骤",
-                "方法",
-                "技巧",
-                "实战",
-            ],
-            "个人博客": ["博客", "日志", "随笔", "感悟", "分享", "思考", "心得"],
-            "产品介绍": [
-                "产品",
-                "服务",
-                "功能",
-                "特性",
-                "优势",
-                "价格",
-                "购买",
-                "下载",
-            ],
-            "技术文档": [
-                "文档",
-                "API",
-                "SDK",
-                "开发",
-                "技术",
-                "编程",
-                "代码",
-                "框架",
-                "库",
-            ],
-            "学术论文": [
-                "论文",
-                "研究",
-                "实验",
-                "结果",
-                "结论",
-                "摘要",
-                "引言",
-                "方法",
-                "分析",
-            ],
-            "娱乐资讯": [
-                "娱乐",
-                "明星",
-                "影视",
-                "音乐",
-                "综艺",
-                "游戏",
-                "动漫",
-                "追星",
-            ],
-            "体育新闻": [
-                "体育",
-                "足球",
-                "篮球",
-                "赛事",
-                "比赛",
-                "运动员",
-                "健身",
-                "运动",
-            ],
-            "教育资讯": [
-                "教育",
-                "培训",
-                "学校",
-                "课程",
-                "招生",
-                "升学",
-                "考试",
-                "留学",
-            ],
-            "商业分析": [
-                "商业",
-                "分析",
-                "市场",
-                "行业",
-                "趋势",
-                "报告",
-                "数据",
-                "调研",
-            ],
-        }
-
-    @staticmethod
-    def _match_content_type(
-        content_lower: str, content_type_rules: dict[str, list[str]]
-    ) -> str:
-        """匹配内容类型"""
-        for content_type, keywords in content_type_rules.items():
-            if any(keyword in content_lower for keyword in keywords):
-                return content_type
-        return "新闻资讯"
+        return _CONTENT_TYPE_RULES
@@ -7,8 +7,19 @@ AstrBot 网页分析插件 - 重构版本
 本版本使用核心模块重构，遵循 PEP 8 规范。
 """
 
+import asyncio
+import json
+import os
 import re
+import time
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
+
+try:
+    import orjson  # 可选依赖，安装后用于加速 JSON 导出
+except ImportError:
+    orjson = None
 
 from astrbot.api import AstrBotConfig, logger
 from astrbot.api.event import AstrMessageEvent, filter
@@ -23,10 +34,192 @@ from .core.config_loader import ConfigLoader
 from .core.llm_analyzer import LLMAnalyzer
 from .core.message_handler import MessageHandler
 from .core.plugin_helpers import MessageHelpers, PluginHelpers
+from .core.provider_cache import ProviderIdCache
 from .core.result_formatter import ResultFormatter
 from .core.utils import WebAnalyzerUtils
 
 
+# 命令帮助文本（静态内容，模块加载时构建一次）
+_HELP_TEXT = """【网页分析插件命令帮助】
+
+📋 核心分析命令
+🔍 /网页分析 <URL1> <URL2>... - 手动分析指定网页链接
+   别名：/分析, /总结, /web, /analyze
+   示例：/网页分析 https://example.com
+
+📋 配置管理命令
+🛠️ /web_config - 查看当前插件配置
+   别名：/网页分析配置, /网页分析设置
+   示例：/web_config
+
+📋 缓存管理命令
+🗑️ /web_cache [clear] - 管理分析结果缓存
+   别名：/网页缓存, /清理缓存
+   选项：
+     - clear: 清空所有缓存
+   示例：/web_cache clear
+
+📋 群聊管理命令
+👥 /group_blacklist [add/remove/clear] <群号> - 管理群聊黑名单
+   别名：/群黑名单, /黑名单
+   选项：
+     - (空): 查看当前黑名单
+     - add <群号>: 添加群聊到黑名单
+     - remove <群号>: 从黑名单移除群聊
+     - clear: 清空黑名单
+   示例：/群黑名单 add 123456789
+
+📋 导出功能命令
+📤 /web_export - 导出分析结果
+   别名：/导出分析结果, /网页导出
+   示例：/web_export
+
+📋 浏览器管理命令
+🌐 /web_browser [uninstall] - 管理 Playwright 浏览器
+   别名：/浏览器管理, /网页浏览器
+   选项：
+     - (空): 查看浏览器状态
+     - uninstall: 卸载浏览器
+   示例：/web_browser uninstall
+
+📋 测试功能命令
+📋 /test_merge - 测试合并转发功能
+   别名：/测试合并转发, /测试转发
+   示例：/test_merge
+
+📋 帮助命令
+❓ /web_help - 显示本帮助信息
+   别名：/网页分析帮助, /网页分析命令
+   示例：/web_help
+
+💡 使用提示：
+- 所有命令支持Tab补全（如果客户端支持）
+- 命令参数支持提示功能
+- 可以自定义命令别名
+
+🔧 配置提示：
+- 在AstrBot管理面板中可以配置插件的各项功能
+- 支持自定义命令别名
+- 可以调整分析结果模板和显示方式
+- 启用「允许LLM传播」后，自动分析URL不会阻止LLM回复原始消息
+"""
+
+# 群聊黑名单修改后延迟写盘的时间（秒），期间的修改合并为一次保存
+_BLACKLIST_FLUSH_DELAY_S = 1.0
+
+# 导出文件名中域名的字符替换表（点号与端口冒号替换为下划线）
+_DOMAIN_TRANS = str.maketrans({".": "_", ":": "_"})
+
+# 分析模式与导出格式：元组保持展示顺序，frozenset 用于 O(1) 校验
+_VALID_MODES_DISPLAY = ("auto", "manual", "hybrid", "LLMTOOL")
+_VALID_MODES = frozenset(_VALID_MODES_DISPLAY)
+_SUPPORTED_FORMATS_DISPLAY = ("md", "markdown", "json", "txt")
+_SUPPORTED_FORMATS = frozenset(_SUPPORTED_FORMATS_DISPLAY)
+
+# 命令处理中复用的提示文本
+_MSG_BLACKLIST_EMPTY = "当前群聊黑名单为空"
+_MSG_BLACKLIST_ALREADY_EMPTY = "黑名单已为空"
+_MSG_NO_CACHED_RESULTS = "当前没有缓存的分析结果"
+_MSG_INVALID_URL = "无效的URL链接"
+_MSG_EXPORT_USAGE = "请提供要导出的URL链接和格式，例如：/web_export https://example.com md 或 /web_export all json"
+_MSG_LLMTOOL_DISABLED = "当前未启用网页分析工具模式"
+
+# 配置信息展示的固定头尾
+_CONFIG_TEXT_HEADER = "**网页分析插件配置信息**\n\n**基本设置**\n"
+_CONFIG_TEXT_FOOTER = "*提示: 如需修改配置，请在AstrBot管理面板中编辑插件配置*"
+
+
+def _is_failed_result(result: dict | None) -> bool:
+    """判断分析结果是否失败（无结果，或无截图且文本为 '❌' 开头的错误消息）"""
+    if result is None:
+        return True
+    return not result.get("screenshot") and (result.get("result") or "").startswith("❌")
+
+
+def _write_export_file(
+    file_path: str,
+    format_type: str,
+    export_results: list[tuple[str, dict]],
+    timestamp: int,
+) -> None:
+    """生成导出内容并写入文件
+
+    包含内容拼接和文件写入等阻塞操作，需通过 asyncio.to_thread 调用。
+    导出目录在插件启动时已创建。
+
+    Args:
+        file_path: 导出文件路径
+        format_type: 导出格式（小写：md、markdown、json、txt）
+        export_results: 导出数据列表，元素为 (URL, 分析结果字典)
+        timestamp: 导出时间戳
+    """
+    if format_type in ["md", "markdown"]:
+        # 生成Markdown格式内容
+        # 先收集片段再一次性拼接，避免循环中 += 造成的重复拷贝
+        parts: list[str] = [
+            "# 网页分析结果导出\n\n",
+            f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n\n",
+            f"共 {len(export_results)} 个分析结果\n\n",
+            "---\n\n",
+        ]
+
+        for i, (url, result_data) in enumerate(export_results, 1):
+            parts.append(f"## {i}. {url}\n\n")
+            parts.append(result_data["result"])
+            parts.append("\n\n---\n\n")
+
+        # 写入文件（逐段写出，不再额外拼接一份完整字符串）
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.writelines(parts)
+
+    elif format_type == "json":
+        # 生成JSON格式内容
+        json_data = {
+            "export_time": timestamp,
+            "export_time_str": time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(timestamp)
+            ),
+            "total_results": len(export_results),
+            "results": [],
+        }
+
+        for url, result_data in export_results:
+            json_data["results"].append(
+                {
+                    "url": url,
+                    "analysis_result": result_data["result"],
+                    "has_screenshot": result_data["screenshot"] is not None,
+                }
+            )
+
+        # 写入文件（优先使用 orjson，直接输出 UTF-8 字节）
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(json_data, f, ensure_ascii=False, indent=2)
+
+    elif format_type == "txt":
+        # 生成纯文本格式内容
+        parts = [
+            "网页分析结果导出\n",
+            f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n",
+            f"共 {len(export_results)} 个分析结果\n",
+            "=" * 50 + "\n\n",
+        ]
+
+        for i, (url, result_data) in enumerate(export_results, 1):
+            parts.append(f"{i}. {url}\n")
+            parts.append("-" * 30 + "\n")
+            parts.append(result_data["result"])
+            parts.append("\n\n" + "=" * 50 + "\n\n")
+
+        # 写入文件（逐段写出，不再额外拼接一份完整字符串）
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.writelines(parts)
+
+
 @register(
     "astrbot_plugin_web_analyzer",
     "Sakura520222",
@@ -49,9 +242,29 @@ class WebAnalyzerPlugin(Star):
         for key, value in config_dict.items():
             setattr(self, key, value)
 
+        # 规范化后的域名集合，域名检查直接使用
+        self._rebuild_domain_sets()
+
         # URL处理标志集合：用于避免重复处理同一URL
         self.processing_urls = set()
 
+        # 进行中的URL分析：URL -> 共享结果的 Future，用于合并并发请求
+        self._inflight_analyses: dict[str, asyncio.Future] = {}
+
+        # 会话LLM提供商ID缓存，与 LLM 分析器共用
+        self._provider_cache = ProviderIdCache(context)
+
+        # show_config 展示文本缓存，配置变更时置为 None
+        self._config_text_cache: str | None = None
+
+        # 群聊黑名单延迟保存状态
+        self._blacklist_dirty = False
+        self._blacklist_flush_task: asyncio.Task | None = None
+
+        # 插件数据目录（导出文件），启动时创建一次
+        self._data_dir = Path(__file__).parent / "data"
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+
         # 初始化核心组件
         self._init_components(context, config_dict)
 
@@ -109,6 +322,7 @@ class WebAnalyzerPlugin(Star):
             max_summary_length=self.max_summary_length,
             enable_emoji=self.enable_emoji,
             llm_enabled=self.llm_enabled,
+            provider_cache=self._provider_cache,
         )
 
         # 初始化消息处理器
@@ -165,7 +379,7 @@ class WebAnalyzerPlugin(Star):
             url
             for url in valid_urls
             if PluginHelpers.is_domain_allowed(
-                url, self.allowed_domains, self.blocked_domains
+                url, self._allowed_domain_set, self._blocked_domain_set
             )
         ]
         if not allowed_urls:
@@ -212,7 +426,7 @@ class WebAnalyzerPlugin(Star):
         # 检查是否启用了LLMTOOL模式，未启用则不执行
         if self.analysis_mode != "LLMTOOL":
             logger.info(f"当前未启用LLMTOOL模式，拒绝analyze_webpage_tool调用: {url}")
-            yield event.plain_result("当前未启用网页分析工具模式")
+            yield event.plain_result(_MSG_LLMTOOL_DISABLED)
             return
 
         logger.info(f"收到analyze_webpage_tool调用，原始URL: {url}")
@@ -238,7 +452,7 @@ class WebAnalyzerPlugin(Star):
 
         # 检查域名是否允许访问
         if not PluginHelpers.is_domain_allowed(
-            normalized_url, self.allowed_domains, self.blocked_domains
+            normalized_url, self._allowed_domain_set, self._blocked_domain_set
         ):
             error_msg = f"该域名不在允许访问的列表中: {normalized_url}"
             logger.warning(error_msg)
@@ -278,7 +492,7 @@ class WebAnalyzerPlugin(Star):
             logger.info(
                 f"当前未启用LLMTOOL模式，拒绝analyze_webpage_with_decision_tool调用: {url}"
             )
-            yield event.plain_result("当前未启用网页分析工具模式")
+            yield event.plain_result(_MSG_LLMTOOL_DISABLED)
             return
 
         # 检查是否启用了LLM自主决策功能
@@ -320,7 +534,7 @@ class WebAnalyzerPlugin(Star):
 
         # 检查域名是否允许访问
         if not PluginHelpers.is_domain_allowed(
-            normalized_url, self.allowed_domains, self.blocked_domains
+            normalized_url, self._allowed_domain_set, self._blocked_domain_set
         ):
             error_msg = f"该域名不在允许访问的列表中: {normalized_url}"
             logger.warning(error_msg)
@@ -372,7 +586,7 @@ class WebAnalyzerPlugin(Star):
             logger.info(
                 f"当前未启用LLMTOOL模式，拒绝analyze_batch_urls_tool调用: {urls}"
             )
-            yield event.plain_result("当前未启用网页分析工具模式")
+            yield event.plain_result(_MSG_LLMTOOL_DISABLED)
             return
 
         logger.info(
@@ -405,7 +619,7 @@ class WebAnalyzerPlugin(Star):
             if self.analyzer.is_valid_url(
                 normalized
             ) and PluginHelpers.is_domain_allowed(
-                normalized, self.allowed_domains, self.blocked_domains
+                normalized, self._allowed_domain_set, self._blocked_domain_set
             ):
                 valid_urls.append(normalized)
             else:
@@ -495,7 +709,7 @@ class WebAnalyzerPlugin(Star):
             url
             for url in valid_urls
             if PluginHelpers.is_domain_allowed(
-                url, self.allowed_domains, self.blocked_domains
+                url, self._allowed_domain_set, self._blocked_domain_set
             )
         ]
         if not allowed_urls:
@@ -591,80 +805,15 @@ class WebAnalyzerPlugin(Star):
     @filter.command("web_help", alias={"网页分析帮助", "网页分析命令"})
     async def show_help(self, event: AstrMessageEvent):
         """显示插件的所有可用命令和帮助信息"""
-        help_text = """【网页分析插件命令帮助】
-
-📋 核心分析命令
-🔍 /网页分析 <URL1> <URL2>... - 手动分析指定网页链接
-   别名：/分析, /总结, /web, /analyze
-   示例：/网页分析 https://example.com
-
-📋 配置管理命令
-🛠️ /web_config - 查看当前插件配置
-   别名：/网页分析配置, /网页分析设置
-   示例：/web_config
-
-📋 缓存管理命令
-🗑️ /web_cache [clear] - 管理分析结果缓存
-   别名：/网页缓存, /清理缓存
-   选项：
-     - clear: 清空所有缓存
-   示例：/web_cache clear
-
-📋 群聊管理命令
-👥 /group_blacklist [add/remove/clear] <群号> - 管理群聊黑名单
-   别名：/群黑名单, /黑名单
-   选项：
-     - (空): 查看当前黑名单
-     - add <群号>: 添加群聊到黑名单
-     - remove <群号>: 从黑名单移除群聊
-     - clear: 清空黑名单
-   示例：/群黑名单 add 123456789
-
-📋 导出功能命令
-📤 /web_export - 导出分析结果
-   别名：/导出分析结果, /网页导出
-   示例：/web_export
-
-📋 浏览器管理命令
-🌐 /web_browser [uninstall] - 管理 Playwright 浏览器
-   别名：/浏览器管理, /网页浏览器
-   选项：
-     - (空): 查看浏览器状态
-     - uninstall: 卸载浏览器
-   示例：/web_browser uninstall
-
-📋 测试功能命令
-📋 /test_merge - 测试合并转发功能
-   别名：/测试合并转发, /测试转发
-   示例：/test_merge
-
-📋 帮助命令
-❓ /web_help - 显示本帮助信息
-   别名：/网页分析帮助, /网页分析命令
-   示例：/web_help
-
-💡 使用提示：
-- 所有命令支持Tab补全（如果客户端支持）
-- 命令参数支持提示功能
-- 可以自定义命令别名
-
-🔧 配置提示：
-- 在AstrBot管理面板中可以配置插件的各项功能
-- 支持自定义命令别名
-- 可以调整分析结果模板和显示方式
-- 启用「允许LLM传播」后，自动分析URL不会阻止LLM回复原始消息
-"""
-
-        yield event.plain_result(help_text)
+        yield event.plain_result(_HELP_TEXT)
         logger.info("显示命令帮助信息")
 
     @filter.command("web_config", alias={"网页分析配置", "网页分析设置"})
     async def show_config(self, event: AstrMessageEvent):
         """显示当前插件的详细配置信息"""
-        config_info = f"""**网页分析插件配置信息**
-
-**基本设置**
-- 最大内容长度: {self.max_content_length} 字符
+        # 配置文本只在配置变更时失效，其余时间直接复用
+        if self._config_text_cache is None:
+            self._config_text_cache = f"""{_CONFIG_TEXT_HEADER}- 最大内容长度: {self.max_content_length} 字符
 - 请求超时时间: {self.request_timeout_s} 秒
 - LLM智能分析: {"✅ 已启用" if self.llm_enabled else "❌ 已禁用"}
 - 分析模式: {self.analysis_mode}
@@ -697,9 +846,9 @@ class WebAnalyzerPlugin(Star):
 - 缓存过期时间: {self.cache_expire_time_min} 分钟
 - 最大缓存数量: {self.max_cache_size} 个
 
-*提示: 如需修改配置，请在AstrBot管理面板中编辑插件配置*"""
+{_CONFIG_TEXT_FOOTER}"""
 
-        yield event.plain_result(config_info)
+        yield event.plain_result(self._config_text_cache)
 
     @filter.command("test_merge", alias={"测试合并转发", "测试转发"})
     async def test_merge_forward(self, event: AstrMessageEvent):
@@ -747,16 +896,16 @@ class WebAnalyzerPlugin(Star):
     async def manage_group_blacklist(self, event: AstrMessageEvent):
         """管理群聊黑名单"""
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=3)
 
         # 如果没有参数，显示当前黑名单列表
         if len(message_parts) <= 1:
             if not self.group_blacklist:
-                yield event.plain_result("当前群聊黑名单为空")
+                yield event.plain_result(_MSG_BLACKLIST_EMPTY)
                 return
 
             blacklist_info = "**当前群聊黑名单**\n\n"
-            for i, group_id in enumerate(self.group_blacklist, 1):
+            for i, group_id in enumerate(sorted(self.group_blacklist), 1):
                 blacklist_info += f"{i}. {group_id}\n"
 
             blacklist_info += "\n使用 `/group_blacklist add <群号>` 添加群聊到黑名单"
@@ -767,7 +916,7 @@ class WebAnalyzerPlugin(Star):
             return
 
         # 解析操作类型和参数
-        action = message_parts[1].lower() if len(message_parts) > 1 else ""
+        action = message_parts[1].lower()
         group_id = message_parts[2] if len(message_parts) > 2 else ""
 
         # 添加群聊到黑名单
@@ -776,7 +925,7 @@ class WebAnalyzerPlugin(Star):
                 yield event.plain_result(f"群聊 {group_id} 已在黑名单中")
                 return
 
-            self.group_blacklist.append(group_id)
+            self.group_blacklist.add(group_id)
             self._save_group_blacklist()
             yield event.plain_result(f"✅ 已添加群聊 {group_id} 到黑名单")
 
@@ -786,14 +935,14 @@ class WebAnalyzerPlugin(Star):
                 yield event.plain_result(f"群聊 {group_id} 不在黑名单中")
                 return
 
-            self.group_blacklist.remove(group_id)
+            self.group_blacklist.discard(group_id)
             self._save_group_blacklist()
             yield event.plain_result(f"✅ 已从黑名单移除群聊 {group_id}")
 
         # 清空黑名单
         elif action == "clear":
             if not self.group_blacklist:
-                yield event.plain_result("黑名单已为空")
+                yield event.plain_result(_MSG_BLACKLIST_ALREADY_EMPTY)
                 return
 
             self.group_blacklist.clear()
@@ -807,26 +956,100 @@ class WebAnalyzerPlugin(Star):
             )
 
     def _save_group_blacklist(self):
-        """保存群聊黑名单到配置文件"""
+        """标记群聊黑名单待保存，由后台任务合并写入配置文件
+
+        连续的多次修改只会触发一次写盘，避免在事件循环上同步刷新整个配置。
+        """
+        self._blacklist_dirty = True
+        self._config_text_cache = None
+        if self._blacklist_flush_task is None or self._blacklist_flush_task.done():
+            try:
+                self._blacklist_flush_task = asyncio.create_task(
+                    self._delayed_flush_group_blacklist()
+                )
+            except RuntimeError:
+                # 没有运行的事件循环，直接同步保存
+                self._blacklist_dirty = False
+                try:
+                    self._write_group_blacklist_config()
+                    self.config.save_config()
+                except Exception as e:
+                    logger.error(f"保存群聊黑名单失败: {e}")
+
+    async def _delayed_flush_group_blacklist(self):
+        """等待修改平息后保存群聊黑名单，写盘期间的新修改会触发下一轮保存"""
+        while self._blacklist_dirty:
+            await asyncio.sleep(_BLACKLIST_FLUSH_DELAY_S)
+            self._blacklist_dirty = False
+            try:
+                # 在事件循环中写回配置对象，序列化与写盘放到线程中执行
+                self._write_group_blacklist_config()
+                await asyncio.to_thread(self.config.save_config)
+            except Exception as e:
+                logger.error(f"保存群聊黑名单失败: {e}")
+
+    def _write_group_blacklist_config(self):
+        """将当前群聊黑名单写回配置对象（不落盘）
+
+        按配置的格式写入加载时读取的位置：新格式为 消息管理/群聊设置，
+        旧格式为 group_settings。
+        """
+        # 将群聊列表转换为文本格式，每行一个群聊ID
+        blacklist_text = "\n".join(sorted(self.group_blacklist))
+        if ConfigLoader.is_new_format(self.config):
+            self._set_nested_config(
+                ["消息管理", "群聊设置", "group_blacklist"], blacklist_text
+            )
+            return
+        group_settings = self.config.get("group_settings", {})
+        group_settings["group_blacklist"] = blacklist_text
+        self.config["group_settings"] = group_settings
+
+    async def _analyze_url(self, event: AstrMessageEvent, url: str) -> dict:
+        """分析单个URL，同一URL的并发分析会被合并
+
+        批量分析与导出共用此入口，结果格式与 MessageHandler.process_single_url
+        一致；若该URL已有进行中的分析，则等待其结果而不重复抓取和调用LLM，
+        进行中的分析失败（抛出异常或返回错误结果）时，等待者会自行重新分析。
+
+        Args:
+            event: 消息事件对象
+            url: 规范化后的网页URL
+
+        Returns:
+            分析结果字典，失败时 result 为以 '❌' 开头的错误消息
+        """
+        while (fut := self._inflight_analyses.get(url)) is not None:
+            # shield 避免某个等待者被取消时连带取消共享的 Future
+            result = await asyncio.shield(fut)
+            if not _is_failed_result(result):
+                return result
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight_analyses[url] = fut
+        result = None
         try:
-            # 将群聊列表转换为文本格式，每行一个群聊ID
-            group_text = "\n".join(self.group_blacklist)
-            # 获取当前group_settings配置
-            group_settings = self.config.get("group_settings", {})
-            # 更新group_blacklist
-            group_settings["group_blacklist"] = group_text
-            # 更新配置并保存到文件
-            self.config["group_settings"] = group_settings
-            self.config.save_config()
-        except Exception as e:
-            logger.error(f"保存群聊黑名单失败: {e}")
+            result = await self.message_handler.process_single_url(
+                event=event,
+                url=url,
+                analyzer=self.analyzer,
+                llm_analyzer=(self.llm_analyzer if self.llm_enabled else None),
+                enable_translation=self.enable_translation,
+                enable_specific_extraction=self.enable_specific_extraction,
+                extract_types=self.extract_types,
+                result_formatter=self.result_formatter,
+            )
+            return result
+        finally:
+            fut.set_result(result)
+            self._inflight_analyses.pop(url, None)
 
     @filter.permission_type(filter.PermissionType.ADMIN)
     @filter.command("web_cache", alias={"网页缓存", "清理缓存"})
     async def manage_cache(self, event: AstrMessageEvent):
         """管理插件的网页分析结果缓存"""
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=2)
 
         # 如果没有参数，显示当前缓存状态
         if len(message_parts) <= 1:
@@ -867,7 +1090,7 @@ class WebAnalyzerPlugin(Star):
     async def manage_analysis_mode(self, event: AstrMessageEvent):
         """管理插件的网页分析模式"""
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=2)
 
         # 如果没有参数，显示当前模式
         if len(message_parts) <= 1:
@@ -888,17 +1111,19 @@ class WebAnalyzerPlugin(Star):
             return
 
         # 解析模式参数
-        mode = message_parts[1].lower() if len(message_parts) > 1 else ""
-        valid_modes = ["auto", "manual", "hybrid", "LLMTOOL"]
+        mode = message_parts[1].lower()
 
         # 验证模式是否有效
-        if mode not in valid_modes:
-            yield event.plain_result(f"无效的模式，请使用: {', '.join(valid_modes)}")
+        if mode not in _VALID_MODES:
+            yield event.plain_result(
+                f"无效的模式，请使用: {', '.join(_VALID_MODES_DISPLAY)}"
+            )
             return
 
         # 更新分析模式
         self.analysis_mode = mode
         self.auto_analyze = mode == "auto"
+        self._config_text_cache = None
 
         # 保存配置
         try:
@@ -920,7 +1145,7 @@ class WebAnalyzerPlugin(Star):
         支持查看浏览器状态、卸载浏览器等操作。
         """
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=2)
 
         # 如果没有参数，显示浏览器状态
         if len(message_parts) <= 1:
@@ -974,18 +1199,12 @@ class WebAnalyzerPlugin(Star):
     @filter.command("web_export", alias={"导出分析结果", "网页导出"})
     async def export_analysis_result(self, event: AstrMessageEvent):
         """导出网页分析结果"""
-        import json
-        import os
-        import time
-
         # 解析命令参数
-        message_parts = event.message_str.strip().split()
+        message_parts = event.message_str.strip().split(maxsplit=3)
 
         # 检查参数是否足够
         if len(message_parts) < 2:
-            yield event.plain_result(
-                "请提供要导出的URL链接和格式，例如：/web_export https://example.com md 或 /web_export all json"
-            )
+            yield event.plain_result(_MSG_EXPORT_USAGE)
             return
 
         # 获取导出范围和格式
@@ -993,106 +1212,63 @@ class WebAnalyzerPlugin(Star):
         format_type = message_parts[2] if len(message_parts) > 2 else "md"
 
         # 验证格式类型是否支持
-        supported_formats = ["md", "markdown", "json", "txt"]
-        if format_type.lower() not in supported_formats:
+        if format_type.lower() not in _SUPPORTED_FORMATS:
             yield event.plain_result(
-                f"不支持的格式类型，请使用：{', '.join(supported_formats)}"
+                f"不支持的格式类型，请使用：{', '.join(_SUPPORTED_FORMATS_DISPLAY)}"
             )
             return
 
-        # 准备导出数据
-        export_results = []
+        # 准备导出数据：(URL, 分析结果字典) 列表
+        export_results: list[tuple[str, dict]] = []
 
         if url_or_all.lower() == "all":
             # 导出所有缓存的分析结果
             if not self.cache_manager.memory_cache:
-                yield event.plain_result("当前没有缓存的分析结果")
+                yield event.plain_result(_MSG_NO_CACHED_RESULTS)
                 return
 
-            for url, cache_data in self.cache_manager.memory_cache.items():
-                export_results.append({"url": url, "result": cache_data["result"]})
+            # 在事件循环中一次性取快照（仅保存引用，不构造中间字典），
+            # 写文件线程中不再访问可能被并发修改的缓存字典
+            export_results = [
+                (url, cache_data["result"])
+                for url, cache_data in self.cache_manager.memory_cache.items()
+            ]
         else:
             # 导出指定URL的分析结果
-            url = url_or_all
-
             # 检查URL格式是否有效
-            if not self.analyzer.is_valid_url(url):
-                yield event.plain_result("无效的URL链接")
+            if not self.analyzer.is_valid_url(url_or_all):
+                yield event.plain_result(_MSG_INVALID_URL)
                 return
 
+            # 与批量分析使用同一规范化URL，才能合并同一网页的并发分析
+            url = self.analyzer.normalize_url(url_or_all)
+
             # 检查缓存中是否已有该URL的分析结果
             cached_result = self.message_handler.check_cache(url)
             if cached_result:
-                export_results.append({"url": url, "result": cached_result})
+                export_results.append((url, cached_result))
             else:
                 # 如果缓存中没有，先进行分析
                 yield event.plain_result("缓存中没有该URL的分析结果，正在进行分析...")
 
-                # 抓取并分析网页
-                async with self.analyzer as analyzer:
-                    html = await analyzer.fetch_webpage(url)
-                    if not html:
-                        yield event.plain_result(f"无法抓取网页内容: {url}")
-                        return
-
-                    content_data = analyzer.extract_content(html, url)
-                    if not content_data:
-                        yield event.plain_result(f"无法解析网页内容: {url}")
-                        return
-
-                    # 调用LLM进行分析
-                    if self.enable_translation:
-                        translated_content = await self._translate_content(
-                            event, content_data["content"]
-                        )
-                        translated_content_data = content_data.copy()
-                        translated_content_data["content"] = translated_content
-                        analysis_result = await self.llm_analyzer.analyze_with_llm(
-                            event, translated_content_data
-                        )
-                    else:
-                        analysis_result = await self.llm_analyzer.analyze_with_llm(
-                            event, content_data
-                        )
-
-                    # 提取特定内容（如果启用）
-                    if self.enable_specific_extraction:
-                        specific_content = analyzer.extract_specific_content(
-                            html, url, self.extract_types
-                        )
-                        if specific_content:
-                            # 在分析结果中添加特定内容
-                            analysis_result = self._add_specific_content_to_result(
-                                analysis_result, specific_content
-                            )
-
-                    # 准备导出数据
-                    export_results.append(
-                        {
-                            "url": url,
-                            "result": {
-                                "url": url,
-                                "result": analysis_result,
-                                "screenshot": None,
-                            },
-                        }
-                    )
+                # 抓取并分析网页（同一URL的并发分析会被合并）
+                result_data = await self._analyze_url(event, url)
+                if _is_failed_result(result_data):
+                    yield event.plain_result(result_data["result"])
+                    return
+
+                # 准备导出数据
+                export_results.append((url, result_data))
 
         # 执行导出操作
         try:
-            # 创建data目录（如果不存在）
-            data_dir = os.path.join(os.path.dirname(__file__), "data")
-            os.makedirs(data_dir, exist_ok=True)
-
             # 生成文件名
             timestamp = int(time.time())
             if len(export_results) == 1:
                 # 单个URL导出，使用域名作为文件名的一部分
-                url_obj = export_results[0]["url"]
-                from urllib.parse import urlparse
-
+                url_obj = export_results[0][0]
                 parsed = urlparse(url_obj)
-                domain = parsed.netloc.replace(".", "_")
+                domain = parsed.netloc.translate(_DOMAIN_TRANS)
                 filename = f"web_analysis_{domain}_{timestamp}"
             else:
                 # 多个URL导出
@@ -1103,75 +1279,16 @@ class WebAnalyzerPlugin(Star):
             if file_extension == "markdown":
                 file_extension = "md"
 
-            file_path = os.path.join(data_dir, f"{filename}.{file_extension}")
-
-            if format_type.lower() in ["md", "markdown"]:
-                # 生成Markdown格式内容
-                md_content = "# 网页分析结果导出\n\n"
-                md_content += f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n\n"
-                md_content += f"共 {len(export_results)} 个分析结果\n\n"
-                md_content += "---\n\n"
-
-                for i, export_item in enumerate(export_results, 1):
-                    url = export_item["url"]
-                    result_data = export_item["result"]
-
-                    md_content += f"## {i}. {url}\n\n"
-                    md_content += result_data["result"]
-                    md_content += "\n\n"
-                    md_content += "---\n\n"
-
-                # 写入文件
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(md_content)
-
-            elif format_type.lower() == "json":
-                # 生成JSON格式内容
-                json_data = {
-                    "export_time": timestamp,
-                    "export_time_str": time.strftime(
-                        "%Y-%m-%d %H:%M:%S", time.localtime(timestamp)
-                    ),
-                    "total_results": len(export_results),
-                    "results": [],
-                }
-
-                for export_item in export_results:
-                    url = export_item["url"]
-                    result_data = export_item["result"]
+            file_path = str(self._data_dir / f"{filename}.{file_extension}")
 
-                    json_data["results"].append(
-                        {
-                            "url": url,
-                            "analysis_result": result_data["result"],
-                            "has_screenshot": result_data["screenshot"] is not None,
-                        }
-                    )
-
-                # 写入文件
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(json_data, f, ensure_ascii=False, indent=2)
-
-            elif format_type.lower() == "txt":
-                # 生成纯文本格式内容
-                txt_content = "网页分析结果导出\n"
-                txt_content += f"导出时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))}\n"
-                txt_content += f"共 {len(export_results)} 个分析结果\n"
-                txt_content += "=" * 50 + "\n\n"
-
-                for i, export_item in enumerate(export_results, 1):
-                    url = export_item["url"]
-                    result_data = export_item["result"]
-
-                    txt_content += f"{i}. {url}\n"
-                    txt_content += "-" * 30 + "\n"
-                    txt_content += result_data["result"]
-                    txt_content += "\n\n"
-                    txt_content += "=" * 50 + "\n\n"
-
-                # 写入文件
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(txt_content)
+            # 生成内容与写入文件均为阻塞操作，放到线程中执行，避免阻塞事件循环
+            await asyncio.to_thread(
+                _write_export_file,
+                file_path,
+                format_type.lower(),
+                export_results,
+                timestamp,
+            )
 
             # 发送导出成功消息，并附带导出文件
             # 构建消息链
@@ -1193,205 +1310,6 @@ class WebAnalyzerPlugin(Star):
             logger.error(f"导出分析结果失败: {e}")
             yield event.plain_result(f"❌ 导出分析结果失败: {str(e)}")
 
-    async def _translate_content(self, event: AstrMessageEvent, content: str) -> str:
-        """翻译网页内容
-
-        Args:
-            event: 消息事件对象
-            content: 要翻译的内容
-
-        Returns:
-            翻译后的内容
-        """
-        if not self.enable_translation:
-            return content
-
-        try:
-            # 检查LLM是否可用
-            if not hasattr(self.context, "llm_generate"):
-                logger.error("LLM不可用，无法进行翻译")
-                return content
-
-            # 优先使用配置的LLM提供商，如果没有配置则使用当前会话的模型
-            provider_id = self.llm_provider
-            if not provider_id:
-                umo = event.unified_msg_origin
-                provider_id = await self.context.get_current_chat_provider_id(umo=umo)
-
-            if not provider_id:
-                logger.error("无法获取LLM提供商ID，无法进行翻译")
-                return content
-
-            # 使用自定义翻译提示词或默认提示词
-            if self.custom_translation_prompt:
-                # 替换自定义提示词中的变量
-                # 对用户可控内容进行花括号转义，防止 format() 异常
-                safe_content = WebAnalyzerUtils.escape_format_braces(content)
-                prompt = self.custom_translation_prompt.format(
-                    content=safe_content, target_language=self.target_language
-                )
-            else:
-                # 默认翻译提示词
-                prompt = (
-                    f"请将以下内容翻译成{self.target_language}语言，"
-                    f"保持原文意思不变，语言流畅自然：\n\n{content}"
-                )
-
-            # 调用LLM进行翻译
-            llm_resp = await self.context.llm_generate(
-                chat_provider_id=provider_id, prompt=prompt
-            )
-
-            if llm_resp and llm_resp.completion_text:
-                return llm_resp.completion_text.strip()
-            else:
-                logger.error("LLM翻译返回为空")
-                return content
-        except Exception as e:
-            logger.error(f"翻译内容失败: {e}")
-            return content
-
-    def _add_specific_content_to_result(
-        self, analysis_result: str, specific_content: dict
-    ) -> str:
-        """将特定内容添加到分析结果中
-
-        Args:
-            analysis_result: 当前的分析结果
-            specific_content: 特定内容字典
-
-        Returns:
-            更新后的分析结果
-        """
-        try:
-            # 在分析结果中添加特定内容
-            specific_content_str = "\n\n**特定内容提取**\n"
-
-            # 添加图片链接（如果有）
-            if "images" in specific_content and specific_content["images"]:
-                specific_content_str += (
-                    f"\n📷 图片链接 ({len(specific_content['images'])}):\n"
-                )
-                for img in specific_content["images"]:
-                    img_url = img.get("url", "")
-                    alt_text = img.get("alt", "")
-                    if alt_text:
-                        specific_content_str += f"- {img_url} (alt: {alt_text})\n"
-                    else:
-                        specific_content_str += f"- {img_url}\n"
-
-            # 添加相关链接（如果有）
-            if "links" in specific_content and specific_content["links"]:
-                specific_content_str += (
-                    f"\n🔗 相关链接 ({len(specific_content['links'])}):\n"
-                )
-                for link in specific_content["links"][:5]:
-                    specific_content_str += f"- [{link['text']}]({link['url']})\n"
-
-            # 添加视频链接（如果有）
-            if "videos" in specific_content and specific_content["videos"]:
-                specific_content_str += (
-                    f"\n🎬 视频链接 ({len(specific_content['videos'])}):\n"
-                )
-                for video in specific_content["videos"]:
-                    video_url = video.get("url", "")
-                    video_type = video.get("type", "video")
-                    specific_content_str += f"- {video_url} (type: {video_type})\n"
-
-            # 添加音频链接（如果有）
-            if "audios" in specific_content and specific_content["audios"]:
-                specific_content_str += (
-                    f"\n🎵 音频链接 ({len(specific_content['audios'])}):\n"
-                )
-                for audio in specific_content["audios"]:
-                    specific_content_str += f"- {audio}\n"
-
-            # 添加引用块（如果有）
-            if "quotes" in specific_content and specific_content["quotes"]:
-                specific_content_str += (
-                    f"\n💬 引用块 ({len(specific_content['quotes'])}):\n"
-                )
-                for quote in specific_content["quotes"][:3]:
-                    quote_text = quote.get("text", "")
-                    author = quote.get("author", "")
-                    if author:
-                        specific_content_str += f"> {quote_text} — {author}\n\n"
-                    else:
-                        specific_content_str += f"> {quote_text}\n\n"
-
-            # 添加标题列表（如果有）
-            if "headings" in specific_content and specific_content["headings"]:
-                specific_content_str += (
-                    f"\n📑 标题列表 ({len(specific_content['headings'])}):\n"
-                )
-                for heading in specific_content["headings"]:
-                    level = heading.get("level", 1)
-                    text = heading.get("text", "")
-                    heading_id = heading.get("id", "")
-                    indent = "  " * (level - 1)
-                    if heading_id:
-                        specific_content_str += (
-                            f"{indent}#{level} {text} (id: {heading_id})\n"
-                        )
-                    else:
-                        specific_content_str += f"{indent}#{level} {text}\n"
-
-            # 添加代码块（如果有）
-            if "code_blocks" in specific_content and specific_content["code_blocks"]:
-                specific_content_str += (
-                    f"\n💻 代码块 ({len(specific_content['code_blocks'])}):\n"
-                )
-                for code_block in specific_content["code_blocks"][:2]:
-                    code = code_block.get("code", "")
-                    language = code_block.get("language", "")
-                    specific_content_str += f"``` {language}\n{code}\n```\n"
-
-            # 添加表格（如果有）
-            if "tables" in specific_content and specific_content["tables"]:
-                specific_content_str += (
-                    f"\n📊 表格 ({len(specific_content['tables'])}):\n"
-                )
-                for table in specific_content["tables"][:2]:
-                    headers = table.get("headers", [])
-                    rows = table.get("rows", [])
-                    specific_content_str += "\n表格:\n"
-                    if headers:
-                        specific_content_str += (
-                            f"| {' | '.join(headers)} |\n"
-                            f"| {' | '.join(['---' for _ in headers])} |\n"
-                        )
-                    for row in rows:
-                        specific_content_str += f"| {' | '.join(row)} |\n"
-
-            # 添加列表（如果有）
-            if "lists" in specific_content and specific_content["lists"]:
-                specific_content_str += (
-                    f"\n📋 列表 ({len(specific_content['lists'])}):\n"
-                )
-                for list_item in specific_content["lists"][:2]:
-                    list_type = list_item.get("type", "ul")
-                    items = list_item.get("items", [])
-                    specific_content_str += f"\n列表 ({list_type}):\n"
-                    for item in items:
-                        if list_type == "ol":
-                            specific_content_str += f"1. {item}\n"
-                        else:
-                            specific_content_str += f"- {item}\n"
-
-            # 添加元信息（如果有）
-            if "meta" in specific_content and specific_content["meta"]:
-                meta_info = specific_content["meta"]
-                specific_content_str += "\n📋 元信息:\n"
-                for key, value in meta_info.items():
-                    if value:
-                        specific_content_str += f"- {key}: {value}\n"
-
-            # 将特定内容添加到分析结果中
-            return analysis_result + specific_content_str
-        except Exception as e:
-            logger.warning(f"添加特定内容失败: {e}")
-            return analysis_result
-
     async def _batch_process_urls(
         self,
         event: AstrMessageEvent,
@@ -1402,38 +1320,31 @@ class WebAnalyzerPlugin(Star):
         """批量处理多个URL"""
         results = []
 
-        for url in urls:
-            try:
-                # 标记URL正在处理中
-                self.processing_urls.add(url)
-
-                # 使用消息处理器处理单个URL
-                result = await self.message_handler.process_single_url(
-                    event=event,
-                    url=url,
-                    analyzer=self.analyzer,
-                    llm_analyzer=self.llm_analyzer if self.llm_enabled else None,
-                    enable_translation=self.enable_translation,
-                    enable_specific_extraction=self.enable_specific_extraction,
-                    extract_types=self.extract_types,
-                    result_formatter=self.result_formatter,
-                )
-                results.append(result)
-
-            except Exception as e:
-                error_type = PluginHelpers.get_error_type(e)
-                error_msg = PluginHelpers.handle_error(error_type, e, url)
-                results.append(
-                    {
-                        "url": url,
-                        "result": error_msg,
-                        "screenshot": None,
-                        "has_screenshot": False,
-                    }
-                )
-            finally:
-                # 确保在任何情况下都从处理中集合移除URL
-                self.processing_urls.discard(url)
+        # 整个批次共用一个 HTTP 客户端，各 URL 之间复用连接
+        async with self.analyzer:
+            for url in urls:
+                try:
+                    # 标记URL正在处理中
+                    self.processing_urls.add(url)
+
+                    # 使用消息处理器处理单个URL
+                    result = await self._analyze_url(event, url)
+                    results.append(result)
+
+                except Exception as e:
+                    error_type = PluginHelpers.get_error_type(e)
+                    error_msg = PluginHelpers.handle_error(error_type, e, url)
+                    results.append(
+                        {
+                            "url": url,
+                            "result": error_msg,
+                            "screenshot": None,
+                            "has_screenshot": False,
+                        }
+                    )
+                finally:
+                    # 确保在任何情况下都从处理中集合移除URL
+                    self.processing_urls.discard(url)
 
         # 发送所有分析结果
         if results:
@@ -1620,8 +1531,19 @@ class WebAnalyzerPlugin(Star):
         self._save_domain_config()
         return jsonify({"message": f"域名统一处理已{'启用' if enabled else '禁用'}"})
 
+    def _rebuild_domain_sets(self):
+        """根据域名列表重建规范化的允许/禁止域名集合"""
+        self._allowed_domain_set = WebAnalyzerUtils.normalize_domain_set(
+            self.allowed_domains
+        )
+        self._blocked_domain_set = WebAnalyzerUtils.normalize_domain_set(
+            self.blocked_domains
+        )
+
     def _save_domain_config(self):
         """保存域名配置到配置文件"""
+        self._rebuild_domain_sets()
+        self._config_text_cache = None
         try:
             domain_config = self.config.get("domain_management", {})
             domain_config["enable_unified_domain"] = self.enable_unified_domain
@@ -1636,7 +1558,7 @@ class WebAnalyzerPlugin(Star):
         """获取群聊黑名单"""
         from quart import jsonify
 
-        return jsonify({"group_blacklist": list(self.group_blacklist)})
+        return jsonify({"group_blacklist": sorted(self.group_blacklist)})
 
     async def _api_groups_add(self):
         """添加群聊到黑名单"""
@@ -1648,7 +1570,7 @@ class WebAnalyzerPlugin(Star):
             return jsonify({"error": "缺少 group_id 参数"}), 400
         if group_id in self.group_blacklist:
             return jsonify({"message": f"群聊 {group_id} 已在黑名单中"})
-        self.group_blacklist.append(group_id)
+        self.group_blacklist.add(group_id)
         self._save_group_blacklist()
         return jsonify({"message": f"已添加群聊 {group_id} 到黑名单"})
 
@@ -1662,7 +1584,7 @@ class WebAnalyzerPlugin(Star):
             return jsonify({"error": "缺少 group_id 参数"}), 400
         if group_id not in self.group_blacklist:
             return jsonify({"message": f"群聊 {group_id} 不在黑名单中"})
-        self.group_blacklist.remove(group_id)
+        self.group_blacklist.discard(group_id)
         self._save_group_blacklist()
         return jsonify({"message": f"已从黑名单移除群聊 {group_id}"})
 
@@ -1814,8 +1736,10 @@ class WebAnalyzerPlugin(Star):
         if current_value is None and "default" in schema_item:
             current_value = schema_item["default"]
 
-        # 列表值转换为换行分隔的文本，便于编辑
-        if isinstance(current_value, list):
+        # 列表/集合值转换为换行分隔的文本，便于编辑
+        if isinstance(current_value, (set, frozenset)):
+            current_value = "\n".join(sorted(str(v) for v in current_value))
+        elif isinstance(current_value, list):
             current_value = "\n".join(str(v) for v in current_value)
 
         field = {
@@ -1864,18 +1788,25 @@ class WebAnalyzerPlugin(Star):
                     new_value = int(new_value)
                 elif isinstance(old_value, float):
                     new_value = float(new_value)
-                elif isinstance(old_value, list):
+                elif isinstance(old_value, (list, set)):
                     # 换行分隔的文本转回列表
                     if isinstance(new_value, str):
                         new_value = [
                             v.strip() for v in new_value.split("\n") if v.strip()
                         ]
 
-                # 更新实例属性
-                setattr(self, attr_name, new_value)
+                # 更新实例属性（集合类型属性保持为集合，配置与响应中仍使用列表）
+                if isinstance(old_value, set):
+                    setattr(self, attr_name, set(new_value))
+                    old_value = sorted(old_value)
+                else:
+                    setattr(self, attr_name, new_value)
 
                 # 更新 config 对象中的值
                 self._set_nested_config(path_parts, new_value)
+                self._config_text_cache = None
+                if attr_name in ("allowed_domains", "blocked_domains"):
+                    self._rebuild_domain_sets()
 
                 applied.append({
                     "path": path_str,
@@ -1937,4 +1868,21 @@ class WebAnalyzerPlugin(Star):
 
     async def terminate(self):
         """插件卸载时的清理工作"""
+        # 取消延迟保存任务，并立即落盘尚未保存的黑名单修改
+        if self._blacklist_flush_task and not self._blacklist_flush_task.done():
+            self._blacklist_flush_task.cancel()
+        if self._blacklist_dirty:
+            self._blacklist_dirty = False
+            try:
+                self._write_group_blacklist_config()
+                self.config.save_config()
+            except Exception as e:
+                logger.error(f"保存群聊黑名单失败: {e}")
+        # 取消尚未完成的LLM提供商ID后台刷新
+        self._provider_cache.cancel_refreshes()
+        # 关闭网页分析器长期复用的 HTTP 客户端
+        try:
+            await self.analyzer.close()
+        except Exception as e:
+            logger.error(f"关闭 HTTP 客户端失败: {e}")
         logger.info("网页分析插件已卸载")